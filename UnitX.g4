@@ -143,30 +143,63 @@ endRep
 	: expression
 	;
 
+/*
+ * Expressions are tiers from the lowest precedence to the highest one.
+ * A binary tier is a flat loop, so a long line such as "a + b + c + d"
+ * becomes one node with many children instead of a deep left-recursive chain.
+ */
 expression
-	: primary
-	| expression '(' expressionList? ')'
-	| expression ('*'|'/'|'%') expression
-	| expression ('+'|'-') expression
-	| expression ('<='|'>='|'>'|'<') expression // Not yet
-	| expression ('=='|'!='|'is') expression
-    | expression
-		( '='
-		| '+='
-		| '-='
-		| '*='
-		| '/='
-		| '%='
-		) expression
-	| expression // Not yet
-		( '&&'
-		| '||'
-		| 'and'
-		| 'or'
-		) expression
-	| ('++'|'--') expression
-	| ('!'|'not') expression //Not yet
-	| 'not' expression //Not yet
+	: assignmentExpression
+	;
+
+assignmentExpression
+	: logicalExpression
+		(
+			( '='
+			| '+='
+			| '-='
+			| '*='
+			| '/='
+			| '%='
+			) assignmentExpression
+		)?
+	;
+
+logicalExpression // Not yet
+	: equalityExpression
+		(
+			( '&&'
+			| '||'
+			| 'and'
+			| 'or'
+			) equalityExpression
+		)*
+	;
+
+equalityExpression
+	: relationalExpression (('=='|'!='|'is') relationalExpression)*
+	;
+
+relationalExpression // Not yet
+	: additiveExpression (('<='|'>='|'>'|'<') additiveExpression)*
+	;
+
+additiveExpression
+	: multiplicativeExpression (('+'|'-') multiplicativeExpression)*
+	;
+
+multiplicativeExpression
+	: unaryExpression (('*'|'/'|'%') unaryExpression)*
+	;
+
+unaryExpression
+	: ('++'|'--') unaryExpression
+	| ('!'|'not') unaryExpression //Not yet
+	| callExpression
+	;
+
+callExpression
+	: primary ('(' expressionList? ')')*
 	;
 
 /*
@@ -189,8 +222,13 @@ unitSingleOrPairOperator
 	;
 
 unitOperator
+	: unitToken
+	| unitToken '->' unitToken
+	;
+
+unitToken
 	: Identifier
-	| Identifier '->' Identifier
+	| DECIMAL_INTEGER // For bases such as {10->16}
 	;
 
 primary
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+
+import sys
+from antlr4.ParserRuleContext import ParserRuleContext
+from UnitXParser import UnitXParser
+from constants import Constants
+
+class CollapsingParser(UnitXParser):
+    """A UnitXParser removing tiers of expressions which have only one operand.
+
+    The grammar has a tier for each precedence (assignment, logical, equality,
+    relational, additive, multiplicative, unary and call), so a lone operand
+    such as 5 in "x = 5" passes through all tiers down to its primary.
+    A tier with one child is replaced by the child in its parent
+    as soon as the rule exits, so the tree keeps only tiers with operators,
+    and the removed contexts are freed while the code is parsed.
+    ExpressionContext is kept, because statements refer to it.
+
+    A tier with one child evaluates to the child, and every pass skips
+    such a tier (e.g. EvalVisitor), so the collapsed tree is executed as before.
+    The rule exit is overridden instead of adding a parse listener,
+    because Parser.reset of this runtime fails when a parse listener exists.
+    PrattParser collapses the same tiers to build the same trees.
+    """
+
+    TIER_CONTEXTS = (
+        UnitXParser.AssignmentExpressionContext,
+        UnitXParser.LogicalExpressionContext,
+        UnitXParser.EqualityExpressionContext,
+        UnitXParser.RelationalExpressionContext,
+        UnitXParser.AdditiveExpressionContext,
+        UnitXParser.MultiplicativeExpressionContext,
+        UnitXParser.UnaryExpressionContext,
+        UnitXParser.CallExpressionContext,
+    )
+
+    def exitRule(self):
+        ctx = self._ctx
+        super(CollapsingParser, self).exitRule()
+        CollapsingParser.collapse(ctx)
+
+
+    @classmethod
+    def collapse(cls, ctx):
+        """Replaces a tier with one child by the child in its parent, which is the last child of the parent.
+
+        Args:
+            ctx: An instance of ParserRuleContext which just exits.
+        """
+        if not isinstance(ctx, cls.TIER_CONTEXTS) or ctx.getChildCount() != 1: return
+        a_child, parent = ctx.children[0], ctx.parentCtx
+        if parent is None or not isinstance(a_child, ParserRuleContext) or ctx.exception is not None: return
+        parent.children[-1] = a_child
+        a_child.parentCtx = parent
+        return
+
+
+def main():
+    """Run an example for a CollapsingParser class."""
+    from antlr4.InputStream import InputStream
+    from antlr4.CommonTokenStream import CommonTokenStream
+    from UnitXLexer import UnitXLexer
+
+    code = u'x = 5{km}\ny = x + 3{m} * 2\n'
+    for a_class in [UnitXParser, CollapsingParser]:
+        parser = a_class(CommonTokenStream(UnitXLexer(InputStream(code))))
+        print parser.program().toStringTree(recog=parser)
+
+    return Constants.EXIT_SUCCESS
+
+
+if __name__ == '__main__':
+    sys.exit(main())
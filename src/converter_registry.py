@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+
+import sys
+from constants import Constants
+
+class ConverterRegistry(object):
+    """A registry of converters referenced by name from the unit table.
+
+    Converters are Python functions registered by UnitLib or by plugins,
+    and a unit table binds them by name once when it's loaded.
+    There are two kinds of converters.
+
+        A value converter: converter(value, unit) returns a converted value.
+            It's used by a group such as "2 8 10 16 -> base".
+        A criterion converter: converter(unit_str, as_of) returns a criterion of a unit.
+            It's used by a group such as "USD JPY -> rate".
+            as_of is None for the latest criterion, or a pair of a RateHistory
+            and a date selected by asof() of an interpreter.
+
+    Attributes:
+        __converters: A dict from a name to a value converter.
+        __criterions: A dict from a name to a criterion converter.
+    """
+
+    __converters = {}
+    __criterions = {}
+
+    @classmethod
+    def register(cls, name, converter):
+        """Registers a value converter.
+
+        Args:
+            name: A string referenced from the unit table.
+            converter: A function receiving a value and an instance of Unit.
+        """
+        ConverterRegistry.__converters[name] = converter
+
+
+    @classmethod
+    def register_criterion(cls, name, converter):
+        """Registers a criterion converter.
+
+        Args:
+            name: A string referenced from the unit table.
+            converter: A function receiving a string of a unit and an as-of date.
+        """
+        ConverterRegistry.__criterions[name] = converter
+
+
+    @classmethod
+    def get(cls, name):
+        """Returns a value converter, or None when it's not registered."""
+        return ConverterRegistry.__converters.get(name)
+
+
+    @classmethod
+    def get_criterion(cls, name):
+        """Returns a criterion converter, or None when it's not registered."""
+        return ConverterRegistry.__criterions.get(name)
+
+
+def main():
+    """Run an example for a ConverterRegistry class."""
+    from unit import Unit
+    from unitlib import UnitLib # Registers converters of UnitLib
+    from converter_registry import ConverterRegistry
+
+    timezone = ConverterRegistry.get('timezone')
+    print timezone(u'16:10 - 17:20', Unit(u'Asia_Tokyo', u'US_Hawaii'))
+    base = ConverterRegistry.get('base')
+    print base([255, 16], Unit(u'10', u'16'))
+
+    return Constants.EXIT_SUCCESS
+
+
+if __name__ == '__main__':
+    sys.exit(main())
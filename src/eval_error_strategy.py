@@ -36,7 +36,6 @@ class EvalErrorStrategy(DefaultErrorStrategy):
             if we've already reported an error and have not matched a token
             yet successfully, don't report any errors.
         """
-        if self.is_block(recognizer): return
         if super(EvalErrorStrategy, self).inErrorRecoveryMode(recognizer):
             return # don't report spurious errors
         super(EvalErrorStrategy, self).beginErrorCondition(recognizer)
@@ -89,8 +88,6 @@ class EvalErrorStrategy(DefaultErrorStrategy):
         """ Reports unwanted token error.
             Wrote in 3/24/2016.
         """
-        if self.is_block(recognizer): return
-
         if super(EvalErrorStrategy, self).inErrorRecoveryMode(recognizer):
             return
         super(EvalErrorStrategy, self).beginErrorCondition(recognizer)
@@ -114,8 +111,6 @@ class EvalErrorStrategy(DefaultErrorStrategy):
     def reportMissingToken(self, recognizer):
         """ Reports missing token error.
         """
-        if self.is_block(recognizer): return
-
         if super(EvalErrorStrategy, self).inErrorRecoveryMode(recognizer):
             return
         super(EvalErrorStrategy, self).beginErrorCondition(recognizer)
@@ -127,13 +122,3 @@ class EvalErrorStrategy(DefaultErrorStrategy):
               + " at " + super(EvalErrorStrategy, self).getTokenErrorDisplay(t)
         recognizer.notifyErrorListeners(msg, t, None)
 
-    def is_block(self, recognizer):
-        """
-        """
-        if isinstance(recognizer._ctx, UnitXParser.BlockContext) and self.is_intaractive_run: # ignore block
-
-            self.is_ignored_block = self.errorRecoveryMode = True
-        else:
-            pass
-        return self.is_ignored_block
-
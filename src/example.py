@@ -2,16 +2,27 @@
 # -*- coding:utf-8 -*-
 
 import sys
+import io
+import argparse
 from antlr4 import *
 from antlr4.InputStream import InputStream
 from antlr4.error.ErrorStrategy import DefaultErrorStrategy
+from antlr4.error.ErrorStrategy import BailErrorStrategy
+from antlr4.error.Errors import ParseCancellationException
+from antlr4.atn.PredictionMode import PredictionMode
 from UnitXLexer import UnitXLexer
-from UnitXParser import UnitXParser
 from eval_visitor import EvalVisitor
 from eval_error_strategy import EvalErrorStrategy
 from eval_error_listener import EvalErrorIOListener
 from eval_error_listener import EvalErrorIntaractiveListener
 from eval_error_listener import EvalErrorStringCodeListener
+from parse_cache import ParseCache
+from pratt_parser import PrattParser
+from collapsing_parser import CollapsingParser
+from regex_lexer import RegexLexer
+from statement_chunker import StatementChunker
+from lazy_body import LazyBody
+from parser_snapshot import ParserSnapshot
 from util import Util
 from constants import Constants
 
@@ -26,9 +37,18 @@ class Example(Cmd):
         is_intaractive_run: A bool indicating whether an intaractive mode.
         stock_line: A string stocking a code which is a block statement
             on the intaractive mode.
+        chunker: An instance of StatementChunker tracking a balance of stocked lines
+            on the intaractive mode.
+        is_stocking_block: A bool indicating whether stocked lines have a block.
         errhandler: An instance of EvalErrorStrategy for reporting all errors.
+        bail_errhandler: An instance of BailErrorStrategy for the first stage of parsing.
         visitor: An instance of EvalVisitor called by a parser.
-        parser: An instance of UnitXParser for parsing codes.
+        lexer: An instance of a token source, UnitXLexer or RegexLexer, which is reused for streams.
+        parser: An instance of CollapsingParser, a UnitXParser keeping only tiers with operators.
+        pratt_parser: An instance of PrattParser parsing codes before UnitXParser,
+            or None when only UnitXParser is used.
+        parse_cache: An instance of ParseCache for skipping a parse of an unchanged code.
+        is_lazy_body: A bool indicating whether function bodies are parsed on their first calls.
         Cmd.prompt: A string displaying against every code line.
     """
 
@@ -37,16 +57,32 @@ class Example(Cmd):
     #
     Cmd.prompt = 'unitx> '
 
-    def __init__(self, is_intaractive_run):
-        """Inits attributes of a Unit class."""
+    def __init__(self, is_intaractive_run, parser_name=Constants.PARSER_ANTLR, lexer_name=Constants.LEXER_ANTLR,
+                 cache_dir=Constants.PARSE_CACHE_DIR):
+        """Inits attributes of a Unit class.
+
+        Args:
+            is_intaractive_run: A bool indicating whether an intaractive mode.
+            parser_name: A string selecting a parser, Constants.PARSER_ANTLR or Constants.PARSER_PRATT.
+            lexer_name: A string selecting a lexer, Constants.LEXER_ANTLR or Constants.LEXER_REGEX.
+            cache_dir: A string indicating a directory of caches of parse trees.
+        """
         Cmd.__init__(self)
         self.is_intaractive_run = is_intaractive_run
         self.stock_line = ""
+        self.chunker = StatementChunker()
+        self.is_stocking_block = False
+        ParserSnapshot.load() # Warmed DFAs, if "make snapshot" made them.
         self.errhandler = EvalErrorStrategy(self.is_intaractive_run)
+        self.bail_errhandler = BailErrorStrategy()
+        self.lexer = RegexLexer() if lexer_name == Constants.LEXER_REGEX else UnitXLexer(None)
         self.visitor = EvalVisitor(self.is_intaractive_run, self.errhandler)
-        self.parser = UnitXParser(None)
+        self.parser = CollapsingParser(None) # Trees keep only tiers with operators.
         self.parser._errHandler = self.errhandler
         self.visitor.set_parser(self.parser)
+        self.parse_cache = ParseCache(cache_dir)
+        self.pratt_parser = PrattParser(self.parser) if parser_name == Constants.PARSER_PRATT else None
+        self.is_lazy_body = not is_intaractive_run
 
         if is_intaractive_run:
             a_listener = EvalErrorIntaractiveListener(self.visitor)
@@ -112,11 +148,13 @@ class Example(Cmd):
 
     def talk_loop(self):
         """Repeatedly issue a prompt, accept input, parse an initial prefix off the received input, and dispatch to action methods, passing them the remainder of the line as argument."""
-        try: Cmd.cmdloop(self)
-        except KeyboardInterrupt as e:
-            print 'KeyboardInterrupt!'
-            self.talk_loop()
-        return
+        with Util.large_stack_session():
+            while True:
+                try:
+                    Cmd.cmdloop(self)
+                    return
+                except KeyboardInterrupt as e:
+                    print 'KeyboardInterrupt!'
         
     def eat_string(self, code_str):
         """
@@ -138,72 +176,251 @@ class Example(Cmd):
         """Executes a code indicated as a_path on the IO mode.
         
         In this version, we just support UTF-8. As the next vision, we need to support UTF-8.
+        A parse tree is loaded from ParseCache when the code is not changed.
 
         Attributes:
             a_path: a string indicating a path of the source code.
         """
         self.visitor.get_errlistener().set_codepath(a_path)
-        a_stream = FileStream(a_path, encoding='utf-8')
-        self.parse(a_stream)
+        with open(a_path, 'rb') as rf:
+            code = rf.read()
+        key = self.parse_cache.get_key(code)
+        a_tree = self.parse_cache.load(key, self.parser)
+        if a_tree is None:
+            a_tree = self.build_tree(InputStream(code.decode('utf-8')))
+            if self.parser._syntaxErrors == 0:
+                self.parse_cache.save(key, a_tree, self.parser.getTokenStream())
+        else:
+            LazyBody.attach(a_tree, self.parser.getTokenStream().tokens) # Bodies may be hidden in the cache.
+        with Util.large_stack_session():
+            self.visitor.visit(a_tree)
+        return
+
+
+    def check_code(self, a_path):
+        """Checks syntax errors of a code indicated as a_path without executing it.
+
+        Function bodies are also parsed, though they are parsed
+        on their first calls when the code is executed.
+
+        Attributes:
+            a_path: a string indicating a path of the source code.
+        Returns:
+            A bool indicating whether the code has no syntax errors.
+        """
+        self.visitor.get_errlistener().set_codepath(a_path)
+        with open(a_path, 'rb') as rf:
+            code = rf.read()
+        is_lazy_body, self.is_lazy_body = self.is_lazy_body, False
+        try:
+            self.build_tree(InputStream(code.decode('utf-8')))
+        finally:
+            self.is_lazy_body = is_lazy_body
+        return self.parser._syntaxErrors == 0
+
+
+    def eat_stream(self, a_path):
+        """Executes a code indicated as a_path on the IO mode one top-level statement at a time.
+
+        The code is read line by line, and StatementChunker splits it into chunks
+        which may end top-level statements. A chunk is parsed without error reporting,
+        and it's joined with the next chunk when the parser stops at the end of it.
+        A parse tree of a chunk is discarded after it's executed,
+        so memory doesn't grow with the length of the code and outputs appear at once.
+        Function declarations are detached from the tree by EvalVisitor, because they are called later.
+
+        A syntax error is reported when its statement is reached,
+        so the statements before it are already executed unlike eat_code().
+
+        Attributes:
+            a_path: a string indicating a path of the source code.
+        """
+        self.visitor.get_errlistener().set_codepath(a_path)
+        chunker = StatementChunker()
+        pending, first_line = [], 1
+        with Util.large_stack_session(), io.open(a_path, 'r', encoding='utf-8') as rf:
+            for a_line, a_chunk in chunker.split(rf):
+                if not pending: first_line = a_line
+                pending.append(a_chunk)
+                token_stream = self.__make_token_stream(InputStream(u''.join(pending)), first_line)
+                a_tree, offending_token = self.__try_build_tree(token_stream)
+                if a_tree is None:
+                    if offending_token is not None and offending_token.type == Token.EOF:
+                        continue # An incomplete statement is continued by the next chunk.
+                    a_tree = self.__build_tree_reporting_errors()
+                if self.is_lazy_body: LazyBody.attach(a_tree, token_stream.tokens)
+                self.visitor.visit(a_tree)
+                pending = []
+
+            if pending:
+                self.visitor.visit(self.build_tree(InputStream(u''.join(pending)), first_line))
         return
 
 
     def talk(self, a_line):
-        """Executes a code indicated as a_path on the IO mode.
-        
-        In this version, we just support UTF-8. As the next vision, we need to support UTF-8.
+        """Executes a code typed by a user on the intaractive mode.
+
+        StatementChunker tracks brackets, blocks and long strings line by line,
+        and lines are stocked without parsing while they are unbalanced.
+        Stocked lines are parsed once when they are balanced.
+        When they have a block, they are parsed when an empty line is typed,
+        so a block can be followed by 'else' on the next line.
 
         Attributes:
             a_line: a string which is typed by a user, except a command string
                 which is defined in this class.
         """
-        if self.errhandler.is_ignored_block:
-            # Errors of block statement never happen until coming empty char.
-            if not a_line.strip():
-                self.errhandler.is_ignored_block = False
-            codeline = self.stock_line + a_line
-        else:
-            codeline = a_line
+        self.chunker.scan(a_line.decode('utf-8'))
+        self.is_stocking_block = self.is_stocking_block or self.chunker.is_in_block()
+        if not self.chunker.is_balanced() or (self.is_stocking_block and a_line.strip()):
+            Cmd.prompt = '...... '
+            self.stock_line = self.stock_line + a_line
+            return
+
+        codeline = (self.stock_line + a_line).decode('utf-8')
+        Cmd.prompt = 'unitx> '
+        self.stock_line = ""
+        self.chunker = StatementChunker()
+        self.is_stocking_block = False
+        self.errhandler.is_ignored_block = False
 
-        codeline = codeline.decode('utf-8')
         lines = codeline.split('\n')
         self.visitor.get_errlistener().set_codelines(lines)
 
         a_stream = InputStream(codeline)
         self.parse(a_stream)
-
-        if self.errhandler.is_ignored_block:
-            Cmd.prompt = '...... '
-            self.stock_line = self.stock_line + a_line
-        else:
-            Cmd.prompt = 'unitx> '
-            self.stock_line = ""
         return
 
 
     def parse(self, a_stream):
         """Parses a stream which is FileStream(the IO mode) or InputStream(the intaractive mode).
 
+        A tree with syntax errors is not executed on the intaractive mode,
+        because its errors are already reported and a user types the next code.
+
         Attributes:
             a_stream: an instance of FileStream(the IO mode) or InputStream(the intaractive mode).
         """
-        a_lexer = UnitXLexer(a_stream)
-        token_stream = CommonTokenStream(a_lexer)
-        self.parser.setTokenStream(token_stream)
-
-        a_tree = self.parser.program() #Bug
+        a_tree = self.build_tree(a_stream)
+        if self.is_intaractive_run and self.parser._syntaxErrors > 0: return
         self.visitor.visit(a_tree)
         return
 
 
+    def build_tree(self, a_stream, first_line=1):
+        """Returns a parse tree of a stream.
+
+        When PrattParser is selected, it parses the tokens first.
+        Otherwise, or when it finds a syntax error, the tokens are parsed by UnitXParser.
+
+        UnitXParser parses in two stages. The first stage uses the SLL prediction
+        without error reporting, and it bails out at the first syntax error.
+        Only when it fails, the second stage parses the tokens again
+        in the full LL prediction with EvalErrorStrategy for reporting errors.
+        SLL is enough for almost all valid codes, and it's faster than LL.
+
+        When is_lazy_body is True, function bodies are skipped and kept in the tree by LazyBody.
+
+        Attributes:
+            a_stream: an instance of FileStream(the IO mode) or InputStream(the intaractive mode).
+            first_line: an int indicating a line number of the first line of the stream.
+        """
+        token_stream = self.__make_token_stream(a_stream, first_line)
+        a_tree, _ = self.__try_build_tree(token_stream)
+        if a_tree is None:
+            a_tree = self.__build_tree_reporting_errors()
+        if self.is_lazy_body: LazyBody.attach(a_tree, token_stream.tokens)
+        return a_tree
+
+
+    def __make_token_stream(self, a_stream, first_line):
+        """Returns a token stream of a stream, which is set to the parser.
+
+        The lexer and the parser are reused for streams, and they are reset by their setters.
+        A token stream is made for each stream, because a tree keeps its tokens.
+        """
+        self.lexer.inputStream = a_stream
+        self.lexer.line = first_line
+        token_stream = CommonTokenStream(self.lexer)
+        if self.is_lazy_body:
+            token_stream.fill()
+            LazyBody.hide(token_stream.tokens)
+        self.parser.setTokenStream(token_stream)
+        return token_stream
+
+
+    def __try_build_tree(self, token_stream):
+        """Parses tokens without error reporting by PrattParser and in the SLL prediction.
+
+        Returns:
+            A tuple of a parse tree and None, or None and an offending token
+            when there is a syntax error.
+        """
+        offending_token = None
+        if self.pratt_parser:
+            try:
+                return self.pratt_parser.parse(token_stream), None
+            except ParseCancellationException as e:
+                offending_token = e.args[0]
+
+        listeners = self.parser._listeners
+        self.parser._errHandler = self.bail_errhandler
+        self.parser._listeners = []
+        self.parser._interp.predictionMode = PredictionMode.SLL
+        try:
+            return self.parser.program(), None
+        except ParseCancellationException as e:
+            if isinstance(e.args[0], RecognitionException):
+                offending_token = e.args[0].offendingToken
+        finally:
+            self.parser._errHandler = self.errhandler
+            self.parser._listeners = listeners
+            self.parser._interp.predictionMode = PredictionMode.LL
+        return None, offending_token
+
+
+    def __build_tree_reporting_errors(self):
+        """Parses the tokens again in the full LL prediction with EvalErrorStrategy."""
+        self.parser.reset() # Rewinds the tokens
+        return self.parser.program() #Bug
+
+
 def main(argv):
-    """Run an example for a Unit class."""
+    """Run an example for a Unit class.
 
-    if len(argv) > 1:
-        cmd = Example(is_intaractive_run=False)
-        cmd.eat_code(argv[1])
+    Usage:
+        $ python example.py [--parser {antlr,pratt}] [--lexer {antlr,regex}] [--stream | --check] [--no-optimize]
+                            [--cache-dir <dir>] [<path>]
+    """
+    arg_parser = argparse.ArgumentParser(prog='unitx')
+    arg_parser.add_argument('path', nargs='?', help='a path of a code (the intaractive mode without it)')
+    arg_parser.add_argument('--parser', choices=[Constants.PARSER_ANTLR, Constants.PARSER_PRATT],
+                            default=Constants.PARSER_ANTLR, help='a parser of codes')
+    arg_parser.add_argument('--lexer', choices=[Constants.LEXER_ANTLR, Constants.LEXER_REGEX],
+                            default=Constants.LEXER_ANTLR, help='a lexer of codes')
+    arg_parser.add_argument('--stream', action='store_true',
+                            help='execute a code one top-level statement at a time')
+    arg_parser.add_argument('--check', action='store_true',
+                            help='check syntax errors of a code including function bodies without executing it')
+    arg_parser.add_argument('--no-optimize', action='store_true',
+                            help='execute a code without constant folding, sharing values of pure expressions and inlining')
+    arg_parser.add_argument('--cache-dir', default=Constants.PARSE_CACHE_DIR,
+                            help='a directory of caches of parse trees (default: %(default)s)')
+    args = arg_parser.parse_args(argv[1:])
+
+    cmd = Example(is_intaractive_run=not args.path, parser_name=args.parser, lexer_name=args.lexer,
+                  cache_dir=args.cache_dir)
+    if args.no_optimize:
+        cmd.visitor.get_constant_folder().is_enabled = False
+        cmd.visitor.get_optimizer().is_enabled = False
+        cmd.visitor.get_inliner().is_enabled = False
+
+    if args.path:
+        if args.check:
+            if not cmd.check_code(args.path): return Constants.EXIT_FAILURE_IN_UNITX
+        elif args.stream: cmd.eat_stream(args.path)
+        else: cmd.eat_code(args.path)
     else:
-        cmd = Example(is_intaractive_run=True)
         import intro_line
         print intro_line.get_line()
         cmd.talk_loop()
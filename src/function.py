@@ -3,10 +3,15 @@
 
 import sys
 from constants import Constants
+from source_position import SourcePosition
 from collegue import Collegue
 from unitx_object import UnitXObject
 from unit import Unit
 from util import Util
+from lazy_body import LazyBody
+from UnitXParser import UnitXParser
+from frame import Frame
+from memo_cache import MemoCache
 
 class Function(Collegue):
     """A class saving an infomation of a function.
@@ -74,7 +79,7 @@ class Function(Collegue):
             msg = Constants.TYPE_ERR_ARGS % (self.name, len(args_without_default), len(args))
             if args: 
                 last_unitx_obj = args[-1]
-                self.mediator.get_parser().notifyErrorListeners(msg, last_unitx_obj.token, Exception(msg))
+                self.mediator.get_parser().notifyErrorListeners(msg, SourcePosition.to_token(last_unitx_obj.pos), Exception(msg))
             else: 
                 self.mediator.get_parser().notifyErrorListeners(msg, self.ctx.start, Exception(msg))
 
@@ -84,7 +89,7 @@ class Function(Collegue):
         if len(args) > len(self.defined_args):
             msg = Constants.TYPE_ERR_ARGS % (self.name, len(self.defined_args), len(args))
             last_unitx_obj = args[-1]
-            self.mediator.get_parser().notifyErrorListeners(msg, last_unitx_obj.token, Exception(msg))
+            self.mediator.get_parser().notifyErrorListeners(msg, SourcePosition.to_token(last_unitx_obj.pos), Exception(msg))
 
         return
 
@@ -133,11 +138,25 @@ class DefinedFunction(Function):
         defined_args: A list of string indicating function arguments.
         ctx: An instance of ParserRuleContext indicating functionDeclaration RULE.
         code: A string indicating a source code (an intaractive code or an IO path).
+        slots: A list of tuples of a name, a position id and a default value of each parameter,
+            which are laid out in a Frame on each call.
+        memo: An instance of MemoCache when the function is memoized by memoize(), or None.
     """
 
     def __init__(self, name, defined_args, ctx, code):
-        """Inits attributes of a Function class. """
+        """Inits attributes of a Function class.
+
+        Default values are evaluated once at the definition,
+        and they're kept as values which are assigned to parameters.
+        """
         super(DefinedFunction, self).__init__(name, defined_args, ctx=ctx, code=code)
+        self.slots = []
+        for variable, default_value in defined_args:
+            if default_value:
+                default_value = UnitXObject(value=None, varname=variable.varname, unit=Unit(), pos=variable.pos).bind(default_value.copy())
+            self.slots.append((variable.varname, variable.pos, default_value))
+        self.memo = None
+        self.body_names = None
     
 
     def call(self, args, func_obj, called_func):
@@ -155,27 +174,70 @@ class DefinedFunction(Function):
             An instance of UnitXObject calculated by this function.
         """
         super(DefinedFunction, self).call(args, func_obj, called_func)
-        self.define_arguments(args)
-        self.mediator.visitBlock(self.ctx.block())
-        return self.mediator.return_value
+        parser = self.mediator.get_parser()
+        syntax_errors = parser._syntaxErrors
+        scopes = self.mediator.get_scopes()
+        a_func, memo_keys = self, []
+        while True:
+            key = None if a_func.memo is None else a_func.memo.make_key(args)
+            unitx_obj = None if key is None else a_func.memo.get(key)
+            if unitx_obj is not None: break
+            if key is not None: memo_keys.append((a_func.memo, key))
+
+            scopes.push_scope(Frame(scopes.peek(), a_func.slots, args))
+            a_block = LazyBody.parse(a_func.ctx, parser)
+            self.mediator.get_constant_folder().fold(a_block) # A lazy body is folded after it's parsed.
+            self.mediator.visitBlock(a_block)
+            scopes.del_scope()
+            unitx_obj = self.mediator.return_value
+            if self.mediator.tail_call is None: break
+
+            # A tail call (return f(...)) replaces this call in the same loop instead of a Python frame.
+            a_func, args, func_obj, called_func = self.mediator.tail_call
+            self.mediator.tail_call, self.mediator.is_return = None, False
+            super(DefinedFunction, a_func).call(args, func_obj, called_func)
+            self.mediator.get_errlistener().set_last_called_func(a_func)
+
+        if parser._syntaxErrors == syntax_errors:
+            for a_memo, key in memo_keys: a_memo.put(key, unitx_obj) # Results of tail calls are the same.
+        return unitx_obj
+
+    def get_free_names(self, visiting=None):
+        """Returns names which a call of this function may read or write in scopes of its callers.
+
+        Names are Identifiers in tokens of the body except parameters,
+        and free names of functions called in the body (found in scopes now) are added.
 
-    def define_arguments(self, args):
-        """Defines arguments of a Function class and assigns given values
-        by user program into the arguments.
+        Args:
+            visiting: A set of functions whose names are collected now (for recursive calls).
+        Returns:
+            A set of strings of names.
+        """
+        if self.body_names is None:
+            tokens = LazyBody.get_tokens(self.ctx.block())
+            names = set(a_token.text for a_token in tokens if a_token.type == UnitXParser.Identifier)
+            called_names = set(a_token.text for a_token, next_token in zip(tokens, tokens[1:])
+                               if a_token.type == UnitXParser.Identifier and next_token.type == UnitXParser.LPAREN)
+            self.body_names = (names - set(varname for varname, _, _ in self.slots), called_names)
+
+        names, called_names = self.body_names
+        free_names = set(names)
+        visiting = visiting or set([self])
+        for called_name in called_names:
+            found_scope = self.mediator.get_scopes().peek().find_scope_of(called_name)
+            a_func = found_scope[called_name].get_value(error=False) if found_scope else None
+            if isinstance(a_func, DefinedFunction) and a_func not in visiting:
+                visiting.add(a_func)
+                free_names |= a_func.get_free_names(visiting)
+        return free_names
+
+    def memoize(self, size):
+        """Caches results of calls by values of arguments from now on.
 
         Args:
-            args: A list of a argument appointed/called by user.
+            size: An int indicating the maximum number of cached results.
         """
-        for i in range(len(self.defined_args)):
-            variable, default_value = self.defined_args[i]
-            if i < len(args):
-                unitx_obj = args[i]
-            else:
-                if default_value:
-                    unitx_obj = default_value
-                else:
-                    unitx_obj = UnitXObject(value=None, varname=None, unit=Unit(), token=None, is_none=True)
-            variable.assign(unitx_obj, None) #スコープに代入される
+        self.memo = MemoCache(size)
 
 
 
@@ -209,23 +271,27 @@ class BuiltInFunction(Function):
         """
         super(BuiltInFunction, self).call(args, func_obj, called_func)
         a_value = self.func_p(args, func_obj)
+        if isinstance(a_value, UnitXObject) and not a_value.is_none: return a_value # A value with a unit (e.g. sum())
         if a_value:
-            return UnitXObject(value=a_value, varname=None, is_none=False, unit=Unit(), token=func_obj.token)
+            return UnitXObject(value=a_value, varname=None, is_none=False, unit=Unit(), pos=func_obj.pos)
         else:
-            return UnitXObject(value=None, varname=None, is_none=True, unit=Unit(), token=func_obj.token)
+            return UnitXObject(value=None, varname=None, is_none=True, unit=Unit(), pos=func_obj.pos)
 
 
 def main():
     """Run an example for a Function class."""
     from simulator import Simulator
     s = Simulator()
+    UnitXObject.scopes = s.get_scopes()
 
     # Define variables
     current_scope = s.get_scopes().peek()
     x, y = UnitXObject(None,None,None,is_none=True), UnitXObject(None,None,None,is_none=True)
     current_scope['x'] = x
     current_scope['y'] = y
-    current_scope['dfs'] = DefinedFunction('dfs', [['x', x], ['y', y], ['level', None]], ctx=None, code=None)
+    params = [UnitXObject(value=None, varname=a_name, unit=Unit()) for a_name in ['x', 'y']]
+    current_scope['dfs'] = DefinedFunction('dfs', [[params[0], None], [params[1], UnitXObject(value=1, varname=None, unit=Unit())]], ctx=None, code=None)
+    print current_scope['dfs'].slots
 
     # Output
     from util import Util
@@ -0,0 +1,373 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+
+import sys
+from antlr4.tree.Tree import TerminalNode
+from UnitXParser import UnitXParser
+from collegue import Collegue
+from function import Function, BuiltInFunction
+from lazy_body import LazyBody
+from constants import Constants
+
+class Optimizer(Collegue):
+    """A pass sharing values of pure expressions in a loop or in a statement.
+
+    An expression is pure when it has no assignment, no '++' and '--',
+    no unit on a variable (x{km} changes a unit of x), no list and no call of an impure function.
+    A defined function is pure when tokens of its body have no assignment, no print, no dump,
+    no call of a built-in function and no call of an impure function (a body may not be parsed yet).
+    A pure expression is shared with its owner:
+        1. a rep statement, when no variable which the expression reads
+           (including names of units and variables read by called functions)
+           is written in the loop (a loop-invariant expression),
+        2. a statement in a body of a loop or a function, when the expression appears twice or more
+           in the statement and its variables are not written in the statement (a common subexpression).
+    A shared value is computed on its first execution in a run of its owner,
+    and copies of it are used until the run ends. So, an expression is hoisted out of a loop
+    without computing it before the loop, and an error is reported at the same time as before.
+
+    A statement running once (at the top level and out of loops) is not analyzed,
+    because its analysis costs more than computing its expressions twice.
+    An owner is analyzed on its first run, because called functions are found in scopes.
+    The functions are checked on each run, and the owner is analyzed again when they're changed.
+
+    Attributes:
+        is_enabled: A bool indicating whether values are shared.
+    """
+
+    __OPERATOR_CONTEXTS = (
+        UnitXParser.AdditiveExpressionContext,
+        UnitXParser.MultiplicativeExpressionContext,
+        UnitXParser.EqualityExpressionContext,
+    )
+
+    __TIER_CONTEXTS = (
+        UnitXParser.AssignmentExpressionContext,
+        UnitXParser.LogicalExpressionContext,
+        UnitXParser.EqualityExpressionContext,
+        UnitXParser.RelationalExpressionContext,
+        UnitXParser.AdditiveExpressionContext,
+        UnitXParser.MultiplicativeExpressionContext,
+        UnitXParser.UnaryExpressionContext,
+        UnitXParser.CallExpressionContext,
+    )
+
+    __IMPURE_TOKEN_TYPES = frozenset([
+        UnitXParser.ASSIGN, UnitXParser.ADD_ASSIGN, UnitXParser.SUB_ASSIGN, UnitXParser.MUL_ASSIGN,
+        UnitXParser.DIV_ASSIGN, UnitXParser.MOD_ASSIGN, UnitXParser.AND_ASSIGN, UnitXParser.OR_ASSIGN,
+        UnitXParser.XOR_ASSIGN, UnitXParser.INC, UnitXParser.DEC, UnitXParser.PRINT, UnitXParser.DEF,
+        UnitXParser.GT, # A dump statement
+    ] + range(UnitXParser.THREE_BORDER, UnitXParser.TEN_BORDER + 1))
+
+    __NON_WRITING_BUILT_INS = frozenset(['expect'])
+
+    __ALL = None # Writes of an owner which may write all variables
+
+    def __init__(self):
+        """Inits attributes of an Optimizer class."""
+        self.is_enabled = True
+
+
+    def begin(self, owner):
+        """Begins a run of an owner (a statement or a rep statement) before executing it.
+
+        Returns:
+            Shared values of the last run which is still running (e.g. in a recursive call),
+            or None. It must be given to end().
+        """
+        if not self.is_enabled: return None
+        if isinstance(owner, UnitXParser.StatementContext) \
+            and owner.enclosing_func is None and owner.enclosing_loop is None: return None
+        a_plan = getattr(owner, 'sharing_plan', None)
+        if a_plan is None or (a_plan[0] and not self.__is_bound(a_plan[1])):
+            a_plan = self.__plan(owner)
+        if not a_plan[0]: return None
+        last_values = owner.shared_values
+        owner.shared_values = {}
+        return last_values
+
+
+    def end(self, owner, last_values):
+        """Ends a run of an owner, and restores shared values of the last run."""
+        if getattr(owner, 'shared_values', None) is not None:
+            owner.shared_values = last_values
+        return
+
+
+    def get_shared_value(self, ctx):
+        """Returns a value of a shared expression, which is computed once in a run of its owner.
+
+        A value is not kept when an error is reported on its computation.
+
+        Args:
+            ctx: An instance of ParserRuleContext which has a shared_key.
+        Returns:
+            An instance of UnitXObject.
+        """
+        owner, key = ctx.shared_key
+        shared_values = owner.shared_values
+        if shared_values is None: return ctx.accept(self.mediator)
+        unitx_obj = shared_values.get(key)
+        if unitx_obj is not None: return unitx_obj.copy()
+
+        parser = self.mediator.get_parser()
+        syntax_errors = parser._syntaxErrors
+        unitx_obj = ctx.accept(self.mediator)
+        if unitx_obj is not None and parser._syntaxErrors == syntax_errors:
+            shared_values[key] = unitx_obj.copy()
+        return unitx_obj
+
+
+    def __is_bound(self, bindings):
+        """Returns whether names of called functions are still bound to the same functions."""
+        current_scope = self.mediator.get_scopes().peek()
+        for func_name, a_func in bindings:
+            found_scope = current_scope.find_scope_of(func_name)
+            if not found_scope or found_scope[func_name].get_value(error=False) is not a_func: return False
+        return True
+
+
+    def __plan(self, owner):
+        """Analyzes an owner and marks its shared expressions.
+
+        Returns:
+            A tuple of a list of marked contexts and a list of (name, function) of called functions.
+        """
+        for ctx in getattr(owner, 'sharing_plan', ([], []))[0]:
+            del ctx.shared_key
+        a_plan = ([], [])
+        owner.sharing_plan, owner.shared_values = a_plan, None
+
+        if isinstance(owner, UnitXParser.RepStatementContext):
+            writes, candidates = set([owner.repControl().Identifier().getText()]), []
+            writes = self.__walk(owner.statement(), writes, candidates, a_plan)
+            if writes is Optimizer.__ALL: return a_plan
+            shared_candidates = [(ctx, end) for ctx, reads, end in candidates if not (reads & writes)]
+
+        elif owner.expressionStatement() or owner.printStatement() or owner.dumpStatement() \
+            or owner.assertStatement() or owner.start.type == UnitXParser.RETURN:
+            candidates = []
+            writes = self.__walk(owner, set(), candidates, a_plan)
+            if writes is Optimizer.__ALL: return a_plan
+            texts = [self.__get_text(ctx, end) for ctx, _, end in candidates]
+            shared_candidates = [(ctx, end) for (ctx, reads, end), text in zip(candidates, texts)
+                                 if texts.count(text) > 1 and not (reads & writes)]
+
+        else:
+            return a_plan # A block, an if statement and so on
+
+        ends = {}
+        for ctx, end in shared_candidates:
+            if ends.get(ctx, 0) is not None: ends[ctx] = None if end is None else max(end, ends.get(ctx, 0))
+        for ctx, end in ends.items():
+            if end is not None: ctx = self.__split_prefix(ctx, end)
+            if hasattr(ctx, 'shared_key'): continue # An outer loop shares it.
+            ctx.shared_key = (owner, ctx.getText())
+            a_plan[0].append(ctx)
+        return a_plan
+
+
+    def __get_text(self, ctx, end):
+        """Returns a text of an expression, or a text of its first operands when end is not None."""
+        if end is None: return ctx.getText()
+        return u''.join(a_child.getText() for a_child in ctx.children[:end])
+
+
+    def __split_prefix(self, ctx, end):
+        """Splits first operands of a binary expression into a new context, and returns it.
+
+        Operands of the same precedence are in one context (e.g. a + b + c * i),
+        so a shared prefix (a + b) becomes a context of the same class.
+        The result is not changed, because a binary expression is computed from the left.
+        """
+        prefix = ctx.__class__(ctx.parser, ctx, ctx.invokingState)
+        prefix.children = ctx.children[:end]
+        for a_child in prefix.children: a_child.parentCtx = prefix
+        prefix.start, prefix.stop = ctx.start, ctx.children[end-1].stop
+        ctx.children[:end] = [prefix]
+        return prefix
+
+
+    def __walk(self, ctx, writes, candidates, a_plan):
+        """Collects names written in a subtree and pure expressions in it.
+
+        Args:
+            ctx: An instance of ParserRuleContext.
+            writes: A set of written names, or Optimizer.__ALL.
+            candidates: A list of tuples of a context of a pure expression, a set of read names
+                and the number of children of its first operands (or None for the whole expression).
+            a_plan: A plan of an owner which collects called functions.
+        Returns:
+            Updated writes.
+        """
+        effects = self.__analyze(ctx, writes, candidates, a_plan)
+        return effects[2]
+
+
+    def __analyze(self, ctx, writes, candidates, a_plan):
+        """Returns a tuple of (is_pure, a set of read names, updated writes) of a subtree."""
+        if isinstance(ctx, TerminalNode): return True, set(), writes
+        is_pure, reads = True, set()
+
+        if isinstance(ctx, UnitXParser.RepStatementContext):
+            writes = self.__add_write(writes, ctx.repControl().Identifier().getText())
+        elif isinstance(ctx, UnitXParser.AssignmentExpressionContext) and ctx.getChildCount() > 1:
+            writes = self.__add_write(writes, self.__get_target_name(ctx.getChild(0)))
+            is_pure = False
+        elif isinstance(ctx, UnitXParser.UnaryExpressionContext) and ctx.getChildCount() > 1:
+            if ctx.start.type in (UnitXParser.INC, UnitXParser.DEC):
+                writes = self.__add_write(writes, self.__get_target_name(ctx.getChild(1)))
+            is_pure = False
+        elif isinstance(ctx, (UnitXParser.LogicalExpressionContext, UnitXParser.RelationalExpressionContext)) and ctx.getChildCount() > 1:
+            is_pure = False
+        elif isinstance(ctx, UnitXParser.CallExpressionContext) and ctx.getChildCount() > 1:
+            a_primary = ctx.primary()
+            if ctx.getChildCount() in (3, 4) and a_primary.Identifier() and not a_primary.unit():
+                is_pure, func_reads, is_writing = self.__get_function_effects(a_primary.Identifier().getText(), a_plan, set())
+                reads |= func_reads
+                if is_writing: writes = Optimizer.__ALL
+            else:
+                is_pure, writes = False, Optimizer.__ALL
+        elif isinstance(ctx, UnitXParser.PrimaryContext):
+            if ctx.Identifier():
+                reads.add(ctx.Identifier().getText())
+                if ctx.unit():
+                    writes = self.__add_write(writes, ctx.Identifier().getText())
+                    is_pure = False
+            elif ctx.start.type == UnitXParser.LBRACK or (ctx.literal() and ctx.literal().string() and ctx.literal().string().halfString()):
+                is_pure = False
+        elif isinstance(ctx, UnitXParser.UnitTokenContext):
+            reads.add(ctx.getText()) # A name of a unit may be a variable.
+
+        child_effects = []
+        for a_child in ctx.getChildren():
+            child_is_pure, child_reads, writes = self.__analyze(a_child, writes, candidates, a_plan)
+            is_pure = is_pure and child_is_pure
+            reads |= child_reads
+            child_effects.append((child_is_pure, child_reads))
+
+        if ctx.getChildCount() > 1 and isinstance(ctx, Optimizer.__OPERATOR_CONTEXTS + (UnitXParser.CallExpressionContext,)):
+            if is_pure and reads: candidates.append((ctx, reads, None))
+            if isinstance(ctx, Optimizer.__OPERATOR_CONTEXTS):
+                self.__add_prefixes(ctx, child_effects, candidates)
+        return is_pure, reads, writes
+
+
+    def __add_prefixes(self, ctx, child_effects, candidates):
+        """Appends pure first operands of a binary expression (e.g. a + b of a + b + f(c)) to candidates."""
+        is_pure, reads = child_effects[0]
+        reads = set(reads)
+        for end in range(3, len(child_effects), 2):
+            is_pure = is_pure and child_effects[end-1][0]
+            if not is_pure: return
+            reads |= child_effects[end-1][1]
+            if reads: candidates.append((ctx, set(reads), end))
+        return
+
+
+    def __add_write(self, writes, varname):
+        """Returns writes with a name, or Optimizer.__ALL when a name is unknown."""
+        if writes is Optimizer.__ALL or varname is None: return Optimizer.__ALL
+        writes.add(varname)
+        return writes
+
+
+    def __get_target_name(self, ctx):
+        """Returns a name of a variable which is assigned, or None when it's not a variable."""
+        if isinstance(ctx, UnitXParser.ExpressionContext): ctx = ctx.getChild(0)
+        while isinstance(ctx, Optimizer.__TIER_CONTEXTS) and ctx.getChildCount() == 1:
+            ctx = ctx.getChild(0)
+        if isinstance(ctx, UnitXParser.PrimaryContext) and ctx.Identifier(): return ctx.Identifier().getText()
+        return None
+
+
+    def __get_function_effects(self, func_name, a_plan, visiting):
+        """Returns effects of a call of a function found in scopes.
+
+        Args:
+            func_name: A string of a name of a called function.
+            a_plan: A plan of an owner which collects called functions.
+            visiting: A set of names of functions analyzed now (for recursive calls).
+        Returns:
+            A tuple of (is_pure, a set of read names, whether it may write variables).
+        """
+        if func_name in visiting: return True, set(), False
+        found_scope = self.mediator.get_scopes().peek().find_scope_of(func_name)
+        a_func = found_scope[func_name].get_value(error=False) if found_scope else None
+        if not isinstance(a_func, Function): return False, set(), True
+        a_plan[1].append((func_name, a_func))
+        if isinstance(a_func, BuiltInFunction):
+            return False, set(), func_name not in Optimizer.__NON_WRITING_BUILT_INS
+        if a_func.ctx is None: return False, set(), True
+
+        is_pure, reads, called_names = self.__get_body_effects(a_func)
+        if not is_pure: return False, set(), True
+        reads = set(reads)
+        visiting.add(func_name)
+        for called_name in called_names:
+            is_pure, func_reads, _ = self.__get_function_effects(called_name, a_plan, visiting)
+            if not is_pure: return False, set(), True
+            reads |= func_reads
+        visiting.discard(func_name)
+        return True, reads, False
+
+
+    def __get_body_effects(self, a_func):
+        """Returns a tuple of (is_pure, read names, called names) of tokens of a body of a function.
+
+        It's kept in the function, because the body is never changed.
+        An Identifier followed by '{' is regarded as a unit on a variable.
+        """
+        if hasattr(a_func, 'body_effects'): return a_func.body_effects
+        tokens = LazyBody.get_tokens(a_func.ctx.block())
+
+        is_pure, reads, called_names = True, set(), set()
+        for i, a_token in enumerate(tokens):
+            if a_token.type in Optimizer.__IMPURE_TOKEN_TYPES:
+                is_pure = False
+                break
+            if a_token.type != UnitXParser.Identifier: continue
+            reads.add(a_token.text)
+            next_type = tokens[i+1].type if i + 1 < len(tokens) else None
+            if next_type == UnitXParser.LPAREN: called_names.add(a_token.text)
+            elif next_type == UnitXParser.LBRACE:
+                is_pure = False
+                break
+        a_func.body_effects = (is_pure, frozenset(reads), frozenset(called_names))
+        return a_func.body_effects
+
+
+    def set_mediator(self, mediator):
+        """Sets a mediator for Mediator pattern of GoF.
+
+        Args:
+            mediator: An instance of a EvalVisitor class inherited Mediator class.
+        """
+        self.mediator = mediator
+
+
+def main():
+    """Run an example for an Optimizer class."""
+    from example import Example
+    from antlr4.InputStream import InputStream
+
+    code = u'a = 10{万} * 2\nb = 20{万}\ndef twice(x) {\n    return x * 2\n}\n' \
+           u'rep i,3 {\n    c = a + b + twice(a) * i\n    print (a * i + b) / (a * i + b)\n}\n'
+    cmd = Example(is_intaractive_run=False)
+    cmd.visitor.get_errlistener().set_codepath('<example>')
+    a_tree = cmd.build_tree(InputStream(code))
+    cmd.visitor.visit(a_tree)
+    nodes = [a_tree]
+    while nodes:
+        a_node = nodes.pop()
+        if isinstance(a_node, TerminalNode): continue
+        if hasattr(a_node, 'shared_key'):
+            owner, key = a_node.shared_key
+            print '%s is shared with %s' % (key.encode('utf-8'), owner.__class__.__name__)
+        nodes.extend(reversed(list(a_node.getChildren())))
+
+    return Constants.EXIT_SUCCESS
+
+
+if __name__ == '__main__':
+    sys.exit(main())
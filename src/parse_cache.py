@@ -0,0 +1,188 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+
+import sys
+import os
+import hashlib
+import marshal
+import tempfile
+from antlr4.Token import CommonToken
+from antlr4.ListTokenSource import ListTokenSource
+from antlr4.CommonTokenStream import CommonTokenStream
+from antlr4.tree.Tree import TerminalNode
+import UnitXParser as parser_module
+from UnitXParser import UnitXParser
+from constants import Constants
+
+class ParseCache(object):
+    """A cache of parse trees on a disk keyed by a hash of a source code.
+
+    A parse tree is saved as a token list and a compact tree made of tuples,
+    and it's serialized by marshal. When a source code is not changed,
+    its parse tree is rebuilt from the cache without the lexer and the parser.
+    A total size of caches is kept under max_bytes by removing
+    the least recently used caches, whose modified times are updated by load().
+
+    A data structure:
+        <tokens> := [(type, channel, start, stop, line, column, text)*]
+        <node> := (rule index, invoking state, start index, stop index, [<node> | token index]*)
+
+    Attributes:
+        cache_dir: A string indicating a directory of caches.
+        max_bytes: An int indicating the maximum total size of caches.
+        __grammar_hash: A string identifying a version of the grammar.
+        __ctx_classes: A list of context classes of UnitXParser indexed by a rule index.
+    """
+
+    __grammar_hash = hashlib.sha1(('%s:' % Constants.PARSE_CACHE_VERSION) + parser_module.serializedATN().encode('utf-8')).hexdigest()
+    __ctx_classes = [getattr(UnitXParser, name[0].upper() + name[1:] + 'Context') for name in UnitXParser.ruleNames]
+
+    def __init__(self, cache_dir=Constants.PARSE_CACHE_DIR, max_bytes=Constants.PARSE_CACHE_MAX_BYTES):
+        """Inits attributes of a ParseCache class."""
+        self.cache_dir = os.path.expanduser(cache_dir)
+        self.max_bytes = max_bytes
+
+
+    def get_key(self, code):
+        """Returns a key of a source code.
+
+        Args:
+            code: A string of a source code (bytes).
+        Returns:
+            A string of a hex digest.
+        """
+        return hashlib.sha1(ParseCache.__grammar_hash + code).hexdigest()
+
+
+    def __get_path(self, key):
+        return os.path.join(self.cache_dir, key + '.tree')
+
+
+    def load(self, key, parser):
+        """Loads a parse tree and sets its tokens to a parser.
+
+        Args:
+            key: A string returned by get_key().
+            parser: An instance of UnitXParser for reporting errors.
+        Returns:
+            An instance of ProgramContext, or None when there is no cache.
+        """
+        a_path = self.__get_path(key)
+        try:
+            with open(a_path, 'rb') as rf:
+                token_infos, a_node = marshal.load(rf)
+            os.utime(a_path, None) # The most recently used
+        except (IOError, OSError, EOFError, ValueError, TypeError):
+            return None
+
+        tokens = []
+        for a_type, channel, start, stop, line, column, text in token_infos:
+            a_token = CommonToken(type=a_type, channel=channel, start=start, stop=stop)
+            a_token.line, a_token.column, a_token.text = line, column, text
+            tokens.append(a_token)
+        token_stream = CommonTokenStream(ListTokenSource(tokens))
+        token_stream.fill()
+        parser.setTokenStream(token_stream)
+
+        return self.__decode_node(a_node, parser, None, token_stream.tokens)
+
+
+    def save(self, key, a_tree, token_stream):
+        """Saves a parse tree which is parsed without errors.
+
+        A cache is written into a temporary file and renamed,
+        so a broken cache is never read by other processes.
+        A tree larger than max_bytes is not saved.
+        Errors of writing are ignored because a cache is optional.
+
+        Args:
+            key: A string returned by get_key().
+            a_tree: An instance of ProgramContext.
+            token_stream: An instance of CommonTokenStream which made a_tree.
+        """
+        token_infos = [(t.type, t.channel, t.start, t.stop, t.line, t.column, t.text) for t in token_stream.tokens]
+        data = marshal.dumps((token_infos, self.__encode_node(a_tree)))
+        if len(data) > self.max_bytes: return
+        try:
+            if not os.path.isdir(self.cache_dir): os.makedirs(self.cache_dir)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir)
+            with os.fdopen(fd, 'wb') as wf:
+                wf.write(data)
+            os.rename(tmp_path, self.__get_path(key))
+            self.__evict()
+        except (IOError, OSError):
+            pass
+        return
+
+
+    def __evict(self):
+        """Removes the least recently used caches until their total size is at most max_bytes."""
+        entries = []
+        for filename in os.listdir(self.cache_dir):
+            if not filename.endswith('.tree'): continue
+            a_path = os.path.join(self.cache_dir, filename)
+            try:
+                a_stat = os.stat(a_path)
+            except OSError:
+                continue # Removed by another process
+            entries.append((a_stat.st_mtime, a_stat.st_size, a_path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, a_path in sorted(entries):
+            if total <= self.max_bytes: break
+            try:
+                os.remove(a_path)
+            except OSError:
+                pass
+            total -= size
+        return
+
+
+    def __encode_node(self, ctx):
+        """Encodes a context into a tuple."""
+        children = []
+        for child in ctx.getChildren():
+            if isinstance(child, TerminalNode):
+                children.append(child.symbol.tokenIndex)
+            else:
+                children.append(self.__encode_node(child))
+        stop_index = ctx.stop.tokenIndex if ctx.stop else -1
+        return (ctx.getRuleIndex(), ctx.invokingState, ctx.start.tokenIndex, stop_index, children)
+
+
+    def __decode_node(self, a_node, parser, parent, tokens):
+        """Decodes a tuple into a context of UnitXParser."""
+        rule_index, invoking_state, start_index, stop_index, children = a_node
+        ctx = ParseCache.__ctx_classes[rule_index](parser, parent, invoking_state)
+        ctx.start = tokens[start_index]
+        ctx.stop = tokens[stop_index] if stop_index >= 0 else None
+        for child in children:
+            if isinstance(child, tuple):
+                ctx.addChild(self.__decode_node(child, parser, ctx, tokens))
+            else:
+                ctx.addTokenNode(tokens[child])
+        return ctx
+
+
+def main():
+    """Run an example for a ParseCache class."""
+    from antlr4.InputStream import InputStream
+    from UnitXLexer import UnitXLexer
+
+    code = 'x = 5{km}\nprint x{km->m}\n'
+    token_stream = CommonTokenStream(UnitXLexer(InputStream(code.decode('utf-8'))))
+    parser = UnitXParser(token_stream)
+    a_tree = parser.program()
+
+    cache = ParseCache()
+    key = cache.get_key(code)
+    cache.save(key, a_tree, token_stream)
+    loaded_tree = cache.load(key, UnitXParser(None))
+    print a_tree.toStringTree(recog=parser)
+    print loaded_tree.toStringTree(recog=parser)
+
+    return Constants.EXIT_SUCCESS
+
+
+if __name__ == '__main__':
+    sys.exit(main())
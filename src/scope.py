@@ -37,11 +37,11 @@ class Scope(dict, Collegue):
         Returns:
             An instance of a Scope class indicating varname.
         """
-        if varname in self: return self
-        else:
-            if self.parent == None: return None # For finishing
-            tmp = self.parent.find_scope_of(varname)
-            return tmp  # Search recursively
+        a_scope = self
+        while a_scope is not None: # Scopes of deep recursive calls are searched without recursion.
+            if varname in a_scope: return a_scope
+            a_scope = a_scope.parent
+        return None
 
 
     @classmethod
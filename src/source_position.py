@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+
+import sys
+from antlr4.Token import Token, CommonToken
+from antlr4.tree.Tree import TerminalNode
+from lazy_body import LazyBody
+from constants import Constants
+
+class SourcePosition(object):
+    """Positions of tokens in a source code as small ints.
+
+    Values and units keep a position id instead of a token of ANTLR,
+    because a token keeps its lexer and its input stream alive, that is, the whole source code.
+    A position id packs a line and a column of a token into one int,
+    so positions need no table which grows with tokens.
+    A position id is unpacked into a token only when an error is reported,
+    and a listener finds a line of the source code (a path or lines of the intaractive mode) by it.
+
+    A function declaration is kept while its function is defined,
+    so detach() cuts it from the parse tree and its tokens from the source.
+    """
+
+    __COLUMN_BITS = Constants.POSITION_COLUMN_BITS
+    __COLUMN_MASK = (1 << __COLUMN_BITS) - 1
+
+    @classmethod
+    def of(cls, a_token):
+        """Returns a position id of a token, or None when a token is None.
+
+        Args:
+            a_token: An instance of Token.
+        """
+        if a_token is None: return None
+        return (a_token.line << cls.__COLUMN_BITS) | min(a_token.column, cls.__COLUMN_MASK)
+
+
+    @classmethod
+    def get_line(cls, pos):
+        """Returns a line of a position id."""
+        return pos >> cls.__COLUMN_BITS
+
+
+    @classmethod
+    def get_column(cls, pos):
+        """Returns a column of a position id."""
+        return pos & cls.__COLUMN_MASK
+
+
+    @classmethod
+    def to_token(cls, pos):
+        """Returns a token at a position id for reporting an error by notifyErrorListeners().
+
+        Args:
+            pos: An int returned by of(), or None.
+        Returns:
+            An instance of CommonToken which has a line and a column, or None.
+        """
+        if pos is None: return None
+        a_token = CommonToken(type=Token.INVALID_TYPE)
+        a_token.line, a_token.column = cls.get_line(pos), cls.get_column(pos)
+        return a_token
+
+
+    @classmethod
+    def detach(cls, func_ctx):
+        """Detaches a function declaration from its parse tree and its source code.
+
+        Texts of its tokens (including hidden tokens of a lazy body) are copied,
+        and the tokens drop their lexer and input stream.
+
+        Args:
+            func_ctx: An instance of FunctionDeclarationContext.
+        """
+        func_ctx.parentCtx = None
+        tokens = list(LazyBody.get_hidden_tokens(func_ctx.block()))
+        nodes = [func_ctx]
+        while nodes:
+            a_node = nodes.pop()
+            if isinstance(a_node, TerminalNode): tokens.append(a_node.symbol)
+            else: nodes.extend(a_node.getChildren())
+        for a_token in tokens:
+            a_token.text = a_token.text
+            a_token.source = CommonToken.EMPTY_SOURCE
+        return
+
+
+def main():
+    """Run an example for a SourcePosition class."""
+    from antlr4.InputStream import InputStream
+    from UnitXLexer import UnitXLexer
+
+    a_lexer = UnitXLexer(InputStream(u'x = 5{km}\nprint x{km->m}\n'))
+    for a_token in a_lexer.getAllTokens():
+        pos = SourcePosition.of(a_token)
+        print pos, '%s:%s' % (SourcePosition.get_line(pos), SourcePosition.get_column(pos)), a_token.text.encode('utf-8')
+
+    return Constants.EXIT_SUCCESS
+
+
+if __name__ == '__main__':
+    sys.exit(main())
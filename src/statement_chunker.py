@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+
+import sys
+import re
+from constants import Constants
+
+class StatementChunker(object):
+    """A splitter of a code into chunks of top-level statements line by line.
+
+    A chunk ends at the end of a line when
+        1. brackets ('(', '{', '[') and blocks (':' ... 'end') are balanced,
+           and the line is not in a long string or a block comment,
+        2. its last token doesn't take an optional expression such as "print" or ">>",
+        3. the next code line starts a new statement, not a continuation such as "else", "(" or "+".
+    A chunk is a candidate, so a caller parses it and joins it with the next chunk
+    when it's incomplete (e.g. "if x > 1" followed by "print x" on the next line).
+
+    Attributes:
+        __openings: A list of open brackets and blocks ('(', '{', '[' or ':') as a stack.
+        __closing: A string which closes a long string or a block comment
+            that the current line is in, or None.
+    """
+
+    __TOKEN = re.compile(u'|'.join([
+        u'(?P<skip>[ \t\r\x0c\n]+|#[^\n]*|//[^\n]*|/\\*.*?\\*/)',
+        u'(?P<open_comment>/\\*)',
+        u'(?P<long_string>\'\'\'(?:[^\\\\]|\\\\.)*?\'\'\'|"""(?:[^\\\\]|\\\\.)*?""")',
+        u'(?P<open_string>\'\'\'|""")',
+        u'(?P<string>\'(?:\\\\.|[^\\\\\r\n\'])*\'|"(?:\\\\.|[^\\\\\r\n"])*")',
+        u'(?P<word>[a-zA-Z0-9$_.\u0100-\uffff]+)',
+        u'(?P<op>-{3,}|\\+\\+|--|->|&&|\\|\\||[-+*/%&|^=!<>]=|.)',
+    ]), re.DOTALL | re.UNICODE)
+
+    __OPENINGS = frozenset([u'(', u'{', u'[', u':'])
+    __BLOCK_OPENINGS = frozenset([u'{', u':'])
+    __CLOSINGS = frozenset([u')', u'}', u']', u'end'])
+    __CONTINUING_WORDS = frozenset([u'else', u'and', u'or', u'is', u'end'])
+    __STARTING_OPS = frozenset([u'[', u'++', u'--', u'!'])
+    __OPTIONAL_EXPRESSION_TAKERS = frozenset([u'print', u'return', u'assert', u'>', u','])
+
+    def __init__(self):
+        """Inits attributes of a StatementChunker class."""
+        self.__openings = []
+        self.__closing = None
+
+
+    def is_balanced(self):
+        """Returns whether brackets, blocks, long strings and block comments are all closed."""
+        return not self.__openings and self.__closing is None
+
+
+    def is_in_block(self):
+        """Returns whether a block ('{' or ':') is open, not only brackets of an expression."""
+        return any(an_opening in StatementChunker.__BLOCK_OPENINGS for an_opening in self.__openings)
+
+
+    def scan(self, a_line):
+        """Scans a line and updates the balance.
+
+        Args:
+            a_line: A unicode string of a line.
+        Returns:
+            A list of tuples of a kind and a text of each token in the line.
+        """
+        tokens = []
+        pos = 0
+        if self.__closing:
+            pos = self.__find_closing(a_line, 0)
+            if pos < 0: return tokens
+
+        while pos < len(a_line):
+            a_match = StatementChunker.__TOKEN.match(a_line, pos)
+            kind, text, pos = a_match.lastgroup, a_match.group(), a_match.end()
+            if kind == 'skip': continue
+            if kind == 'long_string': kind = 'string'
+            elif kind == 'open_comment' or kind == 'open_string':
+                self.__closing = u'*/' if kind == 'open_comment' else text
+                pos = self.__find_closing(a_line, pos)
+                if pos < 0: break
+                if kind == 'open_comment': continue
+                kind = 'string'
+            if text in StatementChunker.__OPENINGS: self.__openings.append(text)
+            elif text in StatementChunker.__CLOSINGS and self.__openings: self.__openings.pop()
+            tokens.append((kind, text))
+        return tokens
+
+
+    def __find_closing(self, a_line, pos):
+        """Returns a position after a closing of a long string or a block comment, or -1."""
+        if self.__closing == u'*/':
+            end = a_line.find(u'*/', pos)
+            if end < 0: return -1
+            end += 2
+        else:
+            a_match = re.compile(u'(?:[^\\\\]|\\\\.)*?' + self.__closing, re.DOTALL).match(a_line, pos)
+            if a_match is None: return -1
+            end = a_match.end()
+        self.__closing = None
+        return end
+
+
+    def starts_statement(self, tokens):
+        """Returns whether tokens of a line start a new statement instead of continuing the last one.
+
+        Args:
+            tokens: A list returned by scan().
+        """
+        kind, text = tokens[0]
+        if kind == 'string': return True
+        if kind == 'word': return text not in StatementChunker.__CONTINUING_WORDS
+        if text in StatementChunker.__STARTING_OPS or text.startswith(u'---'): return True
+        return text == u'>' and len(tokens) > 1 and tokens[1][1] == u'>' # A dump statement
+
+
+    def split(self, lines):
+        """Yields chunks of lines which may end top-level statements.
+
+        Args:
+            lines: An iterable of unicode strings of lines (e.g. a file object).
+        Yields:
+            A tuple of a line number where a chunk starts and a unicode string of the chunk.
+        """
+        chunk, first_line, last_token = [], 1, None
+        for line_number, a_line in enumerate(lines, 1):
+            is_balanced = self.is_balanced()
+            tokens = self.scan(a_line)
+            if tokens and chunk and last_token and is_balanced \
+                and last_token[1] not in StatementChunker.__OPTIONAL_EXPRESSION_TAKERS \
+                and self.starts_statement(tokens):
+                yield first_line, u''.join(chunk)
+                chunk, first_line = [], line_number
+            chunk.append(a_line)
+            if tokens: last_token = tokens[-1]
+        if chunk: yield first_line, u''.join(chunk)
+
+
+def main():
+    """Run an example for a StatementChunker class."""
+    code = u'x = 5{km}\nif x > 3{km}\n    print x\nelse: print 0 end\ndef f(a) {\n    return a\n}\n>> f(x)\n>> x\n'
+    for first_line, a_chunk in StatementChunker().split(code.splitlines(True)):
+        print 'line %s: %s' % (first_line, a_chunk.encode('utf-8').replace('\n', '\\n'))
+
+    return Constants.EXIT_SUCCESS
+
+
+if __name__ == '__main__':
+    sys.exit(main())
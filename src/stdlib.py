@@ -2,9 +2,14 @@
 # -*- coding: utf-8 -*-
 
 import sys
+from dateutil.parser import parse
 from constants import Constants
+from source_position import SourcePosition
 from collegue import Collegue
-from function import BuiltInFunction
+from function import BuiltInFunction, DefinedFunction
+from unitx_object import UnitXObject
+from unit import Unit
+from unit_list import UnitList
 
 class Stdlib(Collegue):
     """A built-in(standard) library in UnitX.
@@ -16,7 +21,18 @@ class Stdlib(Collegue):
     def __init__(self):
         """Inits attributes of a Stdlib class. """
         self.funcs = [
-            BuiltInFunction('expect', [['l',None],['r',None]], self.expect)
+            BuiltInFunction('expect', [['l',None],['r',None]], self.expect),
+            BuiltInFunction('asof', [['date',UnitXObject(value=None, varname=None, unit=Unit(), is_none=True)]], self.asof),
+            BuiltInFunction('money', [['on',UnitXObject(value=True, varname=None, unit=Unit())]], self.money),
+            BuiltInFunction('memoize', [['f',None],['size',UnitXObject(value=Constants.MEMO_CACHE_SIZE, varname=None, unit=Unit())]], self.memoize),
+            BuiltInFunction('memo_stats', [['f',None]], self.memo_stats),
+            BuiltInFunction('sum', [['l',None]], self.sum),
+            BuiltInFunction('mean', [['l',None]], self.mean),
+            BuiltInFunction('min', [['l',None]], self.min),
+            BuiltInFunction('max', [['l',None]], self.max),
+            BuiltInFunction('count', [['l',None]], self.count),
+            BuiltInFunction('cumsum', [['l',None]], self.cumsum),
+            BuiltInFunction('dot', [['l',None],['r',None]], self.dot)
         ]
 
 
@@ -37,11 +53,282 @@ class Stdlib(Collegue):
         is_match = l.equals(r).get_value()
         if not is_match:
             msg = Constants.EXPECT_ERR % (l.get_unit_value(), r.get_unit_value())
-            self.mediator.get_parser().notifyErrorListeners(msg, func_obj.token, Exception(msg)) #Bug
+            self.mediator.get_parser().notifyErrorListeners(msg, SourcePosition.to_token(func_obj.pos), Exception(msg)) #Bug
             sys.exit(Constants.EXIT_FAILURE_IN_UNITX)
         return self.mediator.NULL_UNITX_OBJ
 
 
+    def asof(self, args, func_obj):
+        """Selects a date of currency exchange rates for converting currencies.
+
+        A date is like '2016-04-01'. When a date is not given,
+        the latest rates are selected again.
+
+        Args:
+            args: A list of instances of UnitXObject.
+            func_obj: An instance of UnitXObject indicating this function.
+        Returns:
+            An instance of UnitXObject which is an empty.
+        Raises:
+            ValueError: An error occurred by a string which is not a date.
+            IOError: An error occurred by a rate history which doesn't exist.
+        """
+        manager = self.mediator.get_unit_manager()
+        if not args or args[0].is_none:
+            manager.set_as_of(None)
+            return self.mediator.NULL_UNITX_OBJ
+
+        date_str = args[0].get_value()
+        try:
+            a_date = parse(date_str).date()
+        except (ValueError, TypeError, AttributeError):
+            msg = Constants.VALUE_ERR_DATE % date_str
+            self.mediator.get_parser().notifyErrorListeners(msg, SourcePosition.to_token(func_obj.pos), Exception(msg))
+            return self.mediator.NULL_UNITX_OBJ
+        try:
+            manager.set_as_of(a_date)
+        except IOError:
+            msg = Constants.IO_ERR_RATE_HISTORY % manager.history_path
+            self.mediator.get_parser().notifyErrorListeners(msg, SourcePosition.to_token(func_obj.pos), Exception(msg))
+        return self.mediator.NULL_UNITX_OBJ
+
+
+    def money(self, args, func_obj):
+        """Turns a money mode on or off.
+
+        On a money mode, values of currencies are exact Decimals rounded
+        by a quantum of each currency (e.g. 0.01 for USD, 1 for JPY).
+
+        Args:
+            args: A list of instances of UnitXObject.
+            func_obj: An instance of UnitXObject indicating this function.
+        Returns:
+            An instance of UnitXObject which is an empty.
+        """
+        money_mode = True if not args else bool(args[0].get_value())
+        self.mediator.get_unit_manager().set_money_mode(money_mode)
+        return self.mediator.NULL_UNITX_OBJ
+
+
+    def memoize(self, args, func_obj):
+        """Makes a defined function cache its results with a bounded size.
+
+        A result is cached by values of arguments in their canonical units,
+        and a least recently used result is evicted when the cache is full.
+        Only a pure function (e.g. a calculation of units) should be memoized.
+
+        Args:
+            args: A list of instances of UnitXObject.
+            func_obj: An instance of UnitXObject indicating this function.
+        Returns:
+            An instance of UnitXObject which is an empty.
+        Raises:
+            TypeError: An error occurred by an argument which is not a defined function.
+            ValueError: An error occurred by a size which is not a positive int.
+        """
+        a_func = self.__get_defined_function(args[0], func_obj)
+        if a_func is None: return self.mediator.NULL_UNITX_OBJ
+
+        size = args[1].get_value() if len(args) > 1 else Constants.MEMO_CACHE_SIZE
+        if not isinstance(size, int) or isinstance(size, bool) or size <= 0:
+            msg = Constants.VALUE_ERR_CACHE_SIZE % size
+            self.mediator.get_parser().notifyErrorListeners(msg, SourcePosition.to_token(args[1].pos), Exception(msg))
+            return self.mediator.NULL_UNITX_OBJ
+        a_func.memoize(size)
+        return self.mediator.NULL_UNITX_OBJ
+
+
+    def memo_stats(self, args, func_obj):
+        """Returns counters of a cache of a memoized function.
+
+        Args:
+            args: A list of instances of UnitXObject.
+            func_obj: An instance of UnitXObject indicating this function.
+        Returns:
+            A string like 'hits=18 misses=11 size=11/128', or None when it's not memoized.
+        Raises:
+            TypeError: An error occurred by an argument which is not a defined function.
+        """
+        a_func = self.__get_defined_function(args[0], func_obj)
+        if a_func is None or a_func.memo is None: return None
+        return unicode(a_func.memo)
+
+
+    def __get_defined_function(self, unitx_obj, func_obj):
+        """Returns a defined function of an argument, or None with an error."""
+        a_func = unitx_obj.get_value()
+        if isinstance(a_func, DefinedFunction): return a_func
+        given = a_func.name if isinstance(a_func, BuiltInFunction) else unitx_obj.get_unit_value()
+        msg = Constants.TYPE_ERR_NOT_DEFINED_FUNC % (func_obj.varname, given)
+        self.mediator.get_parser().notifyErrorListeners(msg, SourcePosition.to_token(unitx_obj.pos), Exception(msg))
+        return None
+
+
+    def sum(self, args, func_obj):
+        """Returns a sum of a list of numbers in one unit (e.g. sum([1, 2]{km}) is 3{km}).
+
+        Args:
+            args: A list of instances of UnitXObject.
+            func_obj: An instance of UnitXObject indicating this function.
+        Returns:
+            An instance of UnitXObject in the unit of the list.
+        Raises:
+            TypeError: An error occurred by a list which is not numbers in one unit.
+        """
+        a_list = self.__get_unit_list(args[0], func_obj)
+        if a_list is None: return self.mediator.NULL_UNITX_OBJ
+        return UnitXObject(value=a_list.sum(), varname=None, unit=a_list.unit, pos=func_obj.pos)
+
+
+    def mean(self, args, func_obj):
+        """Returns a mean of a non-empty list of numbers in one unit.
+
+        Args:
+            args: A list of instances of UnitXObject.
+            func_obj: An instance of UnitXObject indicating this function.
+        Returns:
+            An instance of UnitXObject in the unit of the list.
+        Raises:
+            TypeError: An error occurred by a list which is not numbers in one unit.
+            ValueError: An error occurred by an empty list.
+        """
+        a_list = self.__get_unit_list(args[0], func_obj, is_empty_error=True)
+        if a_list is None: return self.mediator.NULL_UNITX_OBJ
+        return UnitXObject(value=a_list.mean(), varname=None, unit=a_list.unit, pos=func_obj.pos)
+
+
+    def min(self, args, func_obj):
+        """Returns the minimum of a non-empty list of numbers in one unit.
+
+        Args:
+            args: A list of instances of UnitXObject.
+            func_obj: An instance of UnitXObject indicating this function.
+        Returns:
+            An instance of UnitXObject in the unit of the list.
+        Raises:
+            TypeError: An error occurred by a list which is not numbers in one unit.
+            ValueError: An error occurred by an empty list.
+        """
+        a_list = self.__get_unit_list(args[0], func_obj, is_empty_error=True)
+        if a_list is None: return self.mediator.NULL_UNITX_OBJ
+        return UnitXObject(value=a_list.min(), varname=None, unit=a_list.unit, pos=func_obj.pos)
+
+
+    def max(self, args, func_obj):
+        """Returns the maximum of a non-empty list of numbers in one unit.
+
+        Args:
+            args: A list of instances of UnitXObject.
+            func_obj: An instance of UnitXObject indicating this function.
+        Returns:
+            An instance of UnitXObject in the unit of the list.
+        Raises:
+            TypeError: An error occurred by a list which is not numbers in one unit.
+            ValueError: An error occurred by an empty list.
+        """
+        a_list = self.__get_unit_list(args[0], func_obj, is_empty_error=True)
+        if a_list is None: return self.mediator.NULL_UNITX_OBJ
+        return UnitXObject(value=a_list.max(), varname=None, unit=a_list.unit, pos=func_obj.pos)
+
+
+    def count(self, args, func_obj):
+        """Returns the number of elements of a list of any values.
+
+        Args:
+            args: A list of instances of UnitXObject.
+            func_obj: An instance of UnitXObject indicating this function.
+        Returns:
+            An instance of UnitXObject of an int.
+        Raises:
+            TypeError: An error occurred by a value which is not a list.
+        """
+        values, _ = args[0].get_list_values()
+        if values is None:
+            self.__notify_not_numbers(args[0], func_obj)
+            return self.mediator.NULL_UNITX_OBJ
+        return UnitXObject(value=len(values), varname=None, unit=Unit(), pos=func_obj.pos)
+
+
+    def cumsum(self, args, func_obj):
+        """Returns a list of cumulative sums of a list of numbers in one unit.
+
+        Args:
+            args: A list of instances of UnitXObject.
+            func_obj: An instance of UnitXObject indicating this function.
+        Returns:
+            An instance of UnitXObject of a list in the unit of the list.
+        Raises:
+            TypeError: An error occurred by a list which is not numbers in one unit.
+        """
+        a_list = self.__get_unit_list(args[0], func_obj)
+        if a_list is None: return self.mediator.NULL_UNITX_OBJ
+        a_unit = a_list.unit # Elements share the unit, as elements of a list literal share a unit of the list.
+        sums = [UnitXObject(value=a_value, varname=None, unit=a_unit) for a_value in a_list.cumsum()]
+        return UnitXObject(value=sums, varname=None, unit=Unit(numer=a_unit.numer, denom=a_unit.denom), pos=func_obj.pos)
+
+
+    def dot(self, args, func_obj):
+        """Returns a sum of products of two lists of numbers of the same length.
+
+        A unit of the result is a product of units of the lists (e.g. {km/h} and {h} make {km}).
+
+        Args:
+            args: A list of instances of UnitXObject.
+            func_obj: An instance of UnitXObject indicating this function.
+        Returns:
+            An instance of UnitXObject in the product of units.
+        Raises:
+            TypeError: An error occurred by a list which is not numbers in one unit,
+                or units which can't be multiplied.
+            ValueError: An error occurred by lists of different lengths.
+        """
+        l = self.__get_unit_list(args[0], func_obj)
+        r = self.__get_unit_list(args[1], func_obj) if l is not None else None
+        if r is None: return self.mediator.NULL_UNITX_OBJ
+        if len(l) != len(r):
+            msg = Constants.VALUE_ERR_LIST_LENGTHS % (func_obj.varname, len(l), len(r))
+            self.mediator.get_parser().notifyErrorListeners(msg, SourcePosition.to_token(args[1].pos), Exception(msg))
+            return self.mediator.NULL_UNITX_OBJ
+        a_unit = l.unit.multiply(r.unit, SourcePosition.to_token(func_obj.pos))
+        if a_unit is None: return self.mediator.NULL_UNITX_OBJ
+        return UnitXObject(value=l.dot(r), varname=None, unit=a_unit, pos=func_obj.pos)
+
+
+    def __get_unit_list(self, unitx_obj, func_obj, is_empty_error=False):
+        """Returns a UnitList of a list of numbers in one unit, or None with an error.
+
+        Units of elements are checked once for the whole list, and elements of each unit
+        are converted at once (see UnitXObject.get_list_values()).
+        An element without a unit is in the unit of the list, as 1{km} + 1 is 2{km}.
+        """
+        values, units = unitx_obj.get_list_values()
+        if values is None or not set(map(type, values)) <= UnitXObject.NUMBER_TYPES:
+            self.__notify_not_numbers(unitx_obj, func_obj)
+            return None
+        if len(units) > 1:
+            unit_strs = sorted(Unit(numer=numer, denom=denom).formal_str() for numer, denom in units)
+            msg = Constants.TYPE_ERR_LIST_UNITS % (func_obj.varname, unit_strs[0], unit_strs[1])
+            self.mediator.get_parser().notifyErrorListeners(msg, SourcePosition.to_token(unitx_obj.pos), Exception(msg))
+            return None
+        if is_empty_error and not values:
+            msg = Constants.VALUE_ERR_EMPTY_LIST % func_obj.varname
+            self.mediator.get_parser().notifyErrorListeners(msg, SourcePosition.to_token(unitx_obj.pos), Exception(msg))
+            return None
+        numer, denom = units.pop() if units else (None, None)
+        return UnitList(values, Unit(numer=numer, denom=denom))
+
+
+    def __notify_not_numbers(self, unitx_obj, func_obj):
+        """Reports an argument which is not a list of numbers, with a type of the argument or its element."""
+        values, _ = unitx_obj.get_list_values()
+        if values is None: a_value = unitx_obj.get_value()
+        else: a_value = next(v for v in values if type(v) not in UnitXObject.NUMBER_TYPES)
+        given = 'NULL' if a_value is None else unitx_obj.get_type_string(a_value)
+        msg = Constants.TYPE_ERR_NOT_NUMBERS % (func_obj.varname, given)
+        self.mediator.get_parser().notifyErrorListeners(msg, SourcePosition.to_token(unitx_obj.pos), Exception(msg))
+        return
+
+
     def r(self, args, func_obj):
         """Returns a list indicated by a range of args.
 
@@ -57,7 +344,7 @@ class Stdlib(Collegue):
         is_match = l.get_value() == r.get_value() and l.unit.equals(r.unit)
         if not is_match:
             msg = Constants.EXPECT_ERR % (l.get_unit_value(), r.get_unit_value())
-            self.mediator.get_parser().notifyErrorListeners(msg, func_obj.token, Exception(msg))
+            self.mediator.get_parser().notifyErrorListeners(msg, SourcePosition.to_token(func_obj.pos), Exception(msg))
 
 
     def set_mediator(self, mediator):
@@ -16,15 +16,15 @@ class Unit(Collegue):
         numer: A string indicating a current numer.
         ex_denom: A string indicating a denom of unit which used in the past.
         denom: A string indicating a current denom.
-        token: An instance of Token class indicating the head of a unit statement.
+        pos: An int of SourcePosition indicating the head of a unit statement.
     Examples:
         {MB}, {kg->g}, {m/s}, {km->m}, {km->m/s->h}
         A data structure: { <ex_numer> -> <numer> / <ex_denom> -> <denom> }
     """
 
-    def __init__(self, ex_numer=None, numer=None, ex_denom=None, denom=None, token=None):
+    def __init__(self, ex_numer=None, numer=None, ex_denom=None, denom=None, pos=None):
         """Inits attributes of a Unit class."""
-        self.token = token
+        self.pos = pos
         self.ex_numer = ex_numer
         self.numer = numer
         self.ex_denom = ex_denom
@@ -38,7 +38,10 @@ class Unit(Collegue):
             found_scope = self.mediator.get_scopes().peek().find_scope_of(t)
             if found_scope:
                 unitx_obj = found_scope[t]
-                new_tokens.append(unitx_obj.get_value())
+                value = unitx_obj.get_value()
+                if isinstance(value, int) and not isinstance(value, bool):
+                    value = unicode(value) # A base such as 16 is a name of unit.
+                new_tokens.append(value)
             else:
                 new_tokens.append(t)
         self.ex_numer, self.numer, self.ex_denom, self.denom = new_tokens
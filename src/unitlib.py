@@ -1,91 +1,360 @@
 from dateutil.parser import parse
 import pytz
 import re
-from datetime import datetime
+import time
+import threading
+from datetime import datetime, time as dt_time
+from collections import OrderedDict
+from fractions import Fraction
+from constants import Constants
+from rate_history import RateHistory
+from converter_registry import ConverterRegistry
 
 class UnitLib(object):
     """A class of library for converting a value by units.
 
+    A currency exchange rate is shared by all instances of this class,
+    because the unit table creates some instances of UnitLib.
+    The rate is a snapshot which is only replaced by a refresher thread,
+    so an evaluation keeps using the last good snapshot while downloading.
+    The refresher only publishes a new snapshot and its version, and
+    each UnitManager invalidates its cached criterions on its own thread
+    when it finds a new version.
+
     Attributes:
-        __is_init_rate: a bool
-        __currency_rate:
-        __tz_re:
+        __currency_rate: A dict indicating the last good snapshot of rates.
+        __rate_time: A float indicating when the snapshot was taken.
+        __rate_lock: A lock for starting the refresher only once.
+        __rate_ready: An event set when the first download finished.
+        __refresher: A daemon thread refreshing the snapshot.
+        __rate_version: An int incremented when the snapshot is changed.
+        __histories: A dict from a path to an instance of RateHistory opened by asof().
+        __radix_formats: A dict of functions formatting an int by a base.
+        __tz_cache: A dict of timezone objects cached per unit token.
+        __tz_names: A dict from a unit token to a name of pytz.
+        __tz_offsets: An OrderedDict of UTC offsets cached per timezone and day,
+            which keeps the recently used Constants.TZ_OFFSET_CACHE_SIZE offsets.
+        __tz_re: A regular expression for finding times.
     """
 
+    __currency_rate = {}
+    __rate_time = None
+    __rate_lock = threading.Lock()
+    __rate_ready = threading.Event()
+    __refresher = None
+    __rate_version = 0
+    __histories = {}
+    __radix_formats = {
+        2: lambda n: unicode(bin(n)[2:]),
+        8: lambda n: u'%o' % n,
+        10: lambda n: u'%d' % n,
+        16: lambda n: u'%x' % n,
+    }
+    __tz_cache = {}
+    __tz_names = {}
+    __tz_offsets = OrderedDict()
+
     def __init__(self):
         """Inits attributes of a UnitLib class."""
-        self.__is_init_rate = False
-        self.__currency_rate = {}
         self.__tz_re = re.compile('(\d+):(\d+)') # For a timezone() function
 
 
     def base(self, value, unit):
-        """Returns a value converted by base 2, 8, 10, or 16.
+        """Returns a value converted from base <ex_numer> to base <numer>.
+
+        Bases are 2, 8, 10, or 16. Digits of a value are read by base <ex_numer>,
+        and a value of base 10 becomes an int, and the others become a string.
+        A list of values is converted in one call.
 
         Args:
-            value: A int value in UnitXObject. (a value of base 2,8,10,16)
+            value: An int or a string, or a list of them.
             unit: An instance of Unit in UnitXObject.
         Returns:
-            A float which is a currency exchange rate.
+            An int or a string, or a list of them.
+        Raises:
+            ValueError: An error occurred by digits which are not in base <ex_numer>.
         """
-        return value * 2
+        if not unit.numer or not unit.ex_numer:
+            return value
+        from_base, to_base = int(unit.ex_numer), int(unit.numer)
+        to_digits = UnitLib.__radix_formats[to_base]
+
+        def convert(v):
+            if v is None: return v
+            if isinstance(v, int) and from_base == 10:
+                number = v
+            else:
+                try: number = int(unicode(v).strip(), from_base)
+                except ValueError: raise ValueError(Constants.VALUE_ERR_BASE % (v, from_base))
+            if to_base == 10: return number
+            sign = u'-' if number < 0 else u''
+            return sign + to_digits(abs(number))
 
+        if isinstance(value, list):
+            return [convert(v) for v in value]
+        return convert(value)
 
-    def timezone(self, line, unit):
+
+    def __get_tz(self, tz_token):
+        """Returns a timezone object indicated by a unit token.
+
+        Timezone objects are cached per token, and a token is resolved
+        by a table from the unit style ('Asia_Tokyo') to the pytz style ('Asia/Tokyo').
+
+        Args:
+            tz_token: A string of a timezone unit such as 'Asia_Tokyo'.
+        Returns:
+            An instance of a timezone of pytz.
         """
+        if tz_token in UnitLib.__tz_cache:
+            return UnitLib.__tz_cache[tz_token]
+        if not UnitLib.__tz_names:
+            UnitLib.__tz_names = dict((name.replace('/', '_'), name) for name in pytz.all_timezones)
+        tz_name = UnitLib.__tz_names.get(tz_token, '/'.join(tz_token.split('_')))
+        a_tz = pytz.timezone(tz_name)
+        UnitLib.__tz_cache[tz_token] = a_tz
+        return a_tz
+
+
+    def __get_utc_offset(self, tz_token, a_date):
+        """Returns an UTC offset of a timezone on a date as minutes.
+
+        Offsets are cached in a table per day, because an offset changes
+        only on a daylight saving time. The table keeps only recently used offsets.
+
+        Args:
+            tz_token: A string of a timezone unit such as 'Asia_Tokyo'.
+            a_date: An instance of date. An offset at noon of the date is used.
+        Returns:
+            An int indicating minutes of the UTC offset.
+        """
+        key = (tz_token, a_date)
+        offset = UnitLib.__tz_offsets.pop(key, None)
+        if offset is None:
+            a_tz = self.__get_tz(tz_token)
+            delta = a_tz.localize(datetime.combine(a_date, dt_time(12))).utcoffset()
+            offset = (delta.days * 24 * 60 * 60 + delta.seconds) // 60
+            if len(UnitLib.__tz_offsets) >= Constants.TZ_OFFSET_CACHE_SIZE:
+                UnitLib.__tz_offsets.popitem(last=False) # The least recently used
+        UnitLib.__tz_offsets[key] = offset
+        return offset
+
+
+    def timezone(self, value, unit):
+        """Returns a value whose times of today are converted from a timezone to a timezone.
+
+        Args:
+            value: A string or a list of strings including times like '16:10'.
+            unit: An instance of Unit in UnitXObject. (ex_numer -> numer)
+        Returns:
+            A string or a list of strings whose times are converted.
+        Raises:
+            ValueError: An error occurred by an hour or a minute out of range.
         """
         if not unit.numer or not unit.ex_numer:
-            return line
-        ex_tzline = '/'.join(unit.ex_numer.split('_'))
-        tzline = '/'.join(unit.numer.split('_'))
-
-        for m in self.__tz_re.finditer(line):
-            ex_time = m.group()
-            hour, minute = m.groups()
-            if not hour.isdigit() or not minute.isdigit():
-                return line
-            date = datetime.now(pytz.timezone(ex_tzline))
-            date = date.replace(hour = int(hour), minute = int(minute))
-            date = date.astimezone(pytz.timezone(tzline))
-            line = line.replace(ex_time, date.strftime('%H:%M'))
-        
-        return line
-
-
-    def __download_rate(self):
-        """Downloads and installs a currency exchange rate
-            from a web site to database(self.__currency_rate).
+            return value
+        return self.shift_times(value, unit.ex_numer, unit.numer, datetime.utcnow().date())
+
+
+    def shift_times(self, value, ex_tz_token, tz_token, a_date):
+        """Returns a value whose times of a date are converted from a timezone to a timezone.
+
+        All matches of 'HH:MM' are converted in one pass by an offset
+        which is computed once for a pair of the timezones.
+
+        Args:
+            value: A string or a list of strings including times like '16:10'.
+            ex_tz_token: A string of a timezone unit of the times.
+            tz_token: A string of a timezone unit converted to.
+            a_date: An instance of date deciding offsets of daylight saving times.
+        Returns:
+            A string or a list of strings whose times are converted.
+        Raises:
+            ValueError: An error occurred by an hour or a minute out of range.
+        """
+        shift = self.__get_utc_offset(tz_token, a_date) - self.__get_utc_offset(ex_tz_token, a_date)
+
+        def convert(m):
+            hour, minute = int(m.group(1)), int(m.group(2))
+            if hour > 23: raise ValueError(Constants.VALUE_ERR_HOUR % m.group())
+            if minute > 59: raise ValueError(Constants.VALUE_ERR_MINUTE % m.group())
+            total = (hour * 60 + minute + shift) % (24 * 60)
+            return '%02d:%02d' % (total // 60, total % 60)
+
+        if isinstance(value, list):
+            return [self.__tz_re.sub(convert, line) for line in value]
+        return self.__tz_re.sub(convert, value)
+
+
+    @classmethod
+    def __download_rate(cls):
+        """Downloads a currency exchange rate from a web site.
 
         The name of website is "European Central Bank"(http://www.ecb.europa.eu/).
         There is a currency exchange rate on the website.
+
+        Returns:
+            A dict of currency exchange rates, or None when downloading failed.
         """
-        if self.__is_init_rate: return
         try:
             import requests
             from xml.etree import ElementTree as ET
-            r = requests.get('http://www.ecb.int/stats/eurofxref/eurofxref-daily.xml', stream=True)
+            r = requests.get(Constants.RATE_URL, stream=True)
             tree = ET.parse(r.raw)
             root = tree.getroot()
             namespaces = {'ex': 'http://www.ecb.int/vocabulary/2002-08-01/eurofxref'}
+            new_rate = {}
             for cube in root.findall('.//ex:Cube[@currency]', namespaces=namespaces):
-                rate = float(cube.attrib['rate'])
-                self.__currency_rate[cube.attrib['currency']] = rate
-        except: pass
-        self.__is_init_rate = True
+                new_rate[cube.attrib['currency']] = float(cube.attrib['rate'])
+            return new_rate
+        except: return None
+
+
+    @classmethod
+    def update_rate(cls, new_rate):
+        """Replaces the snapshot of currency exchange rates atomically,
+        and publishes a new version when a rate is changed.
+
+        The version is incremented after the snapshot is replaced,
+        so a reader finding the new version always reads the new snapshot.
+
+        Args:
+            new_rate: A dict of currency exchange rates.
+        """
+        is_changed = new_rate != UnitLib.__currency_rate
+        UnitLib.__currency_rate = new_rate
+        UnitLib.__rate_time = time.time()
+        if is_changed: UnitLib.__rate_version += 1
+        return
+
+
+    @classmethod
+    def refresh_rate(cls):
+        """Downloads a currency exchange rate once, and publishes it when downloading succeeded."""
+        new_rate = cls.__download_rate()
+        if new_rate: cls.update_rate(new_rate)
+        UnitLib.__rate_ready.set()
         return
 
 
-    def rate(self, line):
-        """Returns a currency exchange rate from a database(self.__currency_rate).
+    @classmethod
+    def __refresh_loop(cls, interval):
+        """Downloads a currency exchange rate repeatedly on the refresher thread.
+
+        Args:
+            interval: A float indicating seconds between downloads.
+        """
+        while True:
+            cls.refresh_rate()
+            time.sleep(interval)
+
+
+    @classmethod
+    def start_refresher(cls, interval=Constants.RATE_REFRESH_INTERVAL):
+        """Starts a daemon thread refreshing currency exchange rates.
+
+        It does nothing, if the refresher has already started.
+
+        Args:
+            interval: A float indicating seconds between downloads.
+        """
+        with UnitLib.__rate_lock:
+            if UnitLib.__refresher: return
+            UnitLib.__refresher = threading.Thread(target=cls.__refresh_loop, args=(interval,))
+            UnitLib.__refresher.daemon = True
+            UnitLib.__refresher.start()
+        return
+
+
+    @classmethod
+    def get_rate_version(cls):
+        """Returns a version of the snapshot of currency exchange rates.
+
+        Returns:
+            An int which is changed whenever a rate is changed.
+        """
+        return UnitLib.__rate_version
+
+
+    @classmethod
+    def get_rate_age(cls):
+        """Returns an age of the snapshot of currency exchange rates.
+
+        Returns:
+            A float indicating seconds since the snapshot was taken,
+            or None when there is no snapshot yet.
+        """
+        if UnitLib.__rate_time is None: return None
+        return time.time() - UnitLib.__rate_time
+
+
+    @classmethod
+    def open_history(cls, path):
+        """Returns a rate history of a path, which is opened once and shared by interpreters.
+
+        Args:
+            path: A string indicating a path of a rate history.
+        Returns:
+            An instance of RateHistory.
+        Raises:
+            IOError: An error occurred by a rate history which doesn't exist.
+        """
+        if path not in UnitLib.__histories:
+            UnitLib.__histories[path] = RateHistory(path)
+        return UnitLib.__histories[path]
+
+
+    def rate(self, line, as_of=None):
+        """Returns a currency exchange rate from the last good snapshot,
+        or from a rate history when an as-of date is selected.
+
+        The first call starts the refresher and waits for the first download
+        at most Constants.RATE_FIRST_WAIT seconds. A script never waits after that.
 
         Args:
             line: A string of UnitXObject's value.
+            as_of: None, or a pair of an instance of RateHistory and a date.
         Returns:
             A float which is a currency exchange rate.
+        Raises:
+            ValueError: An error occurred by a rate history without the currency
+                or the date (e.g. before the first date).
         """
-        self.__download_rate()
-        if line in self.__currency_rate:
-            return self.__currency_rate[line]
+        if as_of is not None:
+            a_history, a_date = as_of
+            a_rate = a_history.rate(line, a_date)
+            if a_rate is None: raise ValueError(Constants.VALUE_ERR_NO_RATE % (line, a_date.isoformat()))
+            return a_rate
+
+        if not UnitLib.__rate_ready.is_set():
+            UnitLib.start_refresher()
+            UnitLib.__rate_ready.wait(Constants.RATE_FIRST_WAIT)
+        currency_rate = UnitLib.__currency_rate
+        if line in currency_rate:
+            return currency_rate[line]
         else:
             return 1.0
 
+
+    def currency_criterion(self, unit_str, as_of=None):
+        """Returns a criterion of a currency for the unit table.
+
+        Args:
+            unit_str: A string of a currency such as 'USD'.
+            as_of: None, or a pair of an instance of RateHistory and a date.
+        Returns:
+            A Fraction which is an amount of EUR per the currency.
+            A rate is read as a decimal string which is published.
+        Raises:
+            ValueError: An error occurred by a rate history without the rate.
+        """
+        return 1 / Fraction(repr(self.rate(unit_str, as_of)))
+
+
+#
+# Registers converters referenced by name from the unit table.
+#
+__unitlib = UnitLib()
+ConverterRegistry.register('base', __unitlib.base)
+ConverterRegistry.register('timezone', __unitlib.timezone)
+ConverterRegistry.register_criterion('rate', __unitlib.currency_criterion)
@@ -1,12 +1,24 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 
+import os
 import sys
+import ctypes
+import threading
+import Queue
 import prettyprint
+from contextlib import contextmanager
 from constants import Constants
 
 class Util(object):
-    """A class which is compiled versatile utility functions."""
+    """A class which is compiled versatile utility functions.
+
+    Attributes:
+        __session: A tuple of a thread with a large stack, a queue of calls to it
+            and a pipe written after each call, which is started by large_stack_session(), or None.
+    """
+
+    __session = None
 
     @classmethod
     def dump(self, an_obj):
@@ -34,6 +46,108 @@ class Util(object):
         if not is_test: print content
         return
 
+    @classmethod
+    def run_on_large_stack(self, func, *args):
+        """Runs a function on a thread with a large stack, and returns its result.
+
+        An evaluation of a recursive function in UnitX uses Python frames on each level,
+        so it's run on a stack of Constants.CALL_STACK_SIZE bytes with a recursion limit
+        of Constants.CALL_RECURSION_LIMIT frames instead of the main stack.
+        The thread of large_stack_session() is used in its block,
+        or else a thread is started for this call.
+        An exception (including SystemExit) is raised again on the caller,
+        and KeyboardInterrupt on the caller is raised on the thread.
+
+        Args:
+            func: A function which is run.
+            args: Arguments of the function.
+        Returns:
+            A result of the function.
+        """
+        if self.__session is None:
+            with self.large_stack_session():
+                return self.run_on_large_stack(func, *args)
+
+        a_thread, calls, (read_fd, _) = self.__session
+        if threading.current_thread() is a_thread: return func(*args)
+        results, is_started, is_interrupted = [], [], False
+        limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(Constants.CALL_RECURSION_LIMIT)
+        try:
+            calls.put((func, args, results, is_started))
+            while True:
+                try:
+                    # A read of a pipe returns at once after the call unlike a wait of a lock with a timeout,
+                    # and it can be interrupted unlike a wait without a timeout.
+                    os.read(read_fd, 1)
+                    if results: break # Or else, it's a byte of the last call written twice by an interrupt.
+                except KeyboardInterrupt:
+                    if is_started and not results and not is_interrupted:
+                        is_interrupted = True
+                        ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_long(a_thread.ident), ctypes.py_object(KeyboardInterrupt))
+        finally:
+            sys.setrecursionlimit(limit)
+
+        is_succeeded, a_result = results[0]
+        if is_succeeded: return a_result
+        raise a_result[0], a_result[1], a_result[2]
+
+
+    @classmethod
+    @contextmanager
+    def large_stack_session(self):
+        """Runs calls of run_on_large_stack() in a block on one thread with a large stack.
+
+        The thread is started at the beginning of the outermost block and stopped at its end,
+        so a thread isn't started on each statement of the stream mode or each input of the intaractive mode.
+        """
+        if self.__session is not None:
+            yield
+            return
+
+        calls, (read_fd, write_fd) = Queue.Queue(), os.pipe()
+        stack_size = threading.stack_size()
+        threading.stack_size(Constants.CALL_STACK_SIZE)
+        try:
+            a_thread = threading.Thread(target=self.__serve, args=(calls, write_fd))
+            a_thread.daemon = True
+            a_thread.start()
+        finally:
+            threading.stack_size(stack_size)
+
+        self.__session = (a_thread, calls, (read_fd, write_fd))
+        try:
+            yield
+        finally:
+            self.__session = None
+            calls.put(None)
+            a_thread.join()
+            os.close(read_fd)
+            os.close(write_fd)
+
+
+    @classmethod
+    def __serve(self, calls, write_fd):
+        """Runs calls from a queue until None is put, and writes a byte to a pipe after each call.
+
+        KeyboardInterrupt from the caller is raised only once in a call after it's started,
+        and it may be raised just after the call, so a byte may be written twice.
+        """
+        while True:
+            a_call = None
+            try:
+                a_call = calls.get()
+                if a_call is None: return
+                func, args, results, is_started = a_call
+                is_started.append(True)
+                results.append((True, func(*args)))
+                os.write(write_fd, '.')
+            except BaseException:
+                if a_call is None: continue
+                if not a_call[2]: a_call[2].append((False, sys.exc_info()))
+                os.write(write_fd, '.')
+
+
     @classmethod
     def filter_to_white(self, string):
         """Filters a string line to whitespace.
@@ -81,6 +195,9 @@ def main():
     print "|%s|" % code
     print "|%s|" % Util.filter_to_white(code)
 
+    def depth(n): return 0 if n == 0 else depth(n - 1) + 1
+    print Util.run_on_large_stack(depth, 100000)
+
     return Constants.EXIT_SUCCESS
 
 
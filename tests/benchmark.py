@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""A benchmark of parsing and lexing the demo and test codes.
+
+Each mode runs on a new process, because DFAs of the parser are shared
+by all parsers on a process, and a mode must not warm them for another mode.
+Lexers are compared on a large input made of all codes.
+A loop like demo/demo_0.unit and straight-line statements are executed
+with and without the optimizer (constant folding, sharing values of pure expressions and inlining).
+Aggregate built-in functions (e.g. sum()) reduce a long list of numbers in a unit.
+
+Usage:
+    $ python tests/benchmark.py
+"""
+
+import sys
+import os
+import time
+import subprocess
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')) # The root of the repository
+from antlr4.InputStream import InputStream
+from antlr4.CommonTokenStream import CommonTokenStream
+from antlr4.atn.PredictionMode import PredictionMode
+from unitx.example import Example
+from unitx.UnitXLexer import UnitXLexer
+from unitx.regex_lexer import RegexLexer
+from unitx.unitx_object import UnitXObject
+from unitx.unit import Unit
+from unitx.constants import Constants
+
+REPEAT = 3
+MODES = ['ll', 'sll-ll', 'pratt']
+LEXERS = [('antlr', UnitXLexer), ('regex', RegexLexer)]
+LARGE_INPUT_TIMES = 20 # A large input is all codes repeated
+STARTUP_CODE = u'x = 5{km}\nprint x{km->m}\n' # A code parsed just after a process starts
+LOOP_TIMES = 2000
+LOOP_CODE = u"""飛行機代 = 10{万} * 2
+保険料 = 20{万}
+def twice(x) {
+    return x * 2
+}
+rep i,%s {
+    学校代 = 8{万} * i
+    計 = 飛行機代 + 保険料 + twice(保険料) + 学校代
+    比 = (飛行機代 * 3 + 保険料) / (飛行機代 * 3 + 保険料 + 学校代)
+}
+""" % LOOP_TIMES
+STRAIGHT_LINES = 5000
+STRAIGHT_CODE = u'x = 0{km}\n' + u''.join(u'x = x + %s{km}\n' % i for i in range(STRAIGHT_LINES)) # Each line runs once
+AGGREGATE_LENGTH = 10 ** 6
+AGGREGATES = ['sum', 'mean', 'min', 'max', 'count', 'cumsum', 'dot']
+
+
+def get_codes():
+    """Returns a list of paths of correct codes in demo/ and tests/."""
+    paths = []
+    for a_dir in ['demo', 'tests']:
+        for filename in sorted(os.listdir(a_dir)):
+            name, ext = os.path.splitext(filename)
+            if ext == '.unit' and 'err' not in name:
+                paths.append(os.path.join(a_dir, filename))
+    return paths
+
+
+def parse_ll(cmd, a_stream):
+    """Parses a stream only in the full LL prediction like before."""
+    cmd.parser.setTokenStream(CommonTokenStream(UnitXLexer(a_stream)))
+    cmd.parser._interp.predictionMode = PredictionMode.LL
+    return cmd.parser.program()
+
+
+def parse_sll_ll(cmd, a_stream):
+    """Parses a stream in the SLL prediction, and in the LL prediction when it fails."""
+    return cmd.build_tree(a_stream)
+
+
+def parse_pratt(cmd, a_stream):
+    """Parses a stream by PrattParser, and by UnitXParser when it fails."""
+    return cmd.build_tree(a_stream)
+
+
+def run(mode):
+    """Prints seconds of parsing all codes on a mode."""
+    parse = {'ll': parse_ll, 'sll-ll': parse_sll_ll, 'pratt': parse_pratt}[mode]
+    parser_name = Constants.PARSER_PRATT if mode == 'pratt' else Constants.PARSER_ANTLR
+    start = time.time()
+    cmd = Example(is_intaractive_run=False, parser_name=parser_name)
+    cmd.parser._listeners = [] # Some demo codes have syntax errors.
+    parse(cmd, InputStream(STARTUP_CODE))
+    startup = time.time() - start
+    codes = [open(a_path, 'r').read().decode('utf-8') for a_path in get_codes()]
+
+    start = time.time()
+    for a_code in codes:
+        parse(cmd, InputStream(a_code))
+    first = time.time() - start
+
+    start = time.time()
+    for _ in range(REPEAT):
+        for a_code in codes:
+            parse(cmd, InputStream(a_code))
+    warm = (time.time() - start) / REPEAT
+
+    print '%-8s startup: %.3fs  first: %.3fs  warm: %.3fs' % (mode, startup, first, warm)
+
+
+def run_lexers():
+    """Prints seconds of lexing a large input made of all codes on each lexer."""
+    code = u'\n'.join(open(a_path, 'r').read().decode('utf-8') for a_path in get_codes()) * LARGE_INPUT_TIMES
+    print 'Lexing %s chars' % len(code)
+    for name, a_lexer_class in LEXERS:
+        seconds = []
+        for _ in range(2): # The first time also warms DFAs of UnitXLexer.
+            start = time.time()
+            token_stream = CommonTokenStream(a_lexer_class(InputStream(code)))
+            token_stream.fill()
+            seconds.append(time.time() - start)
+        print '%-8s %s tokens  first: %.3fs  warm: %.3fs' % (name, len(token_stream.tokens), seconds[0], seconds[1])
+
+
+def run_optimizer(is_enabled):
+    """Prints seconds of executing a loop and straight-line statements with or without the optimizer."""
+    cmd = Example(is_intaractive_run=False)
+    cmd.visitor.get_constant_folder().is_enabled = is_enabled
+    cmd.visitor.get_optimizer().is_enabled = is_enabled
+    cmd.visitor.get_inliner().is_enabled = is_enabled
+    cmd.visitor.get_errlistener().set_codepath('<benchmark>')
+    for a_code, label in [(LOOP_CODE, '%s iterations' % LOOP_TIMES), (STRAIGHT_CODE, '%s lines' % STRAIGHT_LINES)]:
+        a_tree = cmd.build_tree(InputStream(a_code))
+        start = time.time()
+        cmd.visitor.visit(a_tree)
+        print 'optimizer %-4s %s: %.3fs' % ('on' if is_enabled else 'off', label, time.time() - start)
+
+
+def run_aggregates():
+    """Prints seconds of each aggregate built-in function on a long list in a unit."""
+    cmd = Example(is_intaractive_run=False)
+    a_unit = Unit(numer=u'km')
+    elements = [UnitXObject(value=i % 100, varname=None, unit=a_unit) for i in xrange(AGGREGATE_LENGTH)]
+    a_list = UnitXObject(value=elements, varname=None, unit=Unit(ex_numer=u'km', numer=u'm'))
+    weights = UnitXObject(value=[UnitXObject(value=2, varname=None, unit=Unit())] * AGGREGATE_LENGTH, varname=None, unit=Unit())
+    funcs = dict((a_func.name, a_func) for a_func in cmd.visitor.stdlib.funcs)
+    print 'Aggregating %s numbers' % AGGREGATE_LENGTH
+    for name in AGGREGATES:
+        func_obj = UnitXObject(value=funcs[name], varname=name, unit=Unit())
+        args = [a_list, weights] if name == 'dot' else [a_list]
+        start = time.time()
+        funcs[name].func_p(args, func_obj)
+        print '%-8s %.3fs' % (name, time.time() - start)
+
+
+def main(argv):
+    if len(argv) > 1:
+        if argv[1] == 'lexers': run_lexers()
+        elif argv[1] == 'optimizer': run_optimizer(argv[2] == 'on')
+        elif argv[1] == 'aggregates': run_aggregates()
+        else: run(argv[1])
+        return Constants.EXIT_SUCCESS
+
+    print '%s codes in demo/ and tests/' % len(get_codes())
+    for mode in MODES:
+        subprocess.call([sys.executable, argv[0], mode])
+    subprocess.call([sys.executable, argv[0], 'lexers'])
+    for a_switch in ['off', 'on']:
+        subprocess.call([sys.executable, argv[0], 'optimizer', a_switch])
+    subprocess.call([sys.executable, argv[0], 'aggregates'])
+    return Constants.EXIT_SUCCESS
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
@@ -3,10 +3,36 @@
 
 import sys
 import os
+import gc
+import shutil
+import tempfile
+import weakref
+import threading
 import unittest
 import subprocess
+from fractions import Fraction
+from StringIO import StringIO
+from decimal import Decimal
+from datetime import date
+from antlr4.InputStream import InputStream
+from antlr4.CommonTokenStream import CommonTokenStream
+from antlr4.tree.Tree import TerminalNode
 from unitx.example import Example
 from unitx.constants import Constants
+from unitx.UnitXLexer import UnitXLexer
+from unitx.UnitXParser import UnitXParser
+from unitx.pratt_parser import PrattParser
+from unitx.regex_lexer import RegexLexer
+from unitx.unitlib import UnitLib
+from unitx.unit import Unit
+from unitx.unitx_object import UnitXObject
+from unitx.rate_history import RateHistory
+from unitx.converter_registry import ConverterRegistry
+from unitx.parse_cache import ParseCache
+from unitx.parser_snapshot import ParserSnapshot
+from unitx.collapsing_parser import CollapsingParser
+from unitx.util import Util
+from unitx.context_linker import ContextLinker
 
 class Tester(unittest.TestCase):
     """ """
@@ -27,12 +53,12 @@ class Tester(unittest.TestCase):
     def test_error_codes(self):
         for a_code in self.err_codes:
             print 'Checking "%s"(ERROR SOURCE) on intaractive mode' % a_code
-            p = subprocess.Popen(["python","unitx/example.py"], stdin=open(a_code, 'r'), stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            p = subprocess.Popen(["python","unitx/example.py","--cache-dir",self.cache_dir], stdin=open(a_code, 'r'), stdout=subprocess.PIPE, stderr=subprocess.PIPE)
             exit_status = p.wait()
             self.__check_a_bug(exit_status)
 
             print 'Checking "%s"(ERROR SOURCE) on IO mode' % a_code
-            p = subprocess.Popen(["python","unitx/example.py", a_code], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            p = subprocess.Popen(["python","unitx/example.py","--cache-dir",self.cache_dir, a_code], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
             exit_status = p.wait()
             self.__check_a_bug(exit_status)
 
@@ -46,18 +72,401 @@ class Tester(unittest.TestCase):
                 for line in rf:
                     self.cmd.talk(line)
             print 'Checking "%s"(CORRECT SOURCE) on IO mode' % a_code
-            self.cmd = Example(is_intaractive_run=False)
+            self.cmd = Example(is_intaractive_run=False, cache_dir=self.cache_dir)
             self.cmd.visitor.is_test = True
             self.cmd.eat_code(a_code)
 
+            print 'Checking "%s"(CORRECT SOURCE) on IO mode by statements' % a_code
+            self.cmd = Example(is_intaractive_run=False)
+            self.cmd.visitor.is_test = True
+            self.cmd.eat_stream(a_code)
+
+            print 'Checking "%s"(CORRECT SOURCE) on the check mode' % a_code
+            self.cmd = Example(is_intaractive_run=False)
+            self.assertTrue(self.cmd.check_code(a_code))
+
             print 'Checking "%s"(CORRECT SOURCE) on String mode for the web' % a_code
             self.cmd = Example(is_intaractive_run=False)
             self.cmd.visitor.is_test = True
             with open(a_code, 'r') as rf:
                 self.cmd.eat_string(rf.read())
     
+    def test_pratt_parser(self):
+        codes = []
+        for a_code in self.test_codes:
+            with open(a_code, 'r') as rf:
+                codes.append((a_code, rf.read().decode('utf-8')))
+        # A unit or arguments ending a condition are ambiguous with the statement after it.
+        for a_code in [u'if (x) { y }', u'if x { y } else { z }', u'rep i,[1,2] { i }', u'rep i,5 { i } x',
+                       u'if x {km->m} y', u'if (f(a{km})) {y}', u'if x {y} (1)', u'if x (1)\nif a {b}\nc',
+                       u'rep i,5 rep j,5 {j}', u'if a if b {c} else {d}']:
+            codes.append((repr(a_code), a_code))
+
+        for name, code in codes:
+            print 'Checking "%s"(CORRECT SOURCE) on PrattParser' % name
+            parser = CollapsingParser(CommonTokenStream(UnitXLexer(InputStream(code))))
+            parser._listeners = []
+            expected_tree = parser.program()
+            self.assertEqual(parser._syntaxErrors, 0)
+            a_tree = PrattParser(parser).parse(CommonTokenStream(UnitXLexer(InputStream(code))))
+            self.assertEqual(a_tree.toStringTree(recog=parser), expected_tree.toStringTree(recog=parser))
+            self.assertEqual(a_tree.stop.tokenIndex, expected_tree.stop.tokenIndex)
+
+
+    def test_collapsing_parser(self):
+        for a_code in self.test_codes:
+            print 'Checking "%s"(CORRECT SOURCE) on CollapsingParser' % a_code
+            with open(a_code, 'r') as rf:
+                code = rf.read().decode('utf-8')
+            sizes, texts = [], []
+            for a_class in [UnitXParser, CollapsingParser]:
+                parser = a_class(CommonTokenStream(UnitXLexer(InputStream(code))))
+                parser._listeners = []
+                a_tree = parser.program()
+                size, nodes = 0, [a_tree]
+                while nodes:
+                    a_node = nodes.pop()
+                    size += 1
+                    if isinstance(a_node, TerminalNode): continue
+                    for a_child in a_node.getChildren():
+                        self.assertTrue(a_child.parentCtx is a_node)
+                    if a_class is CollapsingParser:
+                        self.assertFalse(isinstance(a_node, CollapsingParser.TIER_CONTEXTS) and a_node.getChildCount() == 1)
+                    nodes.extend(a_node.getChildren())
+                sizes.append(size)
+                texts.append(a_tree.getText())
+            self.assertEqual(texts[0], texts[1])
+            self.assertLess(sizes[1], sizes[0])
+
+
+    def test_regex_lexer(self):
+        reused_lexers = [UnitXLexer(None), RegexLexer()] # Reset for each code like Example
+        for a_code in self.test_codes + self.err_codes:
+            print 'Checking "%s" on RegexLexer' % a_code
+            with open(a_code, 'r') as rf:
+                code = rf.read().decode('utf-8')
+            a_lexers = [UnitXLexer(InputStream(code)), RegexLexer(InputStream(code))]
+            for a_lexer in reused_lexers:
+                a_lexer.inputStream = InputStream(code)
+                a_lexers.append(a_lexer)
+            token_lists = []
+            for a_lexer in a_lexers:
+                token_stream = CommonTokenStream(a_lexer)
+                token_stream.fill()
+                token_lists.append([(t.type, t.channel, t.start, t.stop, t.line, t.column, t.text) for t in token_stream.tokens])
+            for a_token_list in token_lists[1:]:
+                self.assertEqual(a_token_list, token_lists[0])
+
+
+    def __publish_rate(self, a_rate):
+        """Publishes currency exchange rates by a stub of the downloader."""
+        download = UnitLib.__dict__['_UnitLib__download_rate']
+        UnitLib._UnitLib__download_rate = classmethod(lambda cls: a_rate)
+        try:
+            UnitLib.refresh_rate()
+        finally:
+            UnitLib._UnitLib__download_rate = download
+
+
+    def test_rate_refresh(self):
+        print 'Checking that new currency exchange rates invalidate cached criterions'
+        old_rate = UnitLib._UnitLib__currency_rate
+        try:
+            manager = Example(is_intaractive_run=False).visitor.get_unit_manager()
+            self.__publish_rate({'USD': 1.25, 'JPY': 125.0})
+            self.assertEqual(manager.get_criterion(u'USD', None), Fraction(4, 5))
+            self.assertEqual(manager.get_criterion(u'JPY', None), Fraction(1, 125))
+
+            self.__publish_rate({'USD': 1.6, 'JPY': 125.0})
+            self.assertEqual(manager.get_criterion(u'USD', None), Fraction(5, 8))
+
+            version = UnitLib.get_rate_version()
+            self.__publish_rate({'USD': 1.6, 'JPY': 125.0}) # The same rates
+            self.assertEqual(UnitLib.get_rate_version(), version)
+        finally:
+            UnitLib.update_rate(old_rate)
+
+
+    def test_money_conversion(self):
+        print 'Checking conversions between currencies on a money mode'
+        rates = {u'USD': '1.25', u'JPY': '125', u'GBP': '0.8', u'KRW': '1234.5'} # 1{USD} is 100{JPY}
+        criterion = ConverterRegistry.get_criterion('rate')
+        ConverterRegistry.register_criterion('rate', lambda unit_str, as_of=None: 1 / Fraction(rates[unit_str]))
+        try:
+            self.cmd = Example(is_intaractive_run=False)
+            self.cmd.visitor.is_test = True
+            manager = self.cmd.visitor.get_unit_manager()
+            manager.set_money_mode(True)
+            self.assertEqual(manager.get_money_factor(u'USD', u'JPY', None), (100, 1))
+            self.assertEqual(manager.get_money_factor(u'JPY', u'USD', None), (1, 1)) # Cents per yen
+            self.assertEqual(manager.get_money_factor(u'GBP', u'KRW', None), (12345, 8)) # 1543.125 won per pound
+            self.cmd.eat_string('\n'.join([
+                'money()',
+                'expect(1.23{USD->JPY}, 123{JPY})',
+                'expect(150{JPY->USD}, 1.5{USD})',
+                'expect(1.005{USD->JPY}, 101{JPY})', # 100.5 yen
+                'expect(0.5{JPY->USD}, 0.01{USD})', # A half cent is rounded away from zero
+                'expect(1.5{JPY->USD}, 0.02{USD})',
+                'expect(0.4{JPY->USD}, 0{USD})',
+                'expect(1{GBP->KRW}, 1543{KRW})', # 1543.125 won
+            ]))
+            minus_half = UnitXObject(value=Decimal('-0.5'), varname=None, unit=Unit(u'JPY', u'USD'))
+            self.assertEqual(minus_half.get_value(), Decimal('-0.01')) # Away from zero
+            self.cmd.eat_string('money(false)')
+        finally:
+            ConverterRegistry.register_criterion('rate', criterion)
+
+
+    def test_rate_history(self):
+        print 'Checking a rate history imported from a CSV'
+        a_dir = tempfile.mkdtemp()
+        old_rate = UnitLib._UnitLib__currency_rate
+        try:
+            csv_path = os.path.join(a_dir, 'eurofxref-hist.csv')
+            with open(csv_path, 'w') as wf:
+                wf.write('Date,USD,JPY,\n2016-04-08,1.1395,123.3,\n2016-04-05,1.1389,N/A,\n2016-04-04,1.1387,125.5,\n')
+            path = os.path.join(a_dir, 'rate_history.dat')
+            RateHistory.import_csv(csv_path, path)
+
+            history = RateHistory(path)
+            self.assertEqual(history.currencies, ['USD', 'JPY'])
+            self.assertEqual(history.days, 5)
+            self.assertEqual(history.rate('USD', date(2016, 4, 4)), 1.1387)
+            self.assertEqual(history.rate('USD', date(2016, 4, 7)), 1.1389) # Filled by the last rate
+            self.assertEqual(history.rate('JPY', date(2016, 4, 5)), 125.5) # N/A is filled too
+            self.assertEqual(history.rate('JPY', date(2016, 5, 1)), 123.3) # The latest rate
+            self.assertEqual(history.rate('USD', date(2016, 4, 3)), None) # Before the first date
+            self.assertEqual(history.rate('GBP', date(2016, 4, 5)), None)
+            self.assertRaises(ValueError, UnitLib().rate, 'USD', (history, date(2016, 4, 3)))
+            self.assertRaises(ValueError, UnitLib().rate, 'GBP', (history, date(2016, 4, 5)))
+            history.close()
+
+            self.__publish_rate({'USD': 1.25})
+            manager = Example(is_intaractive_run=False).visitor.get_unit_manager()
+            other_manager = Example(is_intaractive_run=False).visitor.get_unit_manager()
+            manager.history_path = path
+            manager.set_as_of(date(2016, 4, 6))
+            self.assertEqual(manager.get_criterion(u'USD', None), 1 / Fraction('1.1389'))
+            self.assertEqual(other_manager.get_criterion(u'USD', None), Fraction(4, 5)) # Another interpreter
+            manager.set_as_of(None)
+            self.assertEqual(manager.get_criterion(u'USD', None), Fraction(4, 5))
+        finally:
+            UnitLib.update_rate(old_rate)
+            shutil.rmtree(a_dir)
+
+
+    def test_timezone(self):
+        print 'Checking timezones'
+        a_lib = UnitLib()
+        self.assertEqual(a_lib.shift_times([u'10:00', u'23:30 - 01:15'], u'Asia_Tokyo', u'UTC', date(2016, 1, 15)),
+                         [u'01:00', u'14:30 - 16:15'])
+        self.assertEqual(a_lib.shift_times(u'12:00', u'UTC', u'US_Eastern', date(2016, 3, 12)), u'07:00') # EST
+        self.assertEqual(a_lib.shift_times(u'12:00', u'UTC', u'US_Eastern', date(2016, 3, 14)), u'08:00') # EDT
+        self.assertEqual(a_lib.timezone([u'10:00'], Unit(u'Asia_Tokyo', u'Asia_Tokyo')), [u'10:00'])
+        self.assertRaises(ValueError, a_lib.timezone, u'25:00', Unit(u'Asia_Tokyo', u'UTC'))
+        self.assertRaises(ValueError, a_lib.timezone, [u'10:00', u'10:60'], Unit(u'Asia_Tokyo', u'UTC'))
+        for day in range(Constants.TZ_OFFSET_CACHE_SIZE):
+            a_lib.shift_times(u'12:00', u'UTC', u'US_Eastern', date.fromordinal(date(2016, 1, 1).toordinal() + day))
+        self.assertLessEqual(len(UnitLib._UnitLib__tz_offsets), Constants.TZ_OFFSET_CACHE_SIZE)
+
+
+    def test_constant_folder(self):
+        print 'Checking ConstantFolder'
+        cmd = Example(is_intaractive_run=False)
+        a_tree = cmd.build_tree(InputStream(u'x = 1 + 2\nrep i,2 {\n    y = (3 + 4) * 5{km->m}\n    z = i + 6\n}\n'))
+        ContextLinker.link(a_tree)
+        cmd.visitor.get_constant_folder().fold(a_tree)
+        folded_texts, nodes = [], [a_tree]
+        while nodes:
+            a_node = nodes.pop()
+            if isinstance(a_node, TerminalNode): continue
+            if hasattr(a_node, 'folded_constant'): folded_texts.append(a_node.getText())
+            nodes.extend(a_node.getChildren())
+        self.assertEqual(sorted(folded_texts), [u'(3+4)*5{km->m}', u'6']) # Not in a statement running once
+
+
+    def test_optimizer(self):
+        print 'Checking Optimizer'
+        cmd = Example(is_intaractive_run=False)
+        a_tree = cmd.build_tree(InputStream(u'y = 1\nz = y * 2 + y * 2\nrep i,2 {\n    w = y * 2 + y * 2\n}\n'))
+        cmd.visitor.visit(a_tree)
+        shared_texts, nodes = [], [a_tree]
+        while nodes:
+            a_node = nodes.pop()
+            if isinstance(a_node, TerminalNode): continue
+            if hasattr(a_node, 'shared_key'): shared_texts.append(a_node.getText())
+            nodes.extend(a_node.getChildren())
+        self.assertEqual(sorted(shared_texts), [u'y*2', u'y*2', u'y*2+y*2']) # Only in the loop, because a statement running once is not analyzed
+
+
+    def test_large_stack_session(self):
+        print 'Checking that a session runs calls on one thread with a large stack'
+        get_thread = threading.current_thread
+        outside = [Util.run_on_large_stack(get_thread) for _ in range(2)]
+        self.assertNotEqual(outside[0], outside[1])
+        with Util.large_stack_session():
+            with Util.large_stack_session(): # Nested
+                inside = [Util.run_on_large_stack(get_thread) for _ in range(3)]
+            inside.append(Util.run_on_large_stack(Util.run_on_large_stack, get_thread)) # On the thread
+            def depth(n): return 0 if n == 0 else depth(n - 1) + 1
+            self.assertEqual(Util.run_on_large_stack(depth, 100000), 100000)
+            self.assertRaises(ZeroDivisionError, Util.run_on_large_stack, lambda: 1 / 0)
+            inside.append(Util.run_on_large_stack(get_thread))
+        self.assertEqual(len(set(inside)), 1)
+        self.assertNotIn(inside[0], [get_thread()] + outside)
+        self.assertFalse(inside[0].is_alive())
+
+        path = os.path.join(self.home, 'stream.unit')
+        with open(path, 'w') as wf:
+            wf.write('x = 1\nx += 1\nexpect(x, 2)\n')
+        run_on_large_stack, threads = Util.__dict__['run_on_large_stack'], set()
+        def run_recording_threads(cls, func, *args):
+            def run(*args):
+                threads.add(get_thread())
+                return func(*args)
+            return run_on_large_stack.__func__(cls, run, *args)
+        try:
+            Util.run_on_large_stack = classmethod(run_recording_threads)
+            self.cmd = Example(is_intaractive_run=False)
+            self.cmd.visitor.is_test = True
+            self.cmd.eat_stream(path)
+        finally:
+            Util.run_on_large_stack = run_on_large_stack
+        self.assertEqual(len(threads), 1) # Three statements on one thread
+
+
+    def test_interpreters_are_released(self):
+        print 'Checking that interpreters are released'
+        refs = [weakref.ref(Example(is_intaractive_run=False).visitor) for _ in range(5)]
+        gc.collect()
+        self.assertLessEqual(len([a_ref for a_ref in refs if a_ref() is not None]), 1) # The last one is kept by classes.
+
+
+    def test_parse_cache(self):
+        for a_code in self.test_codes:
+            print 'Checking "%s"(CORRECT SOURCE) through ParseCache' % a_code
+            with open(a_code, 'rb') as rf:
+                code = rf.read()
+            cache = ParseCache(self.cache_dir)
+            key = cache.get_key(code)
+            parser = UnitXParser(CommonTokenStream(UnitXLexer(InputStream(code.decode('utf-8')))))
+            a_tree = parser.program()
+            cache.save(key, a_tree, parser.getTokenStream())
+            loaded_tree = cache.load(key, UnitXParser(None))
+            self.assertEqual(loaded_tree.toStringTree(recog=parser), a_tree.toStringTree(recog=parser))
+
+            outputs = []
+            for cache_dir in [os.path.join(self.home, 'empty'), self.cache_dir]: # A parser, and then the cache
+                stdout = sys.stdout
+                sys.stdout = StringIO()
+                try:
+                    Example(is_intaractive_run=False, cache_dir=cache_dir).eat_code(a_code)
+                    outputs.append(sys.stdout.getvalue())
+                finally:
+                    sys.stdout = stdout
+                shutil.rmtree(os.path.join(self.home, 'empty'), ignore_errors=True)
+            self.assertEqual(outputs[1], outputs[0])
+
+
+    def test_parse_cache_eviction(self):
+        print 'Checking that least recently used parse trees are removed'
+        codes = ['x%s = %s{km}\nprint x%s{km->m}\n' % (i, i, i) for i in range(3)]
+        cache = ParseCache(self.cache_dir)
+        for a_code in codes:
+            parser = UnitXParser(CommonTokenStream(UnitXLexer(InputStream(a_code.decode('utf-8')))))
+            cache.save(cache.get_key(a_code), parser.program(), parser.getTokenStream())
+        sizes = [os.path.getsize(os.path.join(self.cache_dir, a_name)) for a_name in os.listdir(self.cache_dir)]
+        for i, a_path in enumerate(sorted(os.path.join(self.cache_dir, a_name) for a_name in os.listdir(self.cache_dir))):
+            os.utime(a_path, (1000000 + i, 1000000 + i)) # Not used recently
+        self.assertNotEqual(cache.load(cache.get_key(codes[0]), UnitXParser(None)), None) # Used now
+
+        cache.max_bytes = max(sizes) * 2
+        parser = UnitXParser(CommonTokenStream(UnitXLexer(InputStream(u'y = 1\n'))))
+        cache.save(cache.get_key('y = 1\n'), parser.program(), parser.getTokenStream())
+        self.assertLessEqual(sum(os.path.getsize(os.path.join(self.cache_dir, a_name)) for a_name in os.listdir(self.cache_dir)), cache.max_bytes)
+        self.assertNotEqual(cache.load(cache.get_key(codes[0]), UnitXParser(None)), None)
+        self.assertEqual(cache.load(cache.get_key(codes[1]), UnitXParser(None)), None) # The least recently used
+        self.assertNotEqual(cache.load(cache.get_key('y = 1\n'), UnitXParser(None)), None)
+
+        cache.max_bytes = 1 # No tree is saved.
+        parser = UnitXParser(CommonTokenStream(UnitXLexer(InputStream(u'z = 1\n'))))
+        cache.save(cache.get_key('z = 1\n'), parser.program(), parser.getTokenStream())
+        self.assertEqual(cache.load(cache.get_key('z = 1\n'), UnitXParser(None)), None)
+
+
+    def __get_parser_states(self):
+        return (UnitXParser.atn, UnitXParser.decisionsToDFA, UnitXParser.sharedContextCache,
+                UnitXLexer.atn, UnitXLexer.decisionsToDFA)
+
+
+    def __set_parser_states(self, states):
+        UnitXParser.atn, UnitXParser.decisionsToDFA, UnitXParser.sharedContextCache, \
+            UnitXLexer.atn, UnitXLexer.decisionsToDFA = states
+
+
+    def test_parser_snapshot(self):
+        print 'Checking a snapshot of parser DFAs'
+        codes = []
+        for a_code in sorted(self.test_codes + self.err_codes):
+            with open(a_code, 'r') as rf:
+                codes.append(rf.read().decode('utf-8'))
+        expected_trees = []
+        for a_code in codes:
+            parser = UnitXParser(CommonTokenStream(UnitXLexer(InputStream(a_code))))
+            parser._listeners = []
+            expected_trees.append(parser.program().toStringTree(recog=parser))
+
+        path = os.path.join(self.home, 'parser_snapshot.dat')
+        states = self.__get_parser_states()
+        ParserSnapshot.save(path)
+        try:
+            ParserSnapshot._ParserSnapshot__is_loaded = False
+            self.assertTrue(ParserSnapshot.load(path))
+            self.assertTrue(UnitXParser.decisionsToDFA is not states[1])
+            self.assertTrue(any(a_dfa._states for a_dfa in UnitXParser.decisionsToDFA)) # Warmed
+            for a_code, expected_tree in zip(codes, expected_trees):
+                parser = UnitXParser(CommonTokenStream(UnitXLexer(InputStream(a_code))))
+                parser._listeners = []
+                self.assertEqual(parser.program().toStringTree(recog=parser), expected_tree)
+        finally:
+            self.__set_parser_states(states)
+            ParserSnapshot._ParserSnapshot__is_loaded = False
+
+
+    def test_parser_snapshot_mismatch(self):
+        print 'Checking that a snapshot of another grammar or python is ignored'
+        path = os.path.join(self.home, 'parser_snapshot.dat')
+        states = self.__get_parser_states()
+        ParserSnapshot.save(path)
+        get_grammar_hash = ParserSnapshot.__dict__['get_grammar_hash']
+        version = sys.version
+        try:
+            ParserSnapshot.get_grammar_hash = classmethod(lambda cls: 'another grammar')
+            self.assertFalse(ParserSnapshot.load(path))
+            ParserSnapshot.get_grammar_hash = get_grammar_hash
+            sys.version = version + ' (another python)'
+            self.assertFalse(ParserSnapshot.load(path))
+            sys.version = version
+
+            with open(path, 'r+b') as f:
+                f.truncate(os.path.getsize(path) // 2) # Broken
+            self.assertFalse(ParserSnapshot.load(path))
+            self.assertFalse(ParserSnapshot.load(os.path.join(self.home, 'nothing.dat')))
+            self.assertEqual(self.__get_parser_states(), states)
+
+            self.cmd = Example(is_intaractive_run=False) # Parses with the current DFAs.
+            self.cmd.visitor.is_test = True
+            self.cmd.eat_string('x = 5{km}\nexpect(x{km->m}, 5000{m})\n')
+        finally:
+            ParserSnapshot.get_grammar_hash = get_grammar_hash
+            sys.version = version
+            self.__set_parser_states(states)
+
+
     def setUp(self):
         print
+        self.home = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.home, 'cache')
         self.test_codes = []
         self.err_codes = []
         self.err_ans_codes = []
@@ -70,7 +479,7 @@ class Tester(unittest.TestCase):
                     self.test_codes.append(os.path.join('tests', filename))
 
     def tearDown(self):
-        pass
+        shutil.rmtree(self.home)
 
 
 def main(argv):
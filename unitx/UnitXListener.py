@@ -193,6 +193,78 @@ class UnitXListener(ParseTreeListener):
         pass
 
 
+    # Enter a parse tree produced by UnitXParser#assignmentExpression.
+    def enterAssignmentExpression(self, ctx):
+        pass
+
+    # Exit a parse tree produced by UnitXParser#assignmentExpression.
+    def exitAssignmentExpression(self, ctx):
+        pass
+
+
+    # Enter a parse tree produced by UnitXParser#logicalExpression.
+    def enterLogicalExpression(self, ctx):
+        pass
+
+    # Exit a parse tree produced by UnitXParser#logicalExpression.
+    def exitLogicalExpression(self, ctx):
+        pass
+
+
+    # Enter a parse tree produced by UnitXParser#equalityExpression.
+    def enterEqualityExpression(self, ctx):
+        pass
+
+    # Exit a parse tree produced by UnitXParser#equalityExpression.
+    def exitEqualityExpression(self, ctx):
+        pass
+
+
+    # Enter a parse tree produced by UnitXParser#relationalExpression.
+    def enterRelationalExpression(self, ctx):
+        pass
+
+    # Exit a parse tree produced by UnitXParser#relationalExpression.
+    def exitRelationalExpression(self, ctx):
+        pass
+
+
+    # Enter a parse tree produced by UnitXParser#additiveExpression.
+    def enterAdditiveExpression(self, ctx):
+        pass
+
+    # Exit a parse tree produced by UnitXParser#additiveExpression.
+    def exitAdditiveExpression(self, ctx):
+        pass
+
+
+    # Enter a parse tree produced by UnitXParser#multiplicativeExpression.
+    def enterMultiplicativeExpression(self, ctx):
+        pass
+
+    # Exit a parse tree produced by UnitXParser#multiplicativeExpression.
+    def exitMultiplicativeExpression(self, ctx):
+        pass
+
+
+    # Enter a parse tree produced by UnitXParser#unaryExpression.
+    def enterUnaryExpression(self, ctx):
+        pass
+
+    # Exit a parse tree produced by UnitXParser#unaryExpression.
+    def exitUnaryExpression(self, ctx):
+        pass
+
+
+    # Enter a parse tree produced by UnitXParser#callExpression.
+    def enterCallExpression(self, ctx):
+        pass
+
+    # Exit a parse tree produced by UnitXParser#callExpression.
+    def exitCallExpression(self, ctx):
+        pass
+
+
     # Enter a parse tree produced by UnitXParser#unit.
     def enterUnit(self, ctx):
         pass
@@ -220,6 +292,15 @@ class UnitXListener(ParseTreeListener):
         pass
 
 
+    # Enter a parse tree produced by UnitXParser#unitToken.
+    def enterUnitToken(self, ctx):
+        pass
+
+    # Exit a parse tree produced by UnitXParser#unitToken.
+    def exitUnitToken(self, ctx):
+        pass
+
+
     # Enter a parse tree produced by UnitXParser#primary.
     def enterPrimary(self, ctx):
         pass
@@ -7,187 +7,207 @@ from io import StringIO
 def serializedATN():
     with StringIO() as buf:
         buf.write(u"\3\u0430\ud6d1\u8206\uad2d\u4417\uaef1\u8d80\uaadd\3")
-        buf.write(u"V\u0171\4\2\t\2\4\3\t\3\4\4\t\4\4\5\t\5\4\6\t\6\4\7\t")
+        buf.write(u"V\u01a0\4\2\t\2\4\3\t\3\4\4\t\4\4\5\t\5\4\6\t\6\4\7\t")
         buf.write(u"\7\4\b\t\b\4\t\t\t\4\n\t\n\4\13\t\13\4\f\t\f\4\r\t\r")
         buf.write(u"\4\16\t\16\4\17\t\17\4\20\t\20\4\21\t\21\4\22\t\22\4")
         buf.write(u"\23\t\23\4\24\t\24\4\25\t\25\4\26\t\26\4\27\t\27\4\30")
         buf.write(u"\t\30\4\31\t\31\4\32\t\32\4\33\t\33\4\34\t\34\4\35\t")
-        buf.write(u"\35\4\36\t\36\4\37\t\37\4 \t \4!\t!\3\2\7\2D\n\2\f\2")
-        buf.write(u"\16\2G\13\2\3\2\3\2\3\3\3\3\5\3M\n\3\3\4\3\4\3\4\3\4")
-        buf.write(u"\3\4\3\5\5\5U\n\5\3\5\3\5\5\5Y\n\5\3\5\5\5\\\n\5\3\6")
-        buf.write(u"\3\6\3\6\7\6a\n\6\f\6\16\6d\13\6\3\7\3\7\3\7\5\7i\n\7")
-        buf.write(u"\3\b\3\b\7\bm\n\b\f\b\16\bp\13\b\3\b\3\b\3\b\7\bu\n\b")
-        buf.write(u"\f\b\16\bx\13\b\3\b\5\b{\n\b\3\t\3\t\3\n\3\n\3\n\3\n")
-        buf.write(u"\3\n\5\n\u0084\n\n\3\n\3\n\5\n\u0088\n\n\3\n\5\n\u008b")
-        buf.write(u"\n\n\3\n\3\n\5\n\u008f\n\n\3\n\3\n\5\n\u0093\n\n\3\n")
-        buf.write(u"\3\n\5\n\u0097\n\n\3\n\3\n\5\n\u009b\n\n\3\n\3\n\5\n")
-        buf.write(u"\u009f\n\n\3\n\3\n\5\n\u00a3\n\n\5\n\u00a5\n\n\3\13\3")
-        buf.write(u"\13\3\13\3\13\3\13\3\13\3\13\3\13\3\13\3\13\5\13\u00b1")
-        buf.write(u"\n\13\3\f\3\f\3\f\3\f\3\f\5\f\u00b8\n\f\3\r\3\r\3\16")
-        buf.write(u"\3\16\5\16\u00be\n\16\3\16\3\16\7\16\u00c2\n\16\f\16")
-        buf.write(u"\16\16\u00c5\13\16\3\17\3\17\5\17\u00c9\n\17\3\20\3\20")
-        buf.write(u"\3\20\5\20\u00ce\n\20\3\20\3\20\7\20\u00d2\n\20\f\20")
-        buf.write(u"\16\20\u00d5\13\20\3\21\3\21\3\22\3\22\3\22\7\22\u00dc")
-        buf.write(u"\n\22\f\22\16\22\u00df\13\22\3\23\3\23\3\23\3\23\3\23")
-        buf.write(u"\5\23\u00e6\n\23\3\24\3\24\3\24\3\24\3\25\3\25\3\26\3")
-        buf.write(u"\26\3\26\3\26\3\26\3\26\3\26\3\26\5\26\u00f6\n\26\3\26")
-        buf.write(u"\3\26\3\26\3\26\3\26\3\26\3\26\3\26\3\26\3\26\3\26\3")
-        buf.write(u"\26\3\26\3\26\3\26\3\26\3\26\3\26\3\26\3\26\3\26\5\26")
-        buf.write(u"\u010d\n\26\3\26\7\26\u0110\n\26\f\26\16\26\u0113\13")
-        buf.write(u"\26\3\27\3\27\3\27\3\27\3\30\5\30\u011a\n\30\3\30\3\30")
-        buf.write(u"\5\30\u011e\n\30\3\30\3\30\3\30\3\30\5\30\u0124\n\30")
-        buf.write(u"\3\31\3\31\3\31\3\31\5\31\u012a\n\31\3\32\3\32\5\32\u012e")
-        buf.write(u"\n\32\3\32\3\32\5\32\u0132\n\32\3\32\3\32\3\32\3\32\5")
-        buf.write(u"\32\u0138\n\32\3\32\3\32\5\32\u013c\n\32\3\32\3\32\7")
-        buf.write(u"\32\u0140\n\32\f\32\16\32\u0143\13\32\3\32\3\32\5\32")
-        buf.write(u"\u0147\n\32\5\32\u0149\n\32\3\33\3\33\3\33\3\33\5\33")
-        buf.write(u"\u014f\n\33\3\34\3\34\3\34\5\34\u0154\n\34\3\35\3\35")
-        buf.write(u"\7\35\u0158\n\35\f\35\16\35\u015b\13\35\3\35\3\35\7\35")
-        buf.write(u"\u015f\n\35\f\35\16\35\u0162\13\35\5\35\u0164\n\35\3")
-        buf.write(u"\36\3\36\3\36\5\36\u0169\n\36\3\37\3\37\3 \3 \3!\3!\3")
-        buf.write(u"!\2\3*\"\2\4\6\b\n\f\16\20\22\24\26\30\32\34\36 \"$&")
-        buf.write(u"(*,.\60\62\64\668:<>@\2\16\3\2\33\"\3\2\66\67\3\2&\'")
-        buf.write(u"\4\2:;??\3\289\4\2$%./\4\2,-\61\61\5\2##@CGG\3\2\62\65")
-        buf.write(u"\4\2\6\6RR\3\2KN\3\2\b\t\u0198\2E\3\2\2\2\4L\3\2\2\2")
-        buf.write(u"\6N\3\2\2\2\b[\3\2\2\2\n]\3\2\2\2\fe\3\2\2\2\16z\3\2")
-        buf.write(u"\2\2\20|\3\2\2\2\22\u00a4\3\2\2\2\24\u00b0\3\2\2\2\26")
-        buf.write(u"\u00b2\3\2\2\2\30\u00b9\3\2\2\2\32\u00bb\3\2\2\2\34\u00c6")
-        buf.write(u"\3\2\2\2\36\u00ca\3\2\2\2 \u00d6\3\2\2\2\"\u00d8\3\2")
-        buf.write(u"\2\2$\u00e5\3\2\2\2&\u00e7\3\2\2\2(\u00eb\3\2\2\2*\u00f5")
-        buf.write(u"\3\2\2\2,\u0114\3\2\2\2.\u0123\3\2\2\2\60\u0129\3\2\2")
-        buf.write(u"\2\62\u0148\3\2\2\2\64\u014e\3\2\2\2\66\u0153\3\2\2\2")
-        buf.write(u"8\u0163\3\2\2\2:\u0168\3\2\2\2<\u016a\3\2\2\2>\u016c")
-        buf.write(u"\3\2\2\2@\u016e\3\2\2\2BD\5\4\3\2CB\3\2\2\2DG\3\2\2\2")
-        buf.write(u"EC\3\2\2\2EF\3\2\2\2FH\3\2\2\2GE\3\2\2\2HI\7\2\2\3I\3")
-        buf.write(u"\3\2\2\2JM\5\22\n\2KM\5\6\4\2LJ\3\2\2\2LK\3\2\2\2M\5")
-        buf.write(u"\3\2\2\2NO\7\13\2\2OP\7Q\2\2PQ\5\b\5\2QR\5\16\b\2R\7")
-        buf.write(u"\3\2\2\2SU\5\n\6\2TS\3\2\2\2TU\3\2\2\2U\\\3\2\2\2VX\7")
-        buf.write(u"\22\2\2WY\5\n\6\2XW\3\2\2\2XY\3\2\2\2YZ\3\2\2\2Z\\\7")
-        buf.write(u"\23\2\2[T\3\2\2\2[V\3\2\2\2\\\t\3\2\2\2]b\5\f\7\2^_\7")
-        buf.write(u"\31\2\2_a\5\f\7\2`^\3\2\2\2ad\3\2\2\2b`\3\2\2\2bc\3\2")
-        buf.write(u"\2\2c\13\3\2\2\2db\3\2\2\2eh\7Q\2\2fg\7#\2\2gi\5*\26")
-        buf.write(u"\2hf\3\2\2\2hi\3\2\2\2i\r\3\2\2\2jn\7\24\2\2km\5\20\t")
-        buf.write(u"\2lk\3\2\2\2mp\3\2\2\2nl\3\2\2\2no\3\2\2\2oq\3\2\2\2")
-        buf.write(u"pn\3\2\2\2q{\7\25\2\2rv\7*\2\2su\5\20\t\2ts\3\2\2\2u")
-        buf.write(u"x\3\2\2\2vt\3\2\2\2vw\3\2\2\2wy\3\2\2\2xv\3\2\2\2y{\7")
-        buf.write(u"+\2\2zj\3\2\2\2zr\3\2\2\2{\17\3\2\2\2|}\5\22\n\2}\21")
-        buf.write(u"\3\2\2\2~\u00a5\5\16\b\2\177\u00a5\5\24\13\2\u0080\u00a5")
-        buf.write(u"\5\26\f\2\u0081\u0083\5\30\r\2\u0082\u0084\7\30\2\2\u0083")
-        buf.write(u"\u0082\3\2\2\2\u0083\u0084\3\2\2\2\u0084\u00a5\3\2\2")
-        buf.write(u"\2\u0085\u0087\7\17\2\2\u0086\u0088\5*\26\2\u0087\u0086")
-        buf.write(u"\3\2\2\2\u0087\u0088\3\2\2\2\u0088\u008a\3\2\2\2\u0089")
-        buf.write(u"\u008b\7\30\2\2\u008a\u0089\3\2\2\2\u008a\u008b\3\2\2")
-        buf.write(u"\2\u008b\u00a5\3\2\2\2\u008c\u008e\7\20\2\2\u008d\u008f")
-        buf.write(u"\7\30\2\2\u008e\u008d\3\2\2\2\u008e\u008f\3\2\2\2\u008f")
-        buf.write(u"\u00a5\3\2\2\2\u0090\u0092\7\21\2\2\u0091\u0093\7\30")
-        buf.write(u"\2\2\u0092\u0091\3\2\2\2\u0092\u0093\3\2\2\2\u0093\u00a5")
-        buf.write(u"\3\2\2\2\u0094\u0096\5\32\16\2\u0095\u0097\7\30\2\2\u0096")
-        buf.write(u"\u0095\3\2\2\2\u0096\u0097\3\2\2\2\u0097\u00a5\3\2\2")
-        buf.write(u"\2\u0098\u009a\5\34\17\2\u0099\u009b\7\30\2\2\u009a\u0099")
-        buf.write(u"\3\2\2\2\u009a\u009b\3\2\2\2\u009b\u00a5\3\2\2\2\u009c")
-        buf.write(u"\u009e\5\36\20\2\u009d\u009f\7\30\2\2\u009e\u009d\3\2")
-        buf.write(u"\2\2\u009e\u009f\3\2\2\2\u009f\u00a5\3\2\2\2\u00a0\u00a2")
-        buf.write(u"\5 \21\2\u00a1\u00a3\7\30\2\2\u00a2\u00a1\3\2\2\2\u00a2")
-        buf.write(u"\u00a3\3\2\2\2\u00a3\u00a5\3\2\2\2\u00a4~\3\2\2\2\u00a4")
-        buf.write(u"\177\3\2\2\2\u00a4\u0080\3\2\2\2\u00a4\u0081\3\2\2\2")
-        buf.write(u"\u00a4\u0085\3\2\2\2\u00a4\u008c\3\2\2\2\u00a4\u0090")
-        buf.write(u"\3\2\2\2\u00a4\u0094\3\2\2\2\u00a4\u0098\3\2\2\2\u00a4")
-        buf.write(u"\u009c\3\2\2\2\u00a4\u00a0\3\2\2\2\u00a5\23\3\2\2\2\u00a6")
-        buf.write(u"\u00a7\7\f\2\2\u00a7\u00a8\5&\24\2\u00a8\u00a9\5\22\n")
-        buf.write(u"\2\u00a9\u00b1\3\2\2\2\u00aa\u00ab\7\f\2\2\u00ab\u00ac")
-        buf.write(u"\7\22\2\2\u00ac\u00ad\5&\24\2\u00ad\u00ae\7\23\2\2\u00ae")
-        buf.write(u"\u00af\5\22\n\2\u00af\u00b1\3\2\2\2\u00b0\u00a6\3\2\2")
-        buf.write(u"\2\u00b0\u00aa\3\2\2\2\u00b1\25\3\2\2\2\u00b2\u00b3\7")
-        buf.write(u"\16\2\2\u00b3\u00b4\5$\23\2\u00b4\u00b7\5\22\n\2\u00b5")
-        buf.write(u"\u00b6\7\3\2\2\u00b6\u00b8\5\22\n\2\u00b7\u00b5\3\2\2")
-        buf.write(u"\2\u00b7\u00b8\3\2\2\2\u00b8\27\3\2\2\2\u00b9\u00ba\5")
-        buf.write(u"*\26\2\u00ba\31\3\2\2\2\u00bb\u00bd\7\r\2\2\u00bc\u00be")
-        buf.write(u"\5*\26\2\u00bd\u00bc\3\2\2\2\u00bd\u00be\3\2\2\2\u00be")
-        buf.write(u"\u00c3\3\2\2\2\u00bf\u00c0\7\31\2\2\u00c0\u00c2\5*\26")
-        buf.write(u"\2\u00c1\u00bf\3\2\2\2\u00c2\u00c5\3\2\2\2\u00c3\u00c1")
-        buf.write(u"\3\2\2\2\u00c3\u00c4\3\2\2\2\u00c4\33\3\2\2\2\u00c5\u00c3")
-        buf.write(u"\3\2\2\2\u00c6\u00c8\7\4\2\2\u00c7\u00c9\5*\26\2\u00c8")
-        buf.write(u"\u00c7\3\2\2\2\u00c8\u00c9\3\2\2\2\u00c9\35\3\2\2\2\u00ca")
-        buf.write(u"\u00cb\7$\2\2\u00cb\u00cd\7$\2\2\u00cc\u00ce\5*\26\2")
-        buf.write(u"\u00cd\u00cc\3\2\2\2\u00cd\u00ce\3\2\2\2\u00ce\u00d3")
-        buf.write(u"\3\2\2\2\u00cf\u00d0\7\31\2\2\u00d0\u00d2\5*\26\2\u00d1")
-        buf.write(u"\u00cf\3\2\2\2\u00d2\u00d5\3\2\2\2\u00d3\u00d1\3\2\2")
-        buf.write(u"\2\u00d3\u00d4\3\2\2\2\u00d4\37\3\2\2\2\u00d5\u00d3\3")
-        buf.write(u"\2\2\2\u00d6\u00d7\t\2\2\2\u00d7!\3\2\2\2\u00d8\u00dd")
-        buf.write(u"\5*\26\2\u00d9\u00da\7\31\2\2\u00da\u00dc\5*\26\2\u00db")
-        buf.write(u"\u00d9\3\2\2\2\u00dc\u00df\3\2\2\2\u00dd\u00db\3\2\2")
-        buf.write(u"\2\u00dd\u00de\3\2\2\2\u00de#\3\2\2\2\u00df\u00dd\3\2")
-        buf.write(u"\2\2\u00e0\u00e6\5*\26\2\u00e1\u00e2\7\22\2\2\u00e2\u00e3")
-        buf.write(u"\5*\26\2\u00e3\u00e4\7\23\2\2\u00e4\u00e6\3\2\2\2\u00e5")
-        buf.write(u"\u00e0\3\2\2\2\u00e5\u00e1\3\2\2\2\u00e6%\3\2\2\2\u00e7")
-        buf.write(u"\u00e8\7Q\2\2\u00e8\u00e9\7\31\2\2\u00e9\u00ea\5(\25")
-        buf.write(u"\2\u00ea\'\3\2\2\2\u00eb\u00ec\5*\26\2\u00ec)\3\2\2\2")
-        buf.write(u"\u00ed\u00ee\b\26\1\2\u00ee\u00ef\t\3\2\2\u00ef\u00f6")
-        buf.write(u"\5*\26\5\u00f0\u00f1\t\4\2\2\u00f1\u00f6\5*\26\4\u00f2")
-        buf.write(u"\u00f3\7\'\2\2\u00f3\u00f6\5*\26\3\u00f4\u00f6\5\62\32")
-        buf.write(u"\2\u00f5\u00ed\3\2\2\2\u00f5\u00f0\3\2\2\2\u00f5\u00f2")
-        buf.write(u"\3\2\2\2\u00f5\u00f4\3\2\2\2\u00f6\u0111\3\2\2\2\u00f7")
-        buf.write(u"\u00f8\f\13\2\2\u00f8\u00f9\t\5\2\2\u00f9\u0110\5*\26")
-        buf.write(u"\f\u00fa\u00fb\f\n\2\2\u00fb\u00fc\t\6\2\2\u00fc\u0110")
-        buf.write(u"\5*\26\13\u00fd\u00fe\f\t\2\2\u00fe\u00ff\t\7\2\2\u00ff")
-        buf.write(u"\u0110\5*\26\n\u0100\u0101\f\b\2\2\u0101\u0102\t\b\2")
-        buf.write(u"\2\u0102\u0110\5*\26\t\u0103\u0104\f\7\2\2\u0104\u0105")
-        buf.write(u"\t\t\2\2\u0105\u0110\5*\26\b\u0106\u0107\f\6\2\2\u0107")
-        buf.write(u"\u0108\t\n\2\2\u0108\u0110\5*\26\7\u0109\u010a\f\f\2")
-        buf.write(u"\2\u010a\u010c\7\22\2\2\u010b\u010d\5\"\22\2\u010c\u010b")
-        buf.write(u"\3\2\2\2\u010c\u010d\3\2\2\2\u010d\u010e\3\2\2\2\u010e")
-        buf.write(u"\u0110\7\23\2\2\u010f\u00f7\3\2\2\2\u010f\u00fa\3\2\2")
-        buf.write(u"\2\u010f\u00fd\3\2\2\2\u010f\u0100\3\2\2\2\u010f\u0103")
-        buf.write(u"\3\2\2\2\u010f\u0106\3\2\2\2\u010f\u0109\3\2\2\2\u0110")
-        buf.write(u"\u0113\3\2\2\2\u0111\u010f\3\2\2\2\u0111\u0112\3\2\2")
-        buf.write(u"\2\u0112+\3\2\2\2\u0113\u0111\3\2\2\2\u0114\u0115\7\24")
-        buf.write(u"\2\2\u0115\u0116\5.\30\2\u0116\u0117\7\25\2\2\u0117-")
-        buf.write(u"\3\2\2\2\u0118\u011a\7H\2\2\u0119\u0118\3\2\2\2\u0119")
-        buf.write(u"\u011a\3\2\2\2\u011a\u011b\3\2\2\2\u011b\u0124\5\60\31")
-        buf.write(u"\2\u011c\u011e\7H\2\2\u011d\u011c\3\2\2\2\u011d\u011e")
-        buf.write(u"\3\2\2\2\u011e\u011f\3\2\2\2\u011f\u0120\5\60\31\2\u0120")
-        buf.write(u"\u0121\7;\2\2\u0121\u0122\5\60\31\2\u0122\u0124\3\2\2")
-        buf.write(u"\2\u0123\u0119\3\2\2\2\u0123\u011d\3\2\2\2\u0124/\3\2")
-        buf.write(u"\2\2\u0125\u012a\7Q\2\2\u0126\u0127\7Q\2\2\u0127\u0128")
-        buf.write(u"\7\60\2\2\u0128\u012a\7Q\2\2\u0129\u0125\3\2\2\2\u0129")
-        buf.write(u"\u0126\3\2\2\2\u012a\61\3\2\2\2\u012b\u012d\7Q\2\2\u012c")
-        buf.write(u"\u012e\5,\27\2\u012d\u012c\3\2\2\2\u012d\u012e\3\2\2")
-        buf.write(u"\2\u012e\u0149\3\2\2\2\u012f\u0131\5\64\33\2\u0130\u0132")
-        buf.write(u"\5,\27\2\u0131\u0130\3\2\2\2\u0131\u0132\3\2\2\2\u0132")
-        buf.write(u"\u0149\3\2\2\2\u0133\u0134\7\22\2\2\u0134\u0135\5*\26")
-        buf.write(u"\2\u0135\u0137\7\23\2\2\u0136\u0138\5,\27\2\u0137\u0136")
-        buf.write(u"\3\2\2\2\u0137\u0138\3\2\2\2\u0138\u0149\3\2\2\2\u0139")
-        buf.write(u"\u013b\7\26\2\2\u013a\u013c\5*\26\2\u013b\u013a\3\2\2")
-        buf.write(u"\2\u013b\u013c\3\2\2\2\u013c\u0141\3\2\2\2\u013d\u013e")
-        buf.write(u"\7\31\2\2\u013e\u0140\5*\26\2\u013f\u013d\3\2\2\2\u0140")
-        buf.write(u"\u0143\3\2\2\2\u0141\u013f\3\2\2\2\u0141\u0142\3\2\2")
-        buf.write(u"\2\u0142\u0144\3\2\2\2\u0143\u0141\3\2\2\2\u0144\u0146")
-        buf.write(u"\7\27\2\2\u0145\u0147\5,\27\2\u0146\u0145\3\2\2\2\u0146")
-        buf.write(u"\u0147\3\2\2\2\u0147\u0149\3\2\2\2\u0148\u012b\3\2\2")
-        buf.write(u"\2\u0148\u012f\3\2\2\2\u0148\u0133\3\2\2\2\u0148\u0139")
-        buf.write(u"\3\2\2\2\u0149\63\3\2\2\2\u014a\u014f\5:\36\2\u014b\u014f")
-        buf.write(u"\5\66\34\2\u014c\u014f\5> \2\u014d\u014f\5@!\2\u014e")
-        buf.write(u"\u014a\3\2\2\2\u014e\u014b\3\2\2\2\u014e\u014c\3\2\2")
-        buf.write(u"\2\u014e\u014d\3\2\2\2\u014f\65\3\2\2\2\u0150\u0154\7")
-        buf.write(u"I\2\2\u0151\u0154\7J\2\2\u0152\u0154\58\35\2\u0153\u0150")
-        buf.write(u"\3\2\2\2\u0153\u0151\3\2\2\2\u0153\u0152\3\2\2\2\u0154")
-        buf.write(u"\67\3\2\2\2\u0155\u0159\7\5\2\2\u0156\u0158\n\13\2\2")
-        buf.write(u"\u0157\u0156\3\2\2\2\u0158\u015b\3\2\2\2\u0159\u0157")
-        buf.write(u"\3\2\2\2\u0159\u015a\3\2\2\2\u015a\u0164\3\2\2\2\u015b")
-        buf.write(u"\u0159\3\2\2\2\u015c\u0160\7\7\2\2\u015d\u015f\n\13\2")
-        buf.write(u"\2\u015e\u015d\3\2\2\2\u015f\u0162\3\2\2\2\u0160\u015e")
-        buf.write(u"\3\2\2\2\u0160\u0161\3\2\2\2\u0161\u0164\3\2\2\2\u0162")
-        buf.write(u"\u0160\3\2\2\2\u0163\u0155\3\2\2\2\u0163\u015c\3\2\2")
-        buf.write(u"\2\u01649\3\2\2\2\u0165\u0169\5<\37\2\u0166\u0169\7O")
-        buf.write(u"\2\2\u0167\u0169\7P\2\2\u0168\u0165\3\2\2\2\u0168\u0166")
-        buf.write(u"\3\2\2\2\u0168\u0167\3\2\2\2\u0169;\3\2\2\2\u016a\u016b")
-        buf.write(u"\t\f\2\2\u016b=\3\2\2\2\u016c\u016d\t\r\2\2\u016d?\3")
-        buf.write(u"\2\2\2\u016e\u016f\7\n\2\2\u016fA\3\2\2\2\64ELTX[bhn")
-        buf.write(u"vz\u0083\u0087\u008a\u008e\u0092\u0096\u009a\u009e\u00a2")
-        buf.write(u"\u00a4\u00b0\u00b7\u00bd\u00c3\u00c8\u00cd\u00d3\u00dd")
-        buf.write(u"\u00e5\u00f5\u010c\u010f\u0111\u0119\u011d\u0123\u0129")
-        buf.write(u"\u012d\u0131\u0137\u013b\u0141\u0146\u0148\u014e\u0153")
-        buf.write(u"\u0159\u0160\u0163\u0168")
+        buf.write(u"\35\4\36\t\36\4\37\t\37\4 \t \4!\t!\4\"\t\"\4#\t#\4$")
+        buf.write(u"\t$\4%\t%\4&\t&\4\'\t\'\4(\t(\4)\t)\4*\t*\3\2\7\2V\n")
+        buf.write(u"\2\f\2\16\2Y\13\2\3\2\3\2\3\3\3\3\5\3_\n\3\3\4\3\4\3")
+        buf.write(u"\4\3\4\3\4\3\5\5\5g\n\5\3\5\3\5\5\5k\n\5\3\5\5\5n\n\5")
+        buf.write(u"\3\6\3\6\3\6\7\6s\n\6\f\6\16\6v\13\6\3\7\3\7\3\7\5\7")
+        buf.write(u"{\n\7\3\b\3\b\7\b\177\n\b\f\b\16\b\u0082\13\b\3\b\3\b")
+        buf.write(u"\3\b\7\b\u0087\n\b\f\b\16\b\u008a\13\b\3\b\5\b\u008d")
+        buf.write(u"\n\b\3\t\3\t\3\n\3\n\3\n\3\n\3\n\5\n\u0096\n\n\3\n\3")
+        buf.write(u"\n\5\n\u009a\n\n\3\n\5\n\u009d\n\n\3\n\3\n\5\n\u00a1")
+        buf.write(u"\n\n\3\n\3\n\5\n\u00a5\n\n\3\n\3\n\5\n\u00a9\n\n\3\n")
+        buf.write(u"\3\n\5\n\u00ad\n\n\3\n\3\n\5\n\u00b1\n\n\3\n\3\n\5\n")
+        buf.write(u"\u00b5\n\n\5\n\u00b7\n\n\3\13\3\13\3\13\3\13\3\13\3\13")
+        buf.write(u"\3\13\3\13\3\13\3\13\5\13\u00c3\n\13\3\f\3\f\3\f\3\f")
+        buf.write(u"\3\f\5\f\u00ca\n\f\3\r\3\r\3\16\3\16\5\16\u00d0\n\16")
+        buf.write(u"\3\16\3\16\7\16\u00d4\n\16\f\16\16\16\u00d7\13\16\3\17")
+        buf.write(u"\3\17\5\17\u00db\n\17\3\20\3\20\3\20\5\20\u00e0\n\20")
+        buf.write(u"\3\20\3\20\7\20\u00e4\n\20\f\20\16\20\u00e7\13\20\3\21")
+        buf.write(u"\3\21\3\22\3\22\3\22\7\22\u00ee\n\22\f\22\16\22\u00f1")
+        buf.write(u"\13\22\3\23\3\23\3\23\3\23\3\23\5\23\u00f8\n\23\3\24")
+        buf.write(u"\3\24\3\24\3\24\3\25\3\25\3\26\3\26\3\27\3\27\3\27\5")
+        buf.write(u"\27\u0105\n\27\3\30\3\30\3\30\7\30\u010a\n\30\f\30\16")
+        buf.write(u"\30\u010d\13\30\3\31\3\31\3\31\7\31\u0112\n\31\f\31\16")
+        buf.write(u"\31\u0115\13\31\3\32\3\32\3\32\7\32\u011a\n\32\f\32\16")
+        buf.write(u"\32\u011d\13\32\3\33\3\33\3\33\7\33\u0122\n\33\f\33\16")
+        buf.write(u"\33\u0125\13\33\3\34\3\34\3\34\7\34\u012a\n\34\f\34\16")
+        buf.write(u"\34\u012d\13\34\3\35\3\35\3\35\3\35\3\35\5\35\u0134\n")
+        buf.write(u"\35\3\36\3\36\3\36\5\36\u0139\n\36\3\36\7\36\u013c\n")
+        buf.write(u"\36\f\36\16\36\u013f\13\36\3\37\3\37\3\37\3\37\3 \5 ")
+        buf.write(u"\u0146\n \3 \3 \5 \u014a\n \3 \3 \3 \3 \5 \u0150\n \3")
+        buf.write(u"!\3!\3!\3!\3!\5!\u0157\n!\3\"\3\"\3#\3#\5#\u015d\n#\3")
+        buf.write(u"#\3#\5#\u0161\n#\3#\3#\3#\3#\5#\u0167\n#\3#\3#\5#\u016b")
+        buf.write(u"\n#\3#\3#\7#\u016f\n#\f#\16#\u0172\13#\3#\3#\5#\u0176")
+        buf.write(u"\n#\5#\u0178\n#\3$\3$\3$\3$\5$\u017e\n$\3%\3%\3%\5%\u0183")
+        buf.write(u"\n%\3&\3&\7&\u0187\n&\f&\16&\u018a\13&\3&\3&\7&\u018e")
+        buf.write(u"\n&\f&\16&\u0191\13&\5&\u0193\n&\3\'\3\'\3\'\5\'\u0198")
+        buf.write(u"\n\'\3(\3(\3)\3)\3*\3*\3*\2\2+\2\4\6\b\n\f\16\20\22\24")
+        buf.write(u"\26\30\32\34\36 \"$&(*,.\60\62\64\668:<>@BDFHJLNPR\2")
+        buf.write(u"\17\3\2\33\"\5\2##@CGG\3\2\62\65\4\2,-\61\61\4\2$%./")
+        buf.write(u"\3\289\4\2:;??\3\2\66\67\3\2&\'\4\2KKQQ\4\2\6\6RR\3\2")
+        buf.write(u"KN\3\2\b\t\u01bd\2W\3\2\2\2\4^\3\2\2\2\6`\3\2\2\2\bm")
+        buf.write(u"\3\2\2\2\no\3\2\2\2\fw\3\2\2\2\16\u008c\3\2\2\2\20\u008e")
+        buf.write(u"\3\2\2\2\22\u00b6\3\2\2\2\24\u00c2\3\2\2\2\26\u00c4\3")
+        buf.write(u"\2\2\2\30\u00cb\3\2\2\2\32\u00cd\3\2\2\2\34\u00d8\3\2")
+        buf.write(u"\2\2\36\u00dc\3\2\2\2 \u00e8\3\2\2\2\"\u00ea\3\2\2\2")
+        buf.write(u"$\u00f7\3\2\2\2&\u00f9\3\2\2\2(\u00fd\3\2\2\2*\u00ff")
+        buf.write(u"\3\2\2\2,\u0101\3\2\2\2.\u0106\3\2\2\2\60\u010e\3\2\2")
+        buf.write(u"\2\62\u0116\3\2\2\2\64\u011e\3\2\2\2\66\u0126\3\2\2\2")
+        buf.write(u"8\u0133\3\2\2\2:\u0135\3\2\2\2<\u0140\3\2\2\2>\u014f")
+        buf.write(u"\3\2\2\2@\u0156\3\2\2\2B\u0158\3\2\2\2D\u0177\3\2\2\2")
+        buf.write(u"F\u017d\3\2\2\2H\u0182\3\2\2\2J\u0192\3\2\2\2L\u0197")
+        buf.write(u"\3\2\2\2N\u0199\3\2\2\2P\u019b\3\2\2\2R\u019d\3\2\2\2")
+        buf.write(u"TV\5\4\3\2UT\3\2\2\2VY\3\2\2\2WU\3\2\2\2WX\3\2\2\2XZ")
+        buf.write(u"\3\2\2\2YW\3\2\2\2Z[\7\2\2\3[\3\3\2\2\2\\_\5\22\n\2]")
+        buf.write(u"_\5\6\4\2^\\\3\2\2\2^]\3\2\2\2_\5\3\2\2\2`a\7\13\2\2")
+        buf.write(u"ab\7Q\2\2bc\5\b\5\2cd\5\16\b\2d\7\3\2\2\2eg\5\n\6\2f")
+        buf.write(u"e\3\2\2\2fg\3\2\2\2gn\3\2\2\2hj\7\22\2\2ik\5\n\6\2ji")
+        buf.write(u"\3\2\2\2jk\3\2\2\2kl\3\2\2\2ln\7\23\2\2mf\3\2\2\2mh\3")
+        buf.write(u"\2\2\2n\t\3\2\2\2ot\5\f\7\2pq\7\31\2\2qs\5\f\7\2rp\3")
+        buf.write(u"\2\2\2sv\3\2\2\2tr\3\2\2\2tu\3\2\2\2u\13\3\2\2\2vt\3")
+        buf.write(u"\2\2\2wz\7Q\2\2xy\7#\2\2y{\5*\26\2zx\3\2\2\2z{\3\2\2")
+        buf.write(u"\2{\r\3\2\2\2|\u0080\7\24\2\2}\177\5\20\t\2~}\3\2\2\2")
+        buf.write(u"\177\u0082\3\2\2\2\u0080~\3\2\2\2\u0080\u0081\3\2\2\2")
+        buf.write(u"\u0081\u0083\3\2\2\2\u0082\u0080\3\2\2\2\u0083\u008d")
+        buf.write(u"\7\25\2\2\u0084\u0088\7*\2\2\u0085\u0087\5\20\t\2\u0086")
+        buf.write(u"\u0085\3\2\2\2\u0087\u008a\3\2\2\2\u0088\u0086\3\2\2")
+        buf.write(u"\2\u0088\u0089\3\2\2\2\u0089\u008b\3\2\2\2\u008a\u0088")
+        buf.write(u"\3\2\2\2\u008b\u008d\7+\2\2\u008c|\3\2\2\2\u008c\u0084")
+        buf.write(u"\3\2\2\2\u008d\17\3\2\2\2\u008e\u008f\5\22\n\2\u008f")
+        buf.write(u"\21\3\2\2\2\u0090\u00b7\5\16\b\2\u0091\u00b7\5\24\13")
+        buf.write(u"\2\u0092\u00b7\5\26\f\2\u0093\u0095\5\30\r\2\u0094\u0096")
+        buf.write(u"\7\30\2\2\u0095\u0094\3\2\2\2\u0095\u0096\3\2\2\2\u0096")
+        buf.write(u"\u00b7\3\2\2\2\u0097\u0099\7\17\2\2\u0098\u009a\5*\26")
+        buf.write(u"\2\u0099\u0098\3\2\2\2\u0099\u009a\3\2\2\2\u009a\u009c")
+        buf.write(u"\3\2\2\2\u009b\u009d\7\30\2\2\u009c\u009b\3\2\2\2\u009c")
+        buf.write(u"\u009d\3\2\2\2\u009d\u00b7\3\2\2\2\u009e\u00a0\7\20\2")
+        buf.write(u"\2\u009f\u00a1\7\30\2\2\u00a0\u009f\3\2\2\2\u00a0\u00a1")
+        buf.write(u"\3\2\2\2\u00a1\u00b7\3\2\2\2\u00a2\u00a4\7\21\2\2\u00a3")
+        buf.write(u"\u00a5\7\30\2\2\u00a4\u00a3\3\2\2\2\u00a4\u00a5\3\2\2")
+        buf.write(u"\2\u00a5\u00b7\3\2\2\2\u00a6\u00a8\5\32\16\2\u00a7\u00a9")
+        buf.write(u"\7\30\2\2\u00a8\u00a7\3\2\2\2\u00a8\u00a9\3\2\2\2\u00a9")
+        buf.write(u"\u00b7\3\2\2\2\u00aa\u00ac\5\34\17\2\u00ab\u00ad\7\30")
+        buf.write(u"\2\2\u00ac\u00ab\3\2\2\2\u00ac\u00ad\3\2\2\2\u00ad\u00b7")
+        buf.write(u"\3\2\2\2\u00ae\u00b0\5\36\20\2\u00af\u00b1\7\30\2\2\u00b0")
+        buf.write(u"\u00af\3\2\2\2\u00b0\u00b1\3\2\2\2\u00b1\u00b7\3\2\2")
+        buf.write(u"\2\u00b2\u00b4\5 \21\2\u00b3\u00b5\7\30\2\2\u00b4\u00b3")
+        buf.write(u"\3\2\2\2\u00b4\u00b5\3\2\2\2\u00b5\u00b7\3\2\2\2\u00b6")
+        buf.write(u"\u0090\3\2\2\2\u00b6\u0091\3\2\2\2\u00b6\u0092\3\2\2")
+        buf.write(u"\2\u00b6\u0093\3\2\2\2\u00b6\u0097\3\2\2\2\u00b6\u009e")
+        buf.write(u"\3\2\2\2\u00b6\u00a2\3\2\2\2\u00b6\u00a6\3\2\2\2\u00b6")
+        buf.write(u"\u00aa\3\2\2\2\u00b6\u00ae\3\2\2\2\u00b6\u00b2\3\2\2")
+        buf.write(u"\2\u00b7\23\3\2\2\2\u00b8\u00b9\7\f\2\2\u00b9\u00ba\5")
+        buf.write(u"&\24\2\u00ba\u00bb\5\22\n\2\u00bb\u00c3\3\2\2\2\u00bc")
+        buf.write(u"\u00bd\7\f\2\2\u00bd\u00be\7\22\2\2\u00be\u00bf\5&\24")
+        buf.write(u"\2\u00bf\u00c0\7\23\2\2\u00c0\u00c1\5\22\n\2\u00c1\u00c3")
+        buf.write(u"\3\2\2\2\u00c2\u00b8\3\2\2\2\u00c2\u00bc\3\2\2\2\u00c3")
+        buf.write(u"\25\3\2\2\2\u00c4\u00c5\7\16\2\2\u00c5\u00c6\5$\23\2")
+        buf.write(u"\u00c6\u00c9\5\22\n\2\u00c7\u00c8\7\3\2\2\u00c8\u00ca")
+        buf.write(u"\5\22\n\2\u00c9\u00c7\3\2\2\2\u00c9\u00ca\3\2\2\2\u00ca")
+        buf.write(u"\27\3\2\2\2\u00cb\u00cc\5*\26\2\u00cc\31\3\2\2\2\u00cd")
+        buf.write(u"\u00cf\7\r\2\2\u00ce\u00d0\5*\26\2\u00cf\u00ce\3\2\2")
+        buf.write(u"\2\u00cf\u00d0\3\2\2\2\u00d0\u00d5\3\2\2\2\u00d1\u00d2")
+        buf.write(u"\7\31\2\2\u00d2\u00d4\5*\26\2\u00d3\u00d1\3\2\2\2\u00d4")
+        buf.write(u"\u00d7\3\2\2\2\u00d5\u00d3\3\2\2\2\u00d5\u00d6\3\2\2")
+        buf.write(u"\2\u00d6\33\3\2\2\2\u00d7\u00d5\3\2\2\2\u00d8\u00da\7")
+        buf.write(u"\4\2\2\u00d9\u00db\5*\26\2\u00da\u00d9\3\2\2\2\u00da")
+        buf.write(u"\u00db\3\2\2\2\u00db\35\3\2\2\2\u00dc\u00dd\7$\2\2\u00dd")
+        buf.write(u"\u00df\7$\2\2\u00de\u00e0\5*\26\2\u00df\u00de\3\2\2\2")
+        buf.write(u"\u00df\u00e0\3\2\2\2\u00e0\u00e5\3\2\2\2\u00e1\u00e2")
+        buf.write(u"\7\31\2\2\u00e2\u00e4\5*\26\2\u00e3\u00e1\3\2\2\2\u00e4")
+        buf.write(u"\u00e7\3\2\2\2\u00e5\u00e3\3\2\2\2\u00e5\u00e6\3\2\2")
+        buf.write(u"\2\u00e6\37\3\2\2\2\u00e7\u00e5\3\2\2\2\u00e8\u00e9\t")
+        buf.write(u"\2\2\2\u00e9!\3\2\2\2\u00ea\u00ef\5*\26\2\u00eb\u00ec")
+        buf.write(u"\7\31\2\2\u00ec\u00ee\5*\26\2\u00ed\u00eb\3\2\2\2\u00ee")
+        buf.write(u"\u00f1\3\2\2\2\u00ef\u00ed\3\2\2\2\u00ef\u00f0\3\2\2")
+        buf.write(u"\2\u00f0#\3\2\2\2\u00f1\u00ef\3\2\2\2\u00f2\u00f8\5*")
+        buf.write(u"\26\2\u00f3\u00f4\7\22\2\2\u00f4\u00f5\5*\26\2\u00f5")
+        buf.write(u"\u00f6\7\23\2\2\u00f6\u00f8\3\2\2\2\u00f7\u00f2\3\2\2")
+        buf.write(u"\2\u00f7\u00f3\3\2\2\2\u00f8%\3\2\2\2\u00f9\u00fa\7Q")
+        buf.write(u"\2\2\u00fa\u00fb\7\31\2\2\u00fb\u00fc\5(\25\2\u00fc\'")
+        buf.write(u"\3\2\2\2\u00fd\u00fe\5*\26\2\u00fe)\3\2\2\2\u00ff\u0100")
+        buf.write(u"\5,\27\2\u0100+\3\2\2\2\u0101\u0104\5.\30\2\u0102\u0103")
+        buf.write(u"\t\3\2\2\u0103\u0105\5,\27\2\u0104\u0102\3\2\2\2\u0104")
+        buf.write(u"\u0105\3\2\2\2\u0105-\3\2\2\2\u0106\u010b\5\60\31\2\u0107")
+        buf.write(u"\u0108\t\4\2\2\u0108\u010a\5\60\31\2\u0109\u0107\3\2")
+        buf.write(u"\2\2\u010a\u010d\3\2\2\2\u010b\u0109\3\2\2\2\u010b\u010c")
+        buf.write(u"\3\2\2\2\u010c/\3\2\2\2\u010d\u010b\3\2\2\2\u010e\u0113")
+        buf.write(u"\5\62\32\2\u010f\u0110\t\5\2\2\u0110\u0112\5\62\32\2")
+        buf.write(u"\u0111\u010f\3\2\2\2\u0112\u0115\3\2\2\2\u0113\u0111")
+        buf.write(u"\3\2\2\2\u0113\u0114\3\2\2\2\u0114\61\3\2\2\2\u0115\u0113")
+        buf.write(u"\3\2\2\2\u0116\u011b\5\64\33\2\u0117\u0118\t\6\2\2\u0118")
+        buf.write(u"\u011a\5\64\33\2\u0119\u0117\3\2\2\2\u011a\u011d\3\2")
+        buf.write(u"\2\2\u011b\u0119\3\2\2\2\u011b\u011c\3\2\2\2\u011c\63")
+        buf.write(u"\3\2\2\2\u011d\u011b\3\2\2\2\u011e\u0123\5\66\34\2\u011f")
+        buf.write(u"\u0120\t\7\2\2\u0120\u0122\5\66\34\2\u0121\u011f\3\2")
+        buf.write(u"\2\2\u0122\u0125\3\2\2\2\u0123\u0121\3\2\2\2\u0123\u0124")
+        buf.write(u"\3\2\2\2\u0124\65\3\2\2\2\u0125\u0123\3\2\2\2\u0126\u012b")
+        buf.write(u"\58\35\2\u0127\u0128\t\b\2\2\u0128\u012a\58\35\2\u0129")
+        buf.write(u"\u0127\3\2\2\2\u012a\u012d\3\2\2\2\u012b\u0129\3\2\2")
+        buf.write(u"\2\u012b\u012c\3\2\2\2\u012c\67\3\2\2\2\u012d\u012b\3")
+        buf.write(u"\2\2\2\u012e\u012f\t\t\2\2\u012f\u0134\58\35\2\u0130")
+        buf.write(u"\u0131\t\n\2\2\u0131\u0134\58\35\2\u0132\u0134\5:\36")
+        buf.write(u"\2\u0133\u012e\3\2\2\2\u0133\u0130\3\2\2\2\u0133\u0132")
+        buf.write(u"\3\2\2\2\u01349\3\2\2\2\u0135\u013d\5D#\2\u0136\u0138")
+        buf.write(u"\7\22\2\2\u0137\u0139\5\"\22\2\u0138\u0137\3\2\2\2\u0138")
+        buf.write(u"\u0139\3\2\2\2\u0139\u013a\3\2\2\2\u013a\u013c\7\23\2")
+        buf.write(u"\2\u013b\u0136\3\2\2\2\u013c\u013f\3\2\2\2\u013d\u013b")
+        buf.write(u"\3\2\2\2\u013d\u013e\3\2\2\2\u013e;\3\2\2\2\u013f\u013d")
+        buf.write(u"\3\2\2\2\u0140\u0141\7\24\2\2\u0141\u0142\5> \2\u0142")
+        buf.write(u"\u0143\7\25\2\2\u0143=\3\2\2\2\u0144\u0146\7H\2\2\u0145")
+        buf.write(u"\u0144\3\2\2\2\u0145\u0146\3\2\2\2\u0146\u0147\3\2\2")
+        buf.write(u"\2\u0147\u0150\5@!\2\u0148\u014a\7H\2\2\u0149\u0148\3")
+        buf.write(u"\2\2\2\u0149\u014a\3\2\2\2\u014a\u014b\3\2\2\2\u014b")
+        buf.write(u"\u014c\5@!\2\u014c\u014d\7;\2\2\u014d\u014e\5@!\2\u014e")
+        buf.write(u"\u0150\3\2\2\2\u014f\u0145\3\2\2\2\u014f\u0149\3\2\2")
+        buf.write(u"\2\u0150?\3\2\2\2\u0151\u0157\5B\"\2\u0152\u0153\5B\"")
+        buf.write(u"\2\u0153\u0154\7\60\2\2\u0154\u0155\5B\"\2\u0155\u0157")
+        buf.write(u"\3\2\2\2\u0156\u0151\3\2\2\2\u0156\u0152\3\2\2\2\u0157")
+        buf.write(u"A\3\2\2\2\u0158\u0159\t\13\2\2\u0159C\3\2\2\2\u015a\u015c")
+        buf.write(u"\7Q\2\2\u015b\u015d\5<\37\2\u015c\u015b\3\2\2\2\u015c")
+        buf.write(u"\u015d\3\2\2\2\u015d\u0178\3\2\2\2\u015e\u0160\5F$\2")
+        buf.write(u"\u015f\u0161\5<\37\2\u0160\u015f\3\2\2\2\u0160\u0161")
+        buf.write(u"\3\2\2\2\u0161\u0178\3\2\2\2\u0162\u0163\7\22\2\2\u0163")
+        buf.write(u"\u0164\5*\26\2\u0164\u0166\7\23\2\2\u0165\u0167\5<\37")
+        buf.write(u"\2\u0166\u0165\3\2\2\2\u0166\u0167\3\2\2\2\u0167\u0178")
+        buf.write(u"\3\2\2\2\u0168\u016a\7\26\2\2\u0169\u016b\5*\26\2\u016a")
+        buf.write(u"\u0169\3\2\2\2\u016a\u016b\3\2\2\2\u016b\u0170\3\2\2")
+        buf.write(u"\2\u016c\u016d\7\31\2\2\u016d\u016f\5*\26\2\u016e\u016c")
+        buf.write(u"\3\2\2\2\u016f\u0172\3\2\2\2\u0170\u016e\3\2\2\2\u0170")
+        buf.write(u"\u0171\3\2\2\2\u0171\u0173\3\2\2\2\u0172\u0170\3\2\2")
+        buf.write(u"\2\u0173\u0175\7\27\2\2\u0174\u0176\5<\37\2\u0175\u0174")
+        buf.write(u"\3\2\2\2\u0175\u0176\3\2\2\2\u0176\u0178\3\2\2\2\u0177")
+        buf.write(u"\u015a\3\2\2\2\u0177\u015e\3\2\2\2\u0177\u0162\3\2\2")
+        buf.write(u"\2\u0177\u0168\3\2\2\2\u0178E\3\2\2\2\u0179\u017e\5L")
+        buf.write(u"\'\2\u017a\u017e\5H%\2\u017b\u017e\5P)\2\u017c\u017e")
+        buf.write(u"\5R*\2\u017d\u0179\3\2\2\2\u017d\u017a\3\2\2\2\u017d")
+        buf.write(u"\u017b\3\2\2\2\u017d\u017c\3\2\2\2\u017eG\3\2\2\2\u017f")
+        buf.write(u"\u0183\7I\2\2\u0180\u0183\7J\2\2\u0181\u0183\5J&\2\u0182")
+        buf.write(u"\u017f\3\2\2\2\u0182\u0180\3\2\2\2\u0182\u0181\3\2\2")
+        buf.write(u"\2\u0183I\3\2\2\2\u0184\u0188\7\5\2\2\u0185\u0187\n\f")
+        buf.write(u"\2\2\u0186\u0185\3\2\2\2\u0187\u018a\3\2\2\2\u0188\u0186")
+        buf.write(u"\3\2\2\2\u0188\u0189\3\2\2\2\u0189\u0193\3\2\2\2\u018a")
+        buf.write(u"\u0188\3\2\2\2\u018b\u018f\7\7\2\2\u018c\u018e\n\f\2")
+        buf.write(u"\2\u018d\u018c\3\2\2\2\u018e\u0191\3\2\2\2\u018f\u018d")
+        buf.write(u"\3\2\2\2\u018f\u0190\3\2\2\2\u0190\u0193\3\2\2\2\u0191")
+        buf.write(u"\u018f\3\2\2\2\u0192\u0184\3\2\2\2\u0192\u018b\3\2\2")
+        buf.write(u"\2\u0193K\3\2\2\2\u0194\u0198\5N(\2\u0195\u0198\7O\2")
+        buf.write(u"\2\u0196\u0198\7P\2\2\u0197\u0194\3\2\2\2\u0197\u0195")
+        buf.write(u"\3\2\2\2\u0197\u0196\3\2\2\2\u0198M\3\2\2\2\u0199\u019a")
+        buf.write(u"\t\r\2\2\u019aO\3\2\2\2\u019b\u019c\t\16\2\2\u019cQ\3")
+        buf.write(u"\2\2\2\u019d\u019e\7\n\2\2\u019eS\3\2\2\29W^fjmtz\u0080")
+        buf.write(u"\u0088\u008c\u0095\u0099\u009c\u00a0\u00a4\u00a8\u00ac")
+        buf.write(u"\u00b0\u00b4\u00b6\u00c2\u00c9\u00cf\u00d5\u00da\u00df")
+        buf.write(u"\u00e5\u00ef\u00f7\u0104\u010b\u0113\u011b\u0123\u012b")
+        buf.write(u"\u0133\u0138\u013d\u0145\u0149\u014f\u0156\u015c\u0160")
+        buf.write(u"\u0166\u016a\u0170\u0175\u0177\u017d\u0182\u0188\u018f")
+        buf.write(u"\u0192\u0197")
         return buf.getvalue()
 
 
@@ -257,17 +277,26 @@ class UnitXParser ( Parser ):
     RULE_repControl = 18
     RULE_endRep = 19
     RULE_expression = 20
-    RULE_unit = 21
-    RULE_unitSingleOrPairOperator = 22
-    RULE_unitOperator = 23
-    RULE_primary = 24
-    RULE_literal = 25
-    RULE_string = 26
-    RULE_halfString = 27
-    RULE_number = 28
-    RULE_integer = 29
-    RULE_boolean = 30
-    RULE_none = 31
+    RULE_assignmentExpression = 21
+    RULE_logicalExpression = 22
+    RULE_equalityExpression = 23
+    RULE_relationalExpression = 24
+    RULE_additiveExpression = 25
+    RULE_multiplicativeExpression = 26
+    RULE_unaryExpression = 27
+    RULE_callExpression = 28
+    RULE_unit = 29
+    RULE_unitSingleOrPairOperator = 30
+    RULE_unitOperator = 31
+    RULE_unitToken = 32
+    RULE_primary = 33
+    RULE_literal = 34
+    RULE_string = 35
+    RULE_halfString = 36
+    RULE_number = 37
+    RULE_integer = 38
+    RULE_boolean = 39
+    RULE_none = 40
 
     ruleNames =  [ u"program", u"typeDeclaration", u"functionDeclaration", 
                    u"formalParameters", u"formalParameterList", u"formalParameter", 
@@ -275,8 +304,11 @@ class UnitXParser ( Parser ):
                    u"ifStatement", u"expressionStatement", u"printStatement", 
                    u"assertStatement", u"dumpStatement", u"borderStatement", 
                    u"expressionList", u"parExpression", u"repControl", u"endRep", 
-                   u"expression", u"unit", u"unitSingleOrPairOperator", 
-                   u"unitOperator", u"primary", u"literal", u"string", u"halfString", 
+                   u"expression", u"assignmentExpression", u"logicalExpression", 
+                   u"equalityExpression", u"relationalExpression", u"additiveExpression", 
+                   u"multiplicativeExpression", u"unaryExpression", u"callExpression", 
+                   u"unit", u"unitSingleOrPairOperator", u"unitOperator", 
+                   u"unitToken", u"primary", u"literal", u"string", u"halfString", 
                    u"number", u"integer", u"boolean", u"none" ]
 
     EOF = Token.EOF
@@ -416,17 +448,17 @@ class UnitXParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 67
+            self.state = 85
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while (((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << UnitXParser.T__1) | (1 << UnitXParser.T__2) | (1 << UnitXParser.T__4) | (1 << UnitXParser.T__5) | (1 << UnitXParser.T__6) | (1 << UnitXParser.T__7) | (1 << UnitXParser.DEF) | (1 << UnitXParser.REP) | (1 << UnitXParser.PRINT) | (1 << UnitXParser.IF) | (1 << UnitXParser.RETURN) | (1 << UnitXParser.BREAK) | (1 << UnitXParser.CONTINUE) | (1 << UnitXParser.LPAREN) | (1 << UnitXParser.LBRACE) | (1 << UnitXParser.LBRACK) | (1 << UnitXParser.THREE_BORDER) | (1 << UnitXParser.FOUR_BORDER) | (1 << UnitXParser.FIVE_BORDER) | (1 << UnitXParser.SIX_BORDER) | (1 << UnitXParser.SEVEN_BORDER) | (1 << UnitXParser.EIGHT_BORDER) | (1 << UnitXParser.NINE_BORDER) | (1 << UnitXParser.TEN_BORDER) | (1 << UnitXParser.GT) | (1 << UnitXParser.BANG) | (1 << UnitXParser.BANG_X) | (1 << UnitXParser.COLON) | (1 << UnitXParser.INC) | (1 << UnitXParser.DEC))) != 0) or ((((_la - 71)) & ~0x3f) == 0 and ((1 << (_la - 71)) & ((1 << (UnitXParser.STRING_LITERAL - 71)) | (1 << (UnitXParser.BYTES_LITERAL - 71)) | (1 << (UnitXParser.DECIMAL_INTEGER - 71)) | (1 << (UnitXParser.OCT_INTEGER - 71)) | (1 << (UnitXParser.HEX_INTEGER - 71)) | (1 << (UnitXParser.BIN_INTEGER - 71)) | (1 << (UnitXParser.FLOAT_NUMBER - 71)) | (1 << (UnitXParser.IMAG_NUMBER - 71)) | (1 << (UnitXParser.Identifier - 71)))) != 0):
-                self.state = 64
+                self.state = 82
                 self.typeDeclaration()
-                self.state = 69
+                self.state = 87
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 70
+            self.state = 88
             self.match(UnitXParser.EOF)
         except RecognitionException as re:
             localctx.exception = re
@@ -475,16 +507,16 @@ class UnitXParser ( Parser ):
         localctx = UnitXParser.TypeDeclarationContext(self, self._ctx, self.state)
         self.enterRule(localctx, 2, self.RULE_typeDeclaration)
         try:
-            self.state = 74
+            self.state = 92
             token = self._input.LA(1)
             if token in [UnitXParser.T__1, UnitXParser.T__2, UnitXParser.T__4, UnitXParser.T__5, UnitXParser.T__6, UnitXParser.T__7, UnitXParser.REP, UnitXParser.PRINT, UnitXParser.IF, UnitXParser.RETURN, UnitXParser.BREAK, UnitXParser.CONTINUE, UnitXParser.LPAREN, UnitXParser.LBRACE, UnitXParser.LBRACK, UnitXParser.THREE_BORDER, UnitXParser.FOUR_BORDER, UnitXParser.FIVE_BORDER, UnitXParser.SIX_BORDER, UnitXParser.SEVEN_BORDER, UnitXParser.EIGHT_BORDER, UnitXParser.NINE_BORDER, UnitXParser.TEN_BORDER, UnitXParser.GT, UnitXParser.BANG, UnitXParser.BANG_X, UnitXParser.COLON, UnitXParser.INC, UnitXParser.DEC, UnitXParser.STRING_LITERAL, UnitXParser.BYTES_LITERAL, UnitXParser.DECIMAL_INTEGER, UnitXParser.OCT_INTEGER, UnitXParser.HEX_INTEGER, UnitXParser.BIN_INTEGER, UnitXParser.FLOAT_NUMBER, UnitXParser.IMAG_NUMBER, UnitXParser.Identifier]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 72
+                self.state = 90
                 self.statement()
 
             elif token in [UnitXParser.DEF]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 73
+                self.state = 91
                 self.functionDeclaration()
 
             else:
@@ -541,13 +573,13 @@ class UnitXParser ( Parser ):
         self.enterRule(localctx, 4, self.RULE_functionDeclaration)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 76
+            self.state = 94
             self.match(UnitXParser.DEF)
-            self.state = 77
+            self.state = 95
             self.match(UnitXParser.Identifier)
-            self.state = 78
+            self.state = 96
             self.formalParameters()
-            self.state = 79
+            self.state = 97
             self.block()
         except RecognitionException as re:
             localctx.exception = re
@@ -593,30 +625,30 @@ class UnitXParser ( Parser ):
         self.enterRule(localctx, 6, self.RULE_formalParameters)
         self._la = 0 # Token type
         try:
-            self.state = 89
+            self.state = 107
             token = self._input.LA(1)
             if token in [UnitXParser.LBRACE, UnitXParser.COLON, UnitXParser.Identifier]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 82
+                self.state = 100
                 _la = self._input.LA(1)
                 if _la==UnitXParser.Identifier:
-                    self.state = 81
+                    self.state = 99
                     self.formalParameterList()
 
 
 
             elif token in [UnitXParser.LPAREN]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 84
+                self.state = 102
                 self.match(UnitXParser.LPAREN)
-                self.state = 86
+                self.state = 104
                 _la = self._input.LA(1)
                 if _la==UnitXParser.Identifier:
-                    self.state = 85
+                    self.state = 103
                     self.formalParameterList()
 
 
-                self.state = 88
+                self.state = 106
                 self.match(UnitXParser.RPAREN)
 
             else:
@@ -670,17 +702,17 @@ class UnitXParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 91
+            self.state = 109
             self.formalParameter()
-            self.state = 96
+            self.state = 114
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while _la==UnitXParser.COMMA:
-                self.state = 92
+                self.state = 110
                 self.match(UnitXParser.COMMA)
-                self.state = 93
+                self.state = 111
                 self.formalParameter()
-                self.state = 98
+                self.state = 116
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -732,15 +764,15 @@ class UnitXParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 99
+            self.state = 117
             self.match(UnitXParser.Identifier)
-            self.state = 102
+            self.state = 120
             _la = self._input.LA(1)
             if _la==UnitXParser.ASSIGN:
-                self.state = 100
+                self.state = 118
                 self.match(UnitXParser.ASSIGN)
-                self.state = 101
-                self.expression(0)
+                self.state = 119
+                self.expression()
 
 
         except RecognitionException as re:
@@ -790,40 +822,40 @@ class UnitXParser ( Parser ):
         self.enterRule(localctx, 12, self.RULE_block)
         self._la = 0 # Token type
         try:
-            self.state = 120
+            self.state = 138
             token = self._input.LA(1)
             if token in [UnitXParser.LBRACE]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 104
+                self.state = 122
                 self.match(UnitXParser.LBRACE)
-                self.state = 108
+                self.state = 126
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while (((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << UnitXParser.T__1) | (1 << UnitXParser.T__2) | (1 << UnitXParser.T__4) | (1 << UnitXParser.T__5) | (1 << UnitXParser.T__6) | (1 << UnitXParser.T__7) | (1 << UnitXParser.REP) | (1 << UnitXParser.PRINT) | (1 << UnitXParser.IF) | (1 << UnitXParser.RETURN) | (1 << UnitXParser.BREAK) | (1 << UnitXParser.CONTINUE) | (1 << UnitXParser.LPAREN) | (1 << UnitXParser.LBRACE) | (1 << UnitXParser.LBRACK) | (1 << UnitXParser.THREE_BORDER) | (1 << UnitXParser.FOUR_BORDER) | (1 << UnitXParser.FIVE_BORDER) | (1 << UnitXParser.SIX_BORDER) | (1 << UnitXParser.SEVEN_BORDER) | (1 << UnitXParser.EIGHT_BORDER) | (1 << UnitXParser.NINE_BORDER) | (1 << UnitXParser.TEN_BORDER) | (1 << UnitXParser.GT) | (1 << UnitXParser.BANG) | (1 << UnitXParser.BANG_X) | (1 << UnitXParser.COLON) | (1 << UnitXParser.INC) | (1 << UnitXParser.DEC))) != 0) or ((((_la - 71)) & ~0x3f) == 0 and ((1 << (_la - 71)) & ((1 << (UnitXParser.STRING_LITERAL - 71)) | (1 << (UnitXParser.BYTES_LITERAL - 71)) | (1 << (UnitXParser.DECIMAL_INTEGER - 71)) | (1 << (UnitXParser.OCT_INTEGER - 71)) | (1 << (UnitXParser.HEX_INTEGER - 71)) | (1 << (UnitXParser.BIN_INTEGER - 71)) | (1 << (UnitXParser.FLOAT_NUMBER - 71)) | (1 << (UnitXParser.IMAG_NUMBER - 71)) | (1 << (UnitXParser.Identifier - 71)))) != 0):
-                    self.state = 105
+                    self.state = 123
                     self.blockStatement()
-                    self.state = 110
+                    self.state = 128
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
 
-                self.state = 111
+                self.state = 129
                 self.match(UnitXParser.RBRACE)
 
             elif token in [UnitXParser.COLON]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 112
+                self.state = 130
                 self.match(UnitXParser.COLON)
-                self.state = 116
+                self.state = 134
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while (((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << UnitXParser.T__1) | (1 << UnitXParser.T__2) | (1 << UnitXParser.T__4) | (1 << UnitXParser.T__5) | (1 << UnitXParser.T__6) | (1 << UnitXParser.T__7) | (1 << UnitXParser.REP) | (1 << UnitXParser.PRINT) | (1 << UnitXParser.IF) | (1 << UnitXParser.RETURN) | (1 << UnitXParser.BREAK) | (1 << UnitXParser.CONTINUE) | (1 << UnitXParser.LPAREN) | (1 << UnitXParser.LBRACE) | (1 << UnitXParser.LBRACK) | (1 << UnitXParser.THREE_BORDER) | (1 << UnitXParser.FOUR_BORDER) | (1 << UnitXParser.FIVE_BORDER) | (1 << UnitXParser.SIX_BORDER) | (1 << UnitXParser.SEVEN_BORDER) | (1 << UnitXParser.EIGHT_BORDER) | (1 << UnitXParser.NINE_BORDER) | (1 << UnitXParser.TEN_BORDER) | (1 << UnitXParser.GT) | (1 << UnitXParser.BANG) | (1 << UnitXParser.BANG_X) | (1 << UnitXParser.COLON) | (1 << UnitXParser.INC) | (1 << UnitXParser.DEC))) != 0) or ((((_la - 71)) & ~0x3f) == 0 and ((1 << (_la - 71)) & ((1 << (UnitXParser.STRING_LITERAL - 71)) | (1 << (UnitXParser.BYTES_LITERAL - 71)) | (1 << (UnitXParser.DECIMAL_INTEGER - 71)) | (1 << (UnitXParser.OCT_INTEGER - 71)) | (1 << (UnitXParser.HEX_INTEGER - 71)) | (1 << (UnitXParser.BIN_INTEGER - 71)) | (1 << (UnitXParser.FLOAT_NUMBER - 71)) | (1 << (UnitXParser.IMAG_NUMBER - 71)) | (1 << (UnitXParser.Identifier - 71)))) != 0):
-                    self.state = 113
+                    self.state = 131
                     self.blockStatement()
-                    self.state = 118
+                    self.state = 136
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
 
-                self.state = 119
+                self.state = 137
                 self.match(UnitXParser.END)
 
             else:
@@ -873,7 +905,7 @@ class UnitXParser ( Parser ):
         self.enterRule(localctx, 14, self.RULE_blockStatement)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 122
+            self.state = 140
             self.statement()
         except RecognitionException as re:
             localctx.exception = re
@@ -954,122 +986,122 @@ class UnitXParser ( Parser ):
         self.enterRule(localctx, 16, self.RULE_statement)
         self._la = 0 # Token type
         try:
-            self.state = 162
+            self.state = 180
             token = self._input.LA(1)
             if token in [UnitXParser.LBRACE, UnitXParser.COLON]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 124
+                self.state = 142
                 self.block()
 
             elif token in [UnitXParser.REP]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 125
+                self.state = 143
                 self.repStatement()
 
             elif token in [UnitXParser.IF]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 126
+                self.state = 144
                 self.ifStatement()
 
             elif token in [UnitXParser.T__2, UnitXParser.T__4, UnitXParser.T__5, UnitXParser.T__6, UnitXParser.T__7, UnitXParser.LPAREN, UnitXParser.LBRACK, UnitXParser.BANG, UnitXParser.BANG_X, UnitXParser.INC, UnitXParser.DEC, UnitXParser.STRING_LITERAL, UnitXParser.BYTES_LITERAL, UnitXParser.DECIMAL_INTEGER, UnitXParser.OCT_INTEGER, UnitXParser.HEX_INTEGER, UnitXParser.BIN_INTEGER, UnitXParser.FLOAT_NUMBER, UnitXParser.IMAG_NUMBER, UnitXParser.Identifier]:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 127
+                self.state = 145
                 self.expressionStatement()
-                self.state = 129
+                self.state = 147
                 _la = self._input.LA(1)
                 if _la==UnitXParser.SEMICOLON:
-                    self.state = 128
+                    self.state = 146
                     self.match(UnitXParser.SEMICOLON)
 
 
 
             elif token in [UnitXParser.RETURN]:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 131
+                self.state = 149
                 self.match(UnitXParser.RETURN)
-                self.state = 133
+                self.state = 151
                 la_ = self._interp.adaptivePredict(self._input,11,self._ctx)
                 if la_ == 1:
-                    self.state = 132
-                    self.expression(0)
+                    self.state = 150
+                    self.expression()
 
 
-                self.state = 136
+                self.state = 154
                 _la = self._input.LA(1)
                 if _la==UnitXParser.SEMICOLON:
-                    self.state = 135
+                    self.state = 153
                     self.match(UnitXParser.SEMICOLON)
 
 
 
             elif token in [UnitXParser.BREAK]:
                 self.enterOuterAlt(localctx, 6)
-                self.state = 138
+                self.state = 156
                 self.match(UnitXParser.BREAK)
-                self.state = 140
+                self.state = 158
                 _la = self._input.LA(1)
                 if _la==UnitXParser.SEMICOLON:
-                    self.state = 139
+                    self.state = 157
                     self.match(UnitXParser.SEMICOLON)
 
 
 
             elif token in [UnitXParser.CONTINUE]:
                 self.enterOuterAlt(localctx, 7)
-                self.state = 142
+                self.state = 160
                 self.match(UnitXParser.CONTINUE)
-                self.state = 144
+                self.state = 162
                 _la = self._input.LA(1)
                 if _la==UnitXParser.SEMICOLON:
-                    self.state = 143
+                    self.state = 161
                     self.match(UnitXParser.SEMICOLON)
 
 
 
             elif token in [UnitXParser.PRINT]:
                 self.enterOuterAlt(localctx, 8)
-                self.state = 146
+                self.state = 164
                 self.printStatement()
-                self.state = 148
+                self.state = 166
                 _la = self._input.LA(1)
                 if _la==UnitXParser.SEMICOLON:
-                    self.state = 147
+                    self.state = 165
                     self.match(UnitXParser.SEMICOLON)
 
 
 
             elif token in [UnitXParser.T__1]:
                 self.enterOuterAlt(localctx, 9)
-                self.state = 150
+                self.state = 168
                 self.assertStatement()
-                self.state = 152
+                self.state = 170
                 _la = self._input.LA(1)
                 if _la==UnitXParser.SEMICOLON:
-                    self.state = 151
+                    self.state = 169
                     self.match(UnitXParser.SEMICOLON)
 
 
 
             elif token in [UnitXParser.GT]:
                 self.enterOuterAlt(localctx, 10)
-                self.state = 154
+                self.state = 172
                 self.dumpStatement()
-                self.state = 156
+                self.state = 174
                 _la = self._input.LA(1)
                 if _la==UnitXParser.SEMICOLON:
-                    self.state = 155
+                    self.state = 173
                     self.match(UnitXParser.SEMICOLON)
 
 
 
             elif token in [UnitXParser.THREE_BORDER, UnitXParser.FOUR_BORDER, UnitXParser.FIVE_BORDER, UnitXParser.SIX_BORDER, UnitXParser.SEVEN_BORDER, UnitXParser.EIGHT_BORDER, UnitXParser.NINE_BORDER, UnitXParser.TEN_BORDER]:
                 self.enterOuterAlt(localctx, 11)
-                self.state = 158
+                self.state = 176
                 self.borderStatement()
-                self.state = 160
+                self.state = 178
                 _la = self._input.LA(1)
                 if _la==UnitXParser.SEMICOLON:
-                    self.state = 159
+                    self.state = 177
                     self.match(UnitXParser.SEMICOLON)
 
 
@@ -1124,29 +1156,29 @@ class UnitXParser ( Parser ):
         localctx = UnitXParser.RepStatementContext(self, self._ctx, self.state)
         self.enterRule(localctx, 18, self.RULE_repStatement)
         try:
-            self.state = 174
+            self.state = 192
             la_ = self._interp.adaptivePredict(self._input,20,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 164
+                self.state = 182
                 self.match(UnitXParser.REP)
-                self.state = 165
+                self.state = 183
                 self.repControl()
-                self.state = 166
+                self.state = 184
                 self.statement()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 168
+                self.state = 186
                 self.match(UnitXParser.REP)
-                self.state = 169
+                self.state = 187
                 self.match(UnitXParser.LPAREN)
-                self.state = 170
+                self.state = 188
                 self.repControl()
-                self.state = 171
+                self.state = 189
                 self.match(UnitXParser.RPAREN)
-                self.state = 172
+                self.state = 190
                 self.statement()
                 pass
 
@@ -1202,18 +1234,18 @@ class UnitXParser ( Parser ):
         self.enterRule(localctx, 20, self.RULE_ifStatement)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 176
+            self.state = 194
             self.match(UnitXParser.IF)
-            self.state = 177
+            self.state = 195
             self.parExpression()
-            self.state = 178
+            self.state = 196
             self.statement()
-            self.state = 181
+            self.state = 199
             la_ = self._interp.adaptivePredict(self._input,21,self._ctx)
             if la_ == 1:
-                self.state = 179
+                self.state = 197
                 self.match(UnitXParser.T__0)
-                self.state = 180
+                self.state = 198
                 self.statement()
 
 
@@ -1261,8 +1293,8 @@ class UnitXParser ( Parser ):
         self.enterRule(localctx, 22, self.RULE_expressionStatement)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 183
-            self.expression(0)
+            self.state = 201
+            self.expression()
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -1311,24 +1343,24 @@ class UnitXParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 185
+            self.state = 203
             self.match(UnitXParser.PRINT)
-            self.state = 187
+            self.state = 205
             la_ = self._interp.adaptivePredict(self._input,22,self._ctx)
             if la_ == 1:
-                self.state = 186
-                self.expression(0)
+                self.state = 204
+                self.expression()
 
 
-            self.state = 193
+            self.state = 211
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while _la==UnitXParser.COMMA:
-                self.state = 189
+                self.state = 207
                 self.match(UnitXParser.COMMA)
-                self.state = 190
-                self.expression(0)
-                self.state = 195
+                self.state = 208
+                self.expression()
+                self.state = 213
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -1376,13 +1408,13 @@ class UnitXParser ( Parser ):
         self.enterRule(localctx, 26, self.RULE_assertStatement)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 196
+            self.state = 214
             self.match(UnitXParser.T__1)
-            self.state = 198
+            self.state = 216
             la_ = self._interp.adaptivePredict(self._input,24,self._ctx)
             if la_ == 1:
-                self.state = 197
-                self.expression(0)
+                self.state = 215
+                self.expression()
 
 
         except RecognitionException as re:
@@ -1433,26 +1465,26 @@ class UnitXParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 200
+            self.state = 218
             self.match(UnitXParser.GT)
-            self.state = 201
+            self.state = 219
             self.match(UnitXParser.GT)
-            self.state = 203
+            self.state = 221
             la_ = self._interp.adaptivePredict(self._input,25,self._ctx)
             if la_ == 1:
-                self.state = 202
-                self.expression(0)
+                self.state = 220
+                self.expression()
 
 
-            self.state = 209
+            self.state = 227
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while _la==UnitXParser.COMMA:
-                self.state = 205
+                self.state = 223
                 self.match(UnitXParser.COMMA)
-                self.state = 206
-                self.expression(0)
-                self.state = 211
+                self.state = 224
+                self.expression()
+                self.state = 229
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -1498,7 +1530,7 @@ class UnitXParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 212
+            self.state = 230
             _la = self._input.LA(1)
             if not((((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << UnitXParser.THREE_BORDER) | (1 << UnitXParser.FOUR_BORDER) | (1 << UnitXParser.FIVE_BORDER) | (1 << UnitXParser.SIX_BORDER) | (1 << UnitXParser.SEVEN_BORDER) | (1 << UnitXParser.EIGHT_BORDER) | (1 << UnitXParser.NINE_BORDER) | (1 << UnitXParser.TEN_BORDER))) != 0)):
                 self._errHandler.recoverInline(self)
@@ -1552,17 +1584,17 @@ class UnitXParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 214
-            self.expression(0)
-            self.state = 219
+            self.state = 232
+            self.expression()
+            self.state = 237
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while _la==UnitXParser.COMMA:
-                self.state = 215
+                self.state = 233
                 self.match(UnitXParser.COMMA)
-                self.state = 216
-                self.expression(0)
-                self.state = 221
+                self.state = 234
+                self.expression()
+                self.state = 239
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -1609,21 +1641,21 @@ class UnitXParser ( Parser ):
         localctx = UnitXParser.ParExpressionContext(self, self._ctx, self.state)
         self.enterRule(localctx, 34, self.RULE_parExpression)
         try:
-            self.state = 227
+            self.state = 245
             la_ = self._interp.adaptivePredict(self._input,28,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 222
-                self.expression(0)
+                self.state = 240
+                self.expression()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 223
+                self.state = 241
                 self.match(UnitXParser.LPAREN)
-                self.state = 224
-                self.expression(0)
-                self.state = 225
+                self.state = 242
+                self.expression()
+                self.state = 243
                 self.match(UnitXParser.RPAREN)
                 pass
 
@@ -1675,11 +1707,11 @@ class UnitXParser ( Parser ):
         self.enterRule(localctx, 36, self.RULE_repControl)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 229
+            self.state = 247
             self.match(UnitXParser.Identifier)
-            self.state = 230
+            self.state = 248
             self.match(UnitXParser.COMMA)
-            self.state = 231
+            self.state = 249
             self.endRep()
         except RecognitionException as re:
             localctx.exception = re
@@ -1725,8 +1757,8 @@ class UnitXParser ( Parser ):
         self.enterRule(localctx, 38, self.RULE_endRep)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 233
-            self.expression(0)
+            self.state = 251
+            self.expression()
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -1741,19 +1773,8 @@ class UnitXParser ( Parser ):
             super(UnitXParser.ExpressionContext, self).__init__(parent, invokingState)
             self.parser = parser
 
-        def expression(self, i=None):
-            if i is None:
-                return self.getTypedRuleContexts(UnitXParser.ExpressionContext)
-            else:
-                return self.getTypedRuleContext(UnitXParser.ExpressionContext,i)
-
-
-        def primary(self):
-            return self.getTypedRuleContext(UnitXParser.PrimaryContext,0)
-
-
-        def expressionList(self):
-            return self.getTypedRuleContext(UnitXParser.ExpressionListContext,0)
+        def assignmentExpression(self):
+            return self.getTypedRuleContext(UnitXParser.AssignmentExpressionContext,0)
 
 
         def getRuleIndex(self):
@@ -1775,241 +1796,79 @@ class UnitXParser ( Parser ):
 
 
 
-    def expression(self, _p=0):
-        _parentctx = self._ctx
-        _parentState = self.state
-        localctx = UnitXParser.ExpressionContext(self, self._ctx, _parentState)
-        _prevctx = localctx
-        _startState = 40
-        self.enterRecursionRule(localctx, 40, self.RULE_expression, _p)
-        self._la = 0 # Token type
-        try:
-            self.enterOuterAlt(localctx, 1)
-            self.state = 243
-            la_ = self._interp.adaptivePredict(self._input,29,self._ctx)
-            if la_ == 1:
-                self.state = 236
-                _la = self._input.LA(1)
-                if not(_la==UnitXParser.INC or _la==UnitXParser.DEC):
-                    self._errHandler.recoverInline(self)
-                else:
-                    self.consume()
-                self.state = 237
-                self.expression(3)
-                pass
-
-            elif la_ == 2:
-                self.state = 238
-                _la = self._input.LA(1)
-                if not(_la==UnitXParser.BANG or _la==UnitXParser.BANG_X):
-                    self._errHandler.recoverInline(self)
-                else:
-                    self.consume()
-                self.state = 239
-                self.expression(2)
-                pass
-
-            elif la_ == 3:
-                self.state = 240
-                self.match(UnitXParser.BANG_X)
-                self.state = 241
-                self.expression(1)
-                pass
-
-            elif la_ == 4:
-                self.state = 242
-                self.primary()
-                pass
-
-
-            self._ctx.stop = self._input.LT(-1)
-            self.state = 271
-            self._errHandler.sync(self)
-            _alt = self._interp.adaptivePredict(self._input,32,self._ctx)
-            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
-                if _alt==1:
-                    if self._parseListeners is not None:
-                        self.triggerExitRuleEvent()
-                    _prevctx = localctx
-                    self.state = 269
-                    la_ = self._interp.adaptivePredict(self._input,31,self._ctx)
-                    if la_ == 1:
-                        localctx = UnitXParser.ExpressionContext(self, _parentctx, _parentState)
-                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expression)
-                        self.state = 245
-                        if not self.precpred(self._ctx, 9):
-                            from antlr4.error.Errors import FailedPredicateException
-                            raise FailedPredicateException(self, "self.precpred(self._ctx, 9)")
-                        self.state = 246
-                        _la = self._input.LA(1)
-                        if not((((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << UnitXParser.MUL) | (1 << UnitXParser.DIV) | (1 << UnitXParser.MOD))) != 0)):
-                            self._errHandler.recoverInline(self)
-                        else:
-                            self.consume()
-                        self.state = 247
-                        self.expression(10)
-                        pass
-
-                    elif la_ == 2:
-                        localctx = UnitXParser.ExpressionContext(self, _parentctx, _parentState)
-                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expression)
-                        self.state = 248
-                        if not self.precpred(self._ctx, 8):
-                            from antlr4.error.Errors import FailedPredicateException
-                            raise FailedPredicateException(self, "self.precpred(self._ctx, 8)")
-                        self.state = 249
-                        _la = self._input.LA(1)
-                        if not(_la==UnitXParser.ADD or _la==UnitXParser.SUB):
-                            self._errHandler.recoverInline(self)
-                        else:
-                            self.consume()
-                        self.state = 250
-                        self.expression(9)
-                        pass
-
-                    elif la_ == 3:
-                        localctx = UnitXParser.ExpressionContext(self, _parentctx, _parentState)
-                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expression)
-                        self.state = 251
-                        if not self.precpred(self._ctx, 7):
-                            from antlr4.error.Errors import FailedPredicateException
-                            raise FailedPredicateException(self, "self.precpred(self._ctx, 7)")
-                        self.state = 252
-                        _la = self._input.LA(1)
-                        if not((((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << UnitXParser.GT) | (1 << UnitXParser.LT) | (1 << UnitXParser.LE) | (1 << UnitXParser.GE))) != 0)):
-                            self._errHandler.recoverInline(self)
-                        else:
-                            self.consume()
-                        self.state = 253
-                        self.expression(8)
-                        pass
-
-                    elif la_ == 4:
-                        localctx = UnitXParser.ExpressionContext(self, _parentctx, _parentState)
-                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expression)
-                        self.state = 254
-                        if not self.precpred(self._ctx, 6):
-                            from antlr4.error.Errors import FailedPredicateException
-                            raise FailedPredicateException(self, "self.precpred(self._ctx, 6)")
-                        self.state = 255
-                        _la = self._input.LA(1)
-                        if not((((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << UnitXParser.EQUAL) | (1 << UnitXParser.EQUAL_X) | (1 << UnitXParser.NOTEQUAL))) != 0)):
-                            self._errHandler.recoverInline(self)
-                        else:
-                            self.consume()
-                        self.state = 256
-                        self.expression(7)
-                        pass
-
-                    elif la_ == 5:
-                        localctx = UnitXParser.ExpressionContext(self, _parentctx, _parentState)
-                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expression)
-                        self.state = 257
-                        if not self.precpred(self._ctx, 5):
-                            from antlr4.error.Errors import FailedPredicateException
-                            raise FailedPredicateException(self, "self.precpred(self._ctx, 5)")
-                        self.state = 258
-                        _la = self._input.LA(1)
-                        if not(((((_la - 33)) & ~0x3f) == 0 and ((1 << (_la - 33)) & ((1 << (UnitXParser.ASSIGN - 33)) | (1 << (UnitXParser.ADD_ASSIGN - 33)) | (1 << (UnitXParser.SUB_ASSIGN - 33)) | (1 << (UnitXParser.MUL_ASSIGN - 33)) | (1 << (UnitXParser.DIV_ASSIGN - 33)) | (1 << (UnitXParser.MOD_ASSIGN - 33)))) != 0)):
-                            self._errHandler.recoverInline(self)
-                        else:
-                            self.consume()
-                        self.state = 259
-                        self.expression(6)
-                        pass
-
-                    elif la_ == 6:
-                        localctx = UnitXParser.ExpressionContext(self, _parentctx, _parentState)
-                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expression)
-                        self.state = 260
-                        if not self.precpred(self._ctx, 4):
-                            from antlr4.error.Errors import FailedPredicateException
-                            raise FailedPredicateException(self, "self.precpred(self._ctx, 4)")
-                        self.state = 261
-                        _la = self._input.LA(1)
-                        if not((((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << UnitXParser.AND) | (1 << UnitXParser.OR) | (1 << UnitXParser.AND_X) | (1 << UnitXParser.OR_X))) != 0)):
-                            self._errHandler.recoverInline(self)
-                        else:
-                            self.consume()
-                        self.state = 262
-                        self.expression(5)
-                        pass
-
-                    elif la_ == 7:
-                        localctx = UnitXParser.ExpressionContext(self, _parentctx, _parentState)
-                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expression)
-                        self.state = 263
-                        if not self.precpred(self._ctx, 10):
-                            from antlr4.error.Errors import FailedPredicateException
-                            raise FailedPredicateException(self, "self.precpred(self._ctx, 10)")
-                        self.state = 264
-                        self.match(UnitXParser.LPAREN)
-                        self.state = 266
-                        _la = self._input.LA(1)
-                        if (((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << UnitXParser.T__2) | (1 << UnitXParser.T__4) | (1 << UnitXParser.T__5) | (1 << UnitXParser.T__6) | (1 << UnitXParser.T__7) | (1 << UnitXParser.LPAREN) | (1 << UnitXParser.LBRACK) | (1 << UnitXParser.BANG) | (1 << UnitXParser.BANG_X) | (1 << UnitXParser.INC) | (1 << UnitXParser.DEC))) != 0) or ((((_la - 71)) & ~0x3f) == 0 and ((1 << (_la - 71)) & ((1 << (UnitXParser.STRING_LITERAL - 71)) | (1 << (UnitXParser.BYTES_LITERAL - 71)) | (1 << (UnitXParser.DECIMAL_INTEGER - 71)) | (1 << (UnitXParser.OCT_INTEGER - 71)) | (1 << (UnitXParser.HEX_INTEGER - 71)) | (1 << (UnitXParser.BIN_INTEGER - 71)) | (1 << (UnitXParser.FLOAT_NUMBER - 71)) | (1 << (UnitXParser.IMAG_NUMBER - 71)) | (1 << (UnitXParser.Identifier - 71)))) != 0):
-                            self.state = 265
-                            self.expressionList()
-
-
-                        self.state = 268
-                        self.match(UnitXParser.RPAREN)
-                        pass
 
-             
-                self.state = 273
-                self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,32,self._ctx)
+    def expression(self):
 
+        localctx = UnitXParser.ExpressionContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 40, self.RULE_expression)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 253
+            self.assignmentExpression()
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
             self._errHandler.recover(self, re)
         finally:
-            self.unrollRecursionContexts(_parentctx)
+            self.exitRule()
         return localctx
 
-    class UnitContext(ParserRuleContext):
+    class AssignmentExpressionContext(ParserRuleContext):
 
         def __init__(self, parser, parent=None, invokingState=-1):
-            super(UnitXParser.UnitContext, self).__init__(parent, invokingState)
+            super(UnitXParser.AssignmentExpressionContext, self).__init__(parent, invokingState)
             self.parser = parser
 
-        def unitSingleOrPairOperator(self):
-            return self.getTypedRuleContext(UnitXParser.UnitSingleOrPairOperatorContext,0)
+        def logicalExpression(self):
+            return self.getTypedRuleContext(UnitXParser.LogicalExpressionContext,0)
+
+
+        def assignmentExpression(self):
+            return self.getTypedRuleContext(UnitXParser.AssignmentExpressionContext,0)
 
 
         def getRuleIndex(self):
-            return UnitXParser.RULE_unit
+            return UnitXParser.RULE_assignmentExpression
 
         def enterRule(self, listener):
-            if hasattr(listener, "enterUnit"):
-                listener.enterUnit(self)
+            if hasattr(listener, "enterAssignmentExpression"):
+                listener.enterAssignmentExpression(self)
 
         def exitRule(self, listener):
-            if hasattr(listener, "exitUnit"):
-                listener.exitUnit(self)
+            if hasattr(listener, "exitAssignmentExpression"):
+                listener.exitAssignmentExpression(self)
 
         def accept(self, visitor):
-            if hasattr(visitor, "visitUnit"):
-                return visitor.visitUnit(self)
+            if hasattr(visitor, "visitAssignmentExpression"):
+                return visitor.visitAssignmentExpression(self)
             else:
                 return visitor.visitChildren(self)
 
 
 
 
-    def unit(self):
+    def assignmentExpression(self):
 
-        localctx = UnitXParser.UnitContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 42, self.RULE_unit)
+        localctx = UnitXParser.AssignmentExpressionContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 42, self.RULE_assignmentExpression)
+        self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 274
-            self.match(UnitXParser.LBRACE)
-            self.state = 275
-            self.unitSingleOrPairOperator()
-            self.state = 276
-            self.match(UnitXParser.RBRACE)
+            self.state = 255
+            self.logicalExpression()
+            self.state = 258
+            _la = self._input.LA(1)
+            if ((((_la - 33)) & ~0x3f) == 0 and ((1 << (_la - 33)) & ((1 << (UnitXParser.ASSIGN - 33)) | (1 << (UnitXParser.ADD_ASSIGN - 33)) | (1 << (UnitXParser.SUB_ASSIGN - 33)) | (1 << (UnitXParser.MUL_ASSIGN - 33)) | (1 << (UnitXParser.DIV_ASSIGN - 33)) | (1 << (UnitXParser.MOD_ASSIGN - 33)))) != 0):
+                self.state = 256
+                _la = self._input.LA(1)
+                if not(((((_la - 33)) & ~0x3f) == 0 and ((1 << (_la - 33)) & ((1 << (UnitXParser.ASSIGN - 33)) | (1 << (UnitXParser.ADD_ASSIGN - 33)) | (1 << (UnitXParser.SUB_ASSIGN - 33)) | (1 << (UnitXParser.MUL_ASSIGN - 33)) | (1 << (UnitXParser.DIV_ASSIGN - 33)) | (1 << (UnitXParser.MOD_ASSIGN - 33)))) != 0)):
+                    self._errHandler.recoverInline(self)
+                else:
+                    self.consume()
+                self.state = 257
+                self.assignmentExpression()
+
+
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -2018,77 +1877,63 @@ class UnitXParser ( Parser ):
             self.exitRule()
         return localctx
 
-    class UnitSingleOrPairOperatorContext(ParserRuleContext):
+    class LogicalExpressionContext(ParserRuleContext):
 
         def __init__(self, parser, parent=None, invokingState=-1):
-            super(UnitXParser.UnitSingleOrPairOperatorContext, self).__init__(parent, invokingState)
+            super(UnitXParser.LogicalExpressionContext, self).__init__(parent, invokingState)
             self.parser = parser
 
-        def unitOperator(self, i=None):
+        def equalityExpression(self, i=None):
             if i is None:
-                return self.getTypedRuleContexts(UnitXParser.UnitOperatorContext)
+                return self.getTypedRuleContexts(UnitXParser.EqualityExpressionContext)
             else:
-                return self.getTypedRuleContext(UnitXParser.UnitOperatorContext,i)
+                return self.getTypedRuleContext(UnitXParser.EqualityExpressionContext,i)
 
 
         def getRuleIndex(self):
-            return UnitXParser.RULE_unitSingleOrPairOperator
+            return UnitXParser.RULE_logicalExpression
 
         def enterRule(self, listener):
-            if hasattr(listener, "enterUnitSingleOrPairOperator"):
-                listener.enterUnitSingleOrPairOperator(self)
+            if hasattr(listener, "enterLogicalExpression"):
+                listener.enterLogicalExpression(self)
 
         def exitRule(self, listener):
-            if hasattr(listener, "exitUnitSingleOrPairOperator"):
-                listener.exitUnitSingleOrPairOperator(self)
+            if hasattr(listener, "exitLogicalExpression"):
+                listener.exitLogicalExpression(self)
 
         def accept(self, visitor):
-            if hasattr(visitor, "visitUnitSingleOrPairOperator"):
-                return visitor.visitUnitSingleOrPairOperator(self)
+            if hasattr(visitor, "visitLogicalExpression"):
+                return visitor.visitLogicalExpression(self)
             else:
                 return visitor.visitChildren(self)
 
 
 
 
-    def unitSingleOrPairOperator(self):
+    def logicalExpression(self):
 
-        localctx = UnitXParser.UnitSingleOrPairOperatorContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 44, self.RULE_unitSingleOrPairOperator)
+        localctx = UnitXParser.LogicalExpressionContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 44, self.RULE_logicalExpression)
         self._la = 0 # Token type
         try:
-            self.state = 289
-            la_ = self._interp.adaptivePredict(self._input,35,self._ctx)
-            if la_ == 1:
-                self.enterOuterAlt(localctx, 1)
-                self.state = 279
+            self.enterOuterAlt(localctx, 1)
+            self.state = 260
+            self.equalityExpression()
+            self.state = 265
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << UnitXParser.AND) | (1 << UnitXParser.OR) | (1 << UnitXParser.AND_X) | (1 << UnitXParser.OR_X))) != 0):
+                self.state = 261
                 _la = self._input.LA(1)
-                if _la==UnitXParser.AT:
-                    self.state = 278
-                    self.match(UnitXParser.AT)
-
-
-                self.state = 281
-                self.unitOperator()
-                pass
-
-            elif la_ == 2:
-                self.enterOuterAlt(localctx, 2)
-                self.state = 283
+                if not((((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << UnitXParser.AND) | (1 << UnitXParser.OR) | (1 << UnitXParser.AND_X) | (1 << UnitXParser.OR_X))) != 0)):
+                    self._errHandler.recoverInline(self)
+                else:
+                    self.consume()
+                self.state = 262
+                self.equalityExpression()
+                self.state = 267
+                self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if _la==UnitXParser.AT:
-                    self.state = 282
-                    self.match(UnitXParser.AT)
-
-
-                self.state = 285
-                self.unitOperator()
-                self.state = 286
-                self.match(UnitXParser.DIV)
-                self.state = 287
-                self.unitOperator()
-                pass
-
 
         except RecognitionException as re:
             localctx.exception = re
@@ -2098,61 +1943,63 @@ class UnitXParser ( Parser ):
             self.exitRule()
         return localctx
 
-    class UnitOperatorContext(ParserRuleContext):
+    class EqualityExpressionContext(ParserRuleContext):
 
         def __init__(self, parser, parent=None, invokingState=-1):
-            super(UnitXParser.UnitOperatorContext, self).__init__(parent, invokingState)
+            super(UnitXParser.EqualityExpressionContext, self).__init__(parent, invokingState)
             self.parser = parser
 
-        def Identifier(self, i=None):
+        def relationalExpression(self, i=None):
             if i is None:
-                return self.getTokens(UnitXParser.Identifier)
+                return self.getTypedRuleContexts(UnitXParser.RelationalExpressionContext)
             else:
-                return self.getToken(UnitXParser.Identifier, i)
+                return self.getTypedRuleContext(UnitXParser.RelationalExpressionContext,i)
+
 
         def getRuleIndex(self):
-            return UnitXParser.RULE_unitOperator
+            return UnitXParser.RULE_equalityExpression
 
         def enterRule(self, listener):
-            if hasattr(listener, "enterUnitOperator"):
-                listener.enterUnitOperator(self)
+            if hasattr(listener, "enterEqualityExpression"):
+                listener.enterEqualityExpression(self)
 
         def exitRule(self, listener):
-            if hasattr(listener, "exitUnitOperator"):
-                listener.exitUnitOperator(self)
+            if hasattr(listener, "exitEqualityExpression"):
+                listener.exitEqualityExpression(self)
 
         def accept(self, visitor):
-            if hasattr(visitor, "visitUnitOperator"):
-                return visitor.visitUnitOperator(self)
+            if hasattr(visitor, "visitEqualityExpression"):
+                return visitor.visitEqualityExpression(self)
             else:
                 return visitor.visitChildren(self)
 
 
 
 
-    def unitOperator(self):
+    def equalityExpression(self):
 
-        localctx = UnitXParser.UnitOperatorContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 46, self.RULE_unitOperator)
+        localctx = UnitXParser.EqualityExpressionContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 46, self.RULE_equalityExpression)
+        self._la = 0 # Token type
         try:
-            self.state = 295
-            la_ = self._interp.adaptivePredict(self._input,36,self._ctx)
-            if la_ == 1:
-                self.enterOuterAlt(localctx, 1)
-                self.state = 291
-                self.match(UnitXParser.Identifier)
-                pass
-
-            elif la_ == 2:
-                self.enterOuterAlt(localctx, 2)
-                self.state = 292
-                self.match(UnitXParser.Identifier)
-                self.state = 293
-                self.match(UnitXParser.ALLOW)
-                self.state = 294
-                self.match(UnitXParser.Identifier)
-                pass
-
+            self.enterOuterAlt(localctx, 1)
+            self.state = 268
+            self.relationalExpression()
+            self.state = 273
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << UnitXParser.EQUAL) | (1 << UnitXParser.EQUAL_X) | (1 << UnitXParser.NOTEQUAL))) != 0):
+                self.state = 269
+                _la = self._input.LA(1)
+                if not((((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << UnitXParser.EQUAL) | (1 << UnitXParser.EQUAL_X) | (1 << UnitXParser.NOTEQUAL))) != 0)):
+                    self._errHandler.recoverInline(self)
+                else:
+                    self.consume()
+                self.state = 270
+                self.relationalExpression()
+                self.state = 275
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
 
         except RecognitionException as re:
             localctx.exception = re
@@ -2162,7 +2009,608 @@ class UnitXParser ( Parser ):
             self.exitRule()
         return localctx
 
-    class PrimaryContext(ParserRuleContext):
+    class RelationalExpressionContext(ParserRuleContext):
+
+        def __init__(self, parser, parent=None, invokingState=-1):
+            super(UnitXParser.RelationalExpressionContext, self).__init__(parent, invokingState)
+            self.parser = parser
+
+        def additiveExpression(self, i=None):
+            if i is None:
+                return self.getTypedRuleContexts(UnitXParser.AdditiveExpressionContext)
+            else:
+                return self.getTypedRuleContext(UnitXParser.AdditiveExpressionContext,i)
+
+
+        def getRuleIndex(self):
+            return UnitXParser.RULE_relationalExpression
+
+        def enterRule(self, listener):
+            if hasattr(listener, "enterRelationalExpression"):
+                listener.enterRelationalExpression(self)
+
+        def exitRule(self, listener):
+            if hasattr(listener, "exitRelationalExpression"):
+                listener.exitRelationalExpression(self)
+
+        def accept(self, visitor):
+            if hasattr(visitor, "visitRelationalExpression"):
+                return visitor.visitRelationalExpression(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def relationalExpression(self):
+
+        localctx = UnitXParser.RelationalExpressionContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 48, self.RULE_relationalExpression)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 276
+            self.additiveExpression()
+            self.state = 281
+            self._errHandler.sync(self)
+            _alt = self._interp.adaptivePredict(self._input,32,self._ctx)
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt==1:
+                    self.state = 277
+                    _la = self._input.LA(1)
+                    if not((((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << UnitXParser.GT) | (1 << UnitXParser.LT) | (1 << UnitXParser.LE) | (1 << UnitXParser.GE))) != 0)):
+                        self._errHandler.recoverInline(self)
+                    else:
+                        self.consume()
+                    self.state = 278
+                    self.additiveExpression() 
+                self.state = 283
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,32,self._ctx)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class AdditiveExpressionContext(ParserRuleContext):
+
+        def __init__(self, parser, parent=None, invokingState=-1):
+            super(UnitXParser.AdditiveExpressionContext, self).__init__(parent, invokingState)
+            self.parser = parser
+
+        def multiplicativeExpression(self, i=None):
+            if i is None:
+                return self.getTypedRuleContexts(UnitXParser.MultiplicativeExpressionContext)
+            else:
+                return self.getTypedRuleContext(UnitXParser.MultiplicativeExpressionContext,i)
+
+
+        def getRuleIndex(self):
+            return UnitXParser.RULE_additiveExpression
+
+        def enterRule(self, listener):
+            if hasattr(listener, "enterAdditiveExpression"):
+                listener.enterAdditiveExpression(self)
+
+        def exitRule(self, listener):
+            if hasattr(listener, "exitAdditiveExpression"):
+                listener.exitAdditiveExpression(self)
+
+        def accept(self, visitor):
+            if hasattr(visitor, "visitAdditiveExpression"):
+                return visitor.visitAdditiveExpression(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def additiveExpression(self):
+
+        localctx = UnitXParser.AdditiveExpressionContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 50, self.RULE_additiveExpression)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 284
+            self.multiplicativeExpression()
+            self.state = 289
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==UnitXParser.ADD or _la==UnitXParser.SUB:
+                self.state = 285
+                _la = self._input.LA(1)
+                if not(_la==UnitXParser.ADD or _la==UnitXParser.SUB):
+                    self._errHandler.recoverInline(self)
+                else:
+                    self.consume()
+                self.state = 286
+                self.multiplicativeExpression()
+                self.state = 291
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class MultiplicativeExpressionContext(ParserRuleContext):
+
+        def __init__(self, parser, parent=None, invokingState=-1):
+            super(UnitXParser.MultiplicativeExpressionContext, self).__init__(parent, invokingState)
+            self.parser = parser
+
+        def unaryExpression(self, i=None):
+            if i is None:
+                return self.getTypedRuleContexts(UnitXParser.UnaryExpressionContext)
+            else:
+                return self.getTypedRuleContext(UnitXParser.UnaryExpressionContext,i)
+
+
+        def getRuleIndex(self):
+            return UnitXParser.RULE_multiplicativeExpression
+
+        def enterRule(self, listener):
+            if hasattr(listener, "enterMultiplicativeExpression"):
+                listener.enterMultiplicativeExpression(self)
+
+        def exitRule(self, listener):
+            if hasattr(listener, "exitMultiplicativeExpression"):
+                listener.exitMultiplicativeExpression(self)
+
+        def accept(self, visitor):
+            if hasattr(visitor, "visitMultiplicativeExpression"):
+                return visitor.visitMultiplicativeExpression(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def multiplicativeExpression(self):
+
+        localctx = UnitXParser.MultiplicativeExpressionContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 52, self.RULE_multiplicativeExpression)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 292
+            self.unaryExpression()
+            self.state = 297
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << UnitXParser.MUL) | (1 << UnitXParser.DIV) | (1 << UnitXParser.MOD))) != 0):
+                self.state = 293
+                _la = self._input.LA(1)
+                if not((((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << UnitXParser.MUL) | (1 << UnitXParser.DIV) | (1 << UnitXParser.MOD))) != 0)):
+                    self._errHandler.recoverInline(self)
+                else:
+                    self.consume()
+                self.state = 294
+                self.unaryExpression()
+                self.state = 299
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class UnaryExpressionContext(ParserRuleContext):
+
+        def __init__(self, parser, parent=None, invokingState=-1):
+            super(UnitXParser.UnaryExpressionContext, self).__init__(parent, invokingState)
+            self.parser = parser
+
+        def unaryExpression(self):
+            return self.getTypedRuleContext(UnitXParser.UnaryExpressionContext,0)
+
+
+        def callExpression(self):
+            return self.getTypedRuleContext(UnitXParser.CallExpressionContext,0)
+
+
+        def getRuleIndex(self):
+            return UnitXParser.RULE_unaryExpression
+
+        def enterRule(self, listener):
+            if hasattr(listener, "enterUnaryExpression"):
+                listener.enterUnaryExpression(self)
+
+        def exitRule(self, listener):
+            if hasattr(listener, "exitUnaryExpression"):
+                listener.exitUnaryExpression(self)
+
+        def accept(self, visitor):
+            if hasattr(visitor, "visitUnaryExpression"):
+                return visitor.visitUnaryExpression(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def unaryExpression(self):
+
+        localctx = UnitXParser.UnaryExpressionContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 54, self.RULE_unaryExpression)
+        self._la = 0 # Token type
+        try:
+            self.state = 305
+            token = self._input.LA(1)
+            if token in [UnitXParser.INC, UnitXParser.DEC]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 300
+                _la = self._input.LA(1)
+                if not(_la==UnitXParser.INC or _la==UnitXParser.DEC):
+                    self._errHandler.recoverInline(self)
+                else:
+                    self.consume()
+                self.state = 301
+                self.unaryExpression()
+
+            elif token in [UnitXParser.BANG, UnitXParser.BANG_X]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 302
+                _la = self._input.LA(1)
+                if not(_la==UnitXParser.BANG or _la==UnitXParser.BANG_X):
+                    self._errHandler.recoverInline(self)
+                else:
+                    self.consume()
+                self.state = 303
+                self.unaryExpression()
+
+            elif token in [UnitXParser.T__2, UnitXParser.T__4, UnitXParser.T__5, UnitXParser.T__6, UnitXParser.T__7, UnitXParser.LPAREN, UnitXParser.LBRACK, UnitXParser.STRING_LITERAL, UnitXParser.BYTES_LITERAL, UnitXParser.DECIMAL_INTEGER, UnitXParser.OCT_INTEGER, UnitXParser.HEX_INTEGER, UnitXParser.BIN_INTEGER, UnitXParser.FLOAT_NUMBER, UnitXParser.IMAG_NUMBER, UnitXParser.Identifier]:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 304
+                self.callExpression()
+
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class CallExpressionContext(ParserRuleContext):
+
+        def __init__(self, parser, parent=None, invokingState=-1):
+            super(UnitXParser.CallExpressionContext, self).__init__(parent, invokingState)
+            self.parser = parser
+
+        def primary(self):
+            return self.getTypedRuleContext(UnitXParser.PrimaryContext,0)
+
+
+        def expressionList(self, i=None):
+            if i is None:
+                return self.getTypedRuleContexts(UnitXParser.ExpressionListContext)
+            else:
+                return self.getTypedRuleContext(UnitXParser.ExpressionListContext,i)
+
+
+        def getRuleIndex(self):
+            return UnitXParser.RULE_callExpression
+
+        def enterRule(self, listener):
+            if hasattr(listener, "enterCallExpression"):
+                listener.enterCallExpression(self)
+
+        def exitRule(self, listener):
+            if hasattr(listener, "exitCallExpression"):
+                listener.exitCallExpression(self)
+
+        def accept(self, visitor):
+            if hasattr(visitor, "visitCallExpression"):
+                return visitor.visitCallExpression(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def callExpression(self):
+
+        localctx = UnitXParser.CallExpressionContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 56, self.RULE_callExpression)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 307
+            self.primary()
+            self.state = 315
+            self._errHandler.sync(self)
+            _alt = self._interp.adaptivePredict(self._input,37,self._ctx)
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt==1:
+                    self.state = 308
+                    self.match(UnitXParser.LPAREN)
+                    self.state = 310
+                    _la = self._input.LA(1)
+                    if (((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << UnitXParser.T__2) | (1 << UnitXParser.T__4) | (1 << UnitXParser.T__5) | (1 << UnitXParser.T__6) | (1 << UnitXParser.T__7) | (1 << UnitXParser.LPAREN) | (1 << UnitXParser.LBRACK) | (1 << UnitXParser.BANG) | (1 << UnitXParser.BANG_X) | (1 << UnitXParser.INC) | (1 << UnitXParser.DEC))) != 0) or ((((_la - 71)) & ~0x3f) == 0 and ((1 << (_la - 71)) & ((1 << (UnitXParser.STRING_LITERAL - 71)) | (1 << (UnitXParser.BYTES_LITERAL - 71)) | (1 << (UnitXParser.DECIMAL_INTEGER - 71)) | (1 << (UnitXParser.OCT_INTEGER - 71)) | (1 << (UnitXParser.HEX_INTEGER - 71)) | (1 << (UnitXParser.BIN_INTEGER - 71)) | (1 << (UnitXParser.FLOAT_NUMBER - 71)) | (1 << (UnitXParser.IMAG_NUMBER - 71)) | (1 << (UnitXParser.Identifier - 71)))) != 0):
+                        self.state = 309
+                        self.expressionList()
+
+
+                    self.state = 312
+                    self.match(UnitXParser.RPAREN) 
+                self.state = 317
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,37,self._ctx)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class UnitContext(ParserRuleContext):
+
+        def __init__(self, parser, parent=None, invokingState=-1):
+            super(UnitXParser.UnitContext, self).__init__(parent, invokingState)
+            self.parser = parser
+
+        def unitSingleOrPairOperator(self):
+            return self.getTypedRuleContext(UnitXParser.UnitSingleOrPairOperatorContext,0)
+
+
+        def getRuleIndex(self):
+            return UnitXParser.RULE_unit
+
+        def enterRule(self, listener):
+            if hasattr(listener, "enterUnit"):
+                listener.enterUnit(self)
+
+        def exitRule(self, listener):
+            if hasattr(listener, "exitUnit"):
+                listener.exitUnit(self)
+
+        def accept(self, visitor):
+            if hasattr(visitor, "visitUnit"):
+                return visitor.visitUnit(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def unit(self):
+
+        localctx = UnitXParser.UnitContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 58, self.RULE_unit)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 318
+            self.match(UnitXParser.LBRACE)
+            self.state = 319
+            self.unitSingleOrPairOperator()
+            self.state = 320
+            self.match(UnitXParser.RBRACE)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class UnitSingleOrPairOperatorContext(ParserRuleContext):
+
+        def __init__(self, parser, parent=None, invokingState=-1):
+            super(UnitXParser.UnitSingleOrPairOperatorContext, self).__init__(parent, invokingState)
+            self.parser = parser
+
+        def unitOperator(self, i=None):
+            if i is None:
+                return self.getTypedRuleContexts(UnitXParser.UnitOperatorContext)
+            else:
+                return self.getTypedRuleContext(UnitXParser.UnitOperatorContext,i)
+
+
+        def getRuleIndex(self):
+            return UnitXParser.RULE_unitSingleOrPairOperator
+
+        def enterRule(self, listener):
+            if hasattr(listener, "enterUnitSingleOrPairOperator"):
+                listener.enterUnitSingleOrPairOperator(self)
+
+        def exitRule(self, listener):
+            if hasattr(listener, "exitUnitSingleOrPairOperator"):
+                listener.exitUnitSingleOrPairOperator(self)
+
+        def accept(self, visitor):
+            if hasattr(visitor, "visitUnitSingleOrPairOperator"):
+                return visitor.visitUnitSingleOrPairOperator(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def unitSingleOrPairOperator(self):
+
+        localctx = UnitXParser.UnitSingleOrPairOperatorContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 60, self.RULE_unitSingleOrPairOperator)
+        self._la = 0 # Token type
+        try:
+            self.state = 333
+            la_ = self._interp.adaptivePredict(self._input,40,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 323
+                _la = self._input.LA(1)
+                if _la==UnitXParser.AT:
+                    self.state = 322
+                    self.match(UnitXParser.AT)
+
+
+                self.state = 325
+                self.unitOperator()
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 327
+                _la = self._input.LA(1)
+                if _la==UnitXParser.AT:
+                    self.state = 326
+                    self.match(UnitXParser.AT)
+
+
+                self.state = 329
+                self.unitOperator()
+                self.state = 330
+                self.match(UnitXParser.DIV)
+                self.state = 331
+                self.unitOperator()
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class UnitOperatorContext(ParserRuleContext):
+
+        def __init__(self, parser, parent=None, invokingState=-1):
+            super(UnitXParser.UnitOperatorContext, self).__init__(parent, invokingState)
+            self.parser = parser
+
+        def unitToken(self, i=None):
+            if i is None:
+                return self.getTypedRuleContexts(UnitXParser.UnitTokenContext)
+            else:
+                return self.getTypedRuleContext(UnitXParser.UnitTokenContext,i)
+
+
+        def getRuleIndex(self):
+            return UnitXParser.RULE_unitOperator
+
+        def enterRule(self, listener):
+            if hasattr(listener, "enterUnitOperator"):
+                listener.enterUnitOperator(self)
+
+        def exitRule(self, listener):
+            if hasattr(listener, "exitUnitOperator"):
+                listener.exitUnitOperator(self)
+
+        def accept(self, visitor):
+            if hasattr(visitor, "visitUnitOperator"):
+                return visitor.visitUnitOperator(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def unitOperator(self):
+
+        localctx = UnitXParser.UnitOperatorContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 62, self.RULE_unitOperator)
+        try:
+            self.state = 340
+            la_ = self._interp.adaptivePredict(self._input,41,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 335
+                self.unitToken()
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 336
+                self.unitToken()
+                self.state = 337
+                self.match(UnitXParser.ALLOW)
+                self.state = 338
+                self.unitToken()
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class UnitTokenContext(ParserRuleContext):
+
+        def __init__(self, parser, parent=None, invokingState=-1):
+            super(UnitXParser.UnitTokenContext, self).__init__(parent, invokingState)
+            self.parser = parser
+
+        def Identifier(self):
+            return self.getToken(UnitXParser.Identifier, 0)
+
+        def DECIMAL_INTEGER(self):
+            return self.getToken(UnitXParser.DECIMAL_INTEGER, 0)
+
+        def getRuleIndex(self):
+            return UnitXParser.RULE_unitToken
+
+        def enterRule(self, listener):
+            if hasattr(listener, "enterUnitToken"):
+                listener.enterUnitToken(self)
+
+        def exitRule(self, listener):
+            if hasattr(listener, "exitUnitToken"):
+                listener.exitUnitToken(self)
+
+        def accept(self, visitor):
+            if hasattr(visitor, "visitUnitToken"):
+                return visitor.visitUnitToken(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def unitToken(self):
+
+        localctx = UnitXParser.UnitTokenContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 64, self.RULE_unitToken)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 342
+            _la = self._input.LA(1)
+            if not(_la==UnitXParser.DECIMAL_INTEGER or _la==UnitXParser.Identifier):
+                self._errHandler.recoverInline(self)
+            else:
+                self.consume()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    class PrimaryContext(ParserRuleContext):
 
         def __init__(self, parser, parent=None, invokingState=-1):
             super(UnitXParser.PrimaryContext, self).__init__(parent, invokingState)
@@ -2209,80 +2657,80 @@ class UnitXParser ( Parser ):
     def primary(self):
 
         localctx = UnitXParser.PrimaryContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 48, self.RULE_primary)
+        self.enterRule(localctx, 66, self.RULE_primary)
         self._la = 0 # Token type
         try:
-            self.state = 326
+            self.state = 373
             token = self._input.LA(1)
             if token in [UnitXParser.Identifier]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 297
+                self.state = 344
                 self.match(UnitXParser.Identifier)
-                self.state = 299
-                la_ = self._interp.adaptivePredict(self._input,37,self._ctx)
+                self.state = 346
+                la_ = self._interp.adaptivePredict(self._input,42,self._ctx)
                 if la_ == 1:
-                    self.state = 298
+                    self.state = 345
                     self.unit()
 
 
 
             elif token in [UnitXParser.T__2, UnitXParser.T__4, UnitXParser.T__5, UnitXParser.T__6, UnitXParser.T__7, UnitXParser.STRING_LITERAL, UnitXParser.BYTES_LITERAL, UnitXParser.DECIMAL_INTEGER, UnitXParser.OCT_INTEGER, UnitXParser.HEX_INTEGER, UnitXParser.BIN_INTEGER, UnitXParser.FLOAT_NUMBER, UnitXParser.IMAG_NUMBER]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 301
+                self.state = 348
                 self.literal()
-                self.state = 303
-                la_ = self._interp.adaptivePredict(self._input,38,self._ctx)
+                self.state = 350
+                la_ = self._interp.adaptivePredict(self._input,43,self._ctx)
                 if la_ == 1:
-                    self.state = 302
+                    self.state = 349
                     self.unit()
 
 
 
             elif token in [UnitXParser.LPAREN]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 305
+                self.state = 352
                 self.match(UnitXParser.LPAREN)
-                self.state = 306
-                self.expression(0)
-                self.state = 307
+                self.state = 353
+                self.expression()
+                self.state = 354
                 self.match(UnitXParser.RPAREN)
-                self.state = 309
-                la_ = self._interp.adaptivePredict(self._input,39,self._ctx)
+                self.state = 356
+                la_ = self._interp.adaptivePredict(self._input,44,self._ctx)
                 if la_ == 1:
-                    self.state = 308
+                    self.state = 355
                     self.unit()
 
 
 
             elif token in [UnitXParser.LBRACK]:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 311
+                self.state = 358
                 self.match(UnitXParser.LBRACK)
-                self.state = 313
+                self.state = 360
                 _la = self._input.LA(1)
                 if (((_la) & ~0x3f) == 0 and ((1 << _la) & ((1 << UnitXParser.T__2) | (1 << UnitXParser.T__4) | (1 << UnitXParser.T__5) | (1 << UnitXParser.T__6) | (1 << UnitXParser.T__7) | (1 << UnitXParser.LPAREN) | (1 << UnitXParser.LBRACK) | (1 << UnitXParser.BANG) | (1 << UnitXParser.BANG_X) | (1 << UnitXParser.INC) | (1 << UnitXParser.DEC))) != 0) or ((((_la - 71)) & ~0x3f) == 0 and ((1 << (_la - 71)) & ((1 << (UnitXParser.STRING_LITERAL - 71)) | (1 << (UnitXParser.BYTES_LITERAL - 71)) | (1 << (UnitXParser.DECIMAL_INTEGER - 71)) | (1 << (UnitXParser.OCT_INTEGER - 71)) | (1 << (UnitXParser.HEX_INTEGER - 71)) | (1 << (UnitXParser.BIN_INTEGER - 71)) | (1 << (UnitXParser.FLOAT_NUMBER - 71)) | (1 << (UnitXParser.IMAG_NUMBER - 71)) | (1 << (UnitXParser.Identifier - 71)))) != 0):
-                    self.state = 312
-                    self.expression(0)
+                    self.state = 359
+                    self.expression()
 
 
-                self.state = 319
+                self.state = 366
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while _la==UnitXParser.COMMA:
-                    self.state = 315
+                    self.state = 362
                     self.match(UnitXParser.COMMA)
-                    self.state = 316
-                    self.expression(0)
-                    self.state = 321
+                    self.state = 363
+                    self.expression()
+                    self.state = 368
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
 
-                self.state = 322
+                self.state = 369
                 self.match(UnitXParser.RBRACK)
-                self.state = 324
-                la_ = self._interp.adaptivePredict(self._input,42,self._ctx)
+                self.state = 371
+                la_ = self._interp.adaptivePredict(self._input,47,self._ctx)
                 if la_ == 1:
-                    self.state = 323
+                    self.state = 370
                     self.unit()
 
 
@@ -2343,28 +2791,28 @@ class UnitXParser ( Parser ):
     def literal(self):
 
         localctx = UnitXParser.LiteralContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 50, self.RULE_literal)
+        self.enterRule(localctx, 68, self.RULE_literal)
         try:
-            self.state = 332
+            self.state = 379
             token = self._input.LA(1)
             if token in [UnitXParser.DECIMAL_INTEGER, UnitXParser.OCT_INTEGER, UnitXParser.HEX_INTEGER, UnitXParser.BIN_INTEGER, UnitXParser.FLOAT_NUMBER, UnitXParser.IMAG_NUMBER]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 328
+                self.state = 375
                 self.number()
 
             elif token in [UnitXParser.T__2, UnitXParser.T__4, UnitXParser.STRING_LITERAL, UnitXParser.BYTES_LITERAL]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 329
+                self.state = 376
                 self.string()
 
             elif token in [UnitXParser.T__5, UnitXParser.T__6]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 330
+                self.state = 377
                 self.boolean()
 
             elif token in [UnitXParser.T__7]:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 331
+                self.state = 378
                 self.none()
 
             else:
@@ -2417,23 +2865,23 @@ class UnitXParser ( Parser ):
     def string(self):
 
         localctx = UnitXParser.StringContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 52, self.RULE_string)
+        self.enterRule(localctx, 70, self.RULE_string)
         try:
-            self.state = 337
+            self.state = 384
             token = self._input.LA(1)
             if token in [UnitXParser.STRING_LITERAL]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 334
+                self.state = 381
                 self.match(UnitXParser.STRING_LITERAL)
 
             elif token in [UnitXParser.BYTES_LITERAL]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 335
+                self.state = 382
                 self.match(UnitXParser.BYTES_LITERAL)
 
             elif token in [UnitXParser.T__2, UnitXParser.T__4]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 336
+                self.state = 383
                 self.halfString()
 
             else:
@@ -2477,49 +2925,49 @@ class UnitXParser ( Parser ):
     def halfString(self):
 
         localctx = UnitXParser.HalfStringContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 54, self.RULE_halfString)
+        self.enterRule(localctx, 72, self.RULE_halfString)
         self._la = 0 # Token type
         try:
-            self.state = 353
+            self.state = 400
             token = self._input.LA(1)
             if token in [UnitXParser.T__2]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 339
+                self.state = 386
                 self.match(UnitXParser.T__2)
-                self.state = 343
+                self.state = 390
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,46,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,51,self._ctx)
                 while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                     if _alt==1:
-                        self.state = 340
+                        self.state = 387
                         _la = self._input.LA(1)
                         if _la <= 0 or _la==UnitXParser.T__3 or _la==UnitXParser.NEWLINE:
                             self._errHandler.recoverInline(self)
                         else:
                             self.consume() 
-                    self.state = 345
+                    self.state = 392
                     self._errHandler.sync(self)
-                    _alt = self._interp.adaptivePredict(self._input,46,self._ctx)
+                    _alt = self._interp.adaptivePredict(self._input,51,self._ctx)
 
 
             elif token in [UnitXParser.T__4]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 346
+                self.state = 393
                 self.match(UnitXParser.T__4)
-                self.state = 350
+                self.state = 397
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,47,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,52,self._ctx)
                 while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                     if _alt==1:
-                        self.state = 347
+                        self.state = 394
                         _la = self._input.LA(1)
                         if _la <= 0 or _la==UnitXParser.T__3 or _la==UnitXParser.NEWLINE:
                             self._errHandler.recoverInline(self)
                         else:
                             self.consume() 
-                    self.state = 352
+                    self.state = 399
                     self._errHandler.sync(self)
-                    _alt = self._interp.adaptivePredict(self._input,47,self._ctx)
+                    _alt = self._interp.adaptivePredict(self._input,52,self._ctx)
 
 
             else:
@@ -2572,23 +3020,23 @@ class UnitXParser ( Parser ):
     def number(self):
 
         localctx = UnitXParser.NumberContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 56, self.RULE_number)
+        self.enterRule(localctx, 74, self.RULE_number)
         try:
-            self.state = 358
+            self.state = 405
             token = self._input.LA(1)
             if token in [UnitXParser.DECIMAL_INTEGER, UnitXParser.OCT_INTEGER, UnitXParser.HEX_INTEGER, UnitXParser.BIN_INTEGER]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 355
+                self.state = 402
                 self.integer()
 
             elif token in [UnitXParser.FLOAT_NUMBER]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 356
+                self.state = 403
                 self.match(UnitXParser.FLOAT_NUMBER)
 
             elif token in [UnitXParser.IMAG_NUMBER]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 357
+                self.state = 404
                 self.match(UnitXParser.IMAG_NUMBER)
 
             else:
@@ -2643,11 +3091,11 @@ class UnitXParser ( Parser ):
     def integer(self):
 
         localctx = UnitXParser.IntegerContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 58, self.RULE_integer)
+        self.enterRule(localctx, 76, self.RULE_integer)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 360
+            self.state = 407
             _la = self._input.LA(1)
             if not(((((_la - 73)) & ~0x3f) == 0 and ((1 << (_la - 73)) & ((1 << (UnitXParser.DECIMAL_INTEGER - 73)) | (1 << (UnitXParser.OCT_INTEGER - 73)) | (1 << (UnitXParser.HEX_INTEGER - 73)) | (1 << (UnitXParser.BIN_INTEGER - 73)))) != 0)):
                 self._errHandler.recoverInline(self)
@@ -2691,11 +3139,11 @@ class UnitXParser ( Parser ):
     def boolean(self):
 
         localctx = UnitXParser.BooleanContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 60, self.RULE_boolean)
+        self.enterRule(localctx, 78, self.RULE_boolean)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 362
+            self.state = 409
             _la = self._input.LA(1)
             if not(_la==UnitXParser.T__5 or _la==UnitXParser.T__6):
                 self._errHandler.recoverInline(self)
@@ -2739,10 +3187,10 @@ class UnitXParser ( Parser ):
     def none(self):
 
         localctx = UnitXParser.NoneContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 62, self.RULE_none)
+        self.enterRule(localctx, 80, self.RULE_none)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 364
+            self.state = 411
             self.match(UnitXParser.T__7)
         except RecognitionException as re:
             localctx.exception = re
@@ -2754,45 +3202,5 @@ class UnitXParser ( Parser ):
 
 
 
-    def sempred(self, localctx, ruleIndex, predIndex):
-        if self._predicates == None:
-            self._predicates = dict()
-        self._predicates[20] = self.expression_sempred
-        pred = self._predicates.get(ruleIndex, None)
-        if pred is None:
-            raise Exception("No predicate with index:" + str(ruleIndex))
-        else:
-            return pred(localctx, predIndex)
-
-    def expression_sempred(self, localctx, predIndex):
-            if predIndex == 0:
-                return self.precpred(self._ctx, 9)
-         
-
-            if predIndex == 1:
-                return self.precpred(self._ctx, 8)
-         
-
-            if predIndex == 2:
-                return self.precpred(self._ctx, 7)
-         
-
-            if predIndex == 3:
-                return self.precpred(self._ctx, 6)
-         
-
-            if predIndex == 4:
-                return self.precpred(self._ctx, 5)
-         
-
-            if predIndex == 5:
-                return self.precpred(self._ctx, 4)
-         
-
-            if predIndex == 6:
-                return self.precpred(self._ctx, 10)
-         
-
-
 
 
@@ -110,6 +110,46 @@ class UnitXVisitor(ParseTreeVisitor):
         return self.visitChildren(ctx)
 
 
+    # Visit a parse tree produced by UnitXParser#assignmentExpression.
+    def visitAssignmentExpression(self, ctx):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by UnitXParser#logicalExpression.
+    def visitLogicalExpression(self, ctx):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by UnitXParser#equalityExpression.
+    def visitEqualityExpression(self, ctx):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by UnitXParser#relationalExpression.
+    def visitRelationalExpression(self, ctx):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by UnitXParser#additiveExpression.
+    def visitAdditiveExpression(self, ctx):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by UnitXParser#multiplicativeExpression.
+    def visitMultiplicativeExpression(self, ctx):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by UnitXParser#unaryExpression.
+    def visitUnaryExpression(self, ctx):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by UnitXParser#callExpression.
+    def visitCallExpression(self, ctx):
+        return self.visitChildren(ctx)
+
+
     # Visit a parse tree produced by UnitXParser#unit.
     def visitUnit(self, ctx):
         return self.visitChildren(ctx)
@@ -125,6 +165,11 @@ class UnitXVisitor(ParseTreeVisitor):
         return self.visitChildren(ctx)
 
 
+    # Visit a parse tree produced by UnitXParser#unitToken.
+    def visitUnitToken(self, ctx):
+        return self.visitChildren(ctx)
+
+
     # Visit a parse tree produced by UnitXParser#primary.
     def visitPrimary(self, ctx):
         return self.visitChildren(ctx)
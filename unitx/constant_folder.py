@@ -0,0 +1,207 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+
+import sys
+from antlr4.tree.Tree import TerminalNode
+from UnitXParser import UnitXParser
+from collegue import Collegue
+from constants import Constants
+
+class ConstantFolder(Collegue):
+    """A compile-time pass folding literal-only subtrees of expressions into constants.
+
+    A subtree is literal-only when it's made of numbers, strings, parentheses,
+    '+', '-', '*', '/', '%' and units of groups of constant criterions in the unit table
+    (e.g. {km->m}, but not currencies which follow exchange rates).
+    fold() evaluates each largest literal-only subtree once by EvalVisitor
+    in statements which can run more than once,
+    and keeps the result in the context which EvalVisitor reaches first.
+    get_constant() returns a copy of the result on each execution,
+    because a UnitXObject and its Unit are changed by an assignment.
+
+    A subtree is not folded when its evaluation reports an error (e.g. 5{km} + 3{s}),
+    so the error is reported on its execution at the same position as before.
+    A name of a unit may also be a variable (e.g. rep(m, 3) {...}),
+    so a constant is used only while names of its units are not variables.
+
+    Attributes:
+        is_enabled: A bool indicating whether subtrees are folded.
+    """
+
+    __OPERATOR_CONTEXTS = (
+        UnitXParser.AdditiveExpressionContext,
+        UnitXParser.MultiplicativeExpressionContext,
+    )
+
+    __TIER_CONTEXTS = (
+        UnitXParser.AssignmentExpressionContext,
+        UnitXParser.LogicalExpressionContext,
+        UnitXParser.EqualityExpressionContext,
+        UnitXParser.RelationalExpressionContext,
+        UnitXParser.UnaryExpressionContext,
+        UnitXParser.CallExpressionContext,
+    ) + __OPERATOR_CONTEXTS
+
+    def __init__(self):
+        """Inits attributes of a ConstantFolder class."""
+        self.is_enabled = True
+
+
+    def fold(self, a_tree):
+        """Folds literal-only subtrees of a tree once.
+
+        Only statements which can run more than once (in a body of a loop or a function)
+        are folded, because a statement running once evaluates its literals once anyway.
+        Blocks in a tree are marked as folded, so a body of a function
+        is folded again only when it's parsed lazily on its first call.
+
+        Args:
+            a_tree: An instance of ParserRuleContext (e.g. ProgramContext or BlockContext),
+                whose statements are linked by ContextLinker.
+        """
+        if not self.is_enabled or getattr(a_tree, 'is_folded', False): return
+        unit_names_of = {} # Keeps a result of each checked context, so a pass is linear in the size of a tree.
+        nodes = [(a_tree, False)]
+        while nodes:
+            a_node, is_repeated = nodes.pop()
+            if isinstance(a_node, TerminalNode): continue
+            if isinstance(a_node, UnitXParser.BlockContext): a_node.is_folded = True
+            if isinstance(a_node, UnitXParser.StatementContext):
+                is_repeated = a_node.enclosing_func is not None or a_node.enclosing_loop is not None
+            elif is_repeated and isinstance(a_node, (UnitXParser.ExpressionContext, UnitXParser.PrimaryContext) + ConstantFolder.__TIER_CONTEXTS):
+                unit_names = self.__get_unit_names(a_node, unit_names_of)
+                if unit_names is not None:
+                    self.__fold_subtree(a_node, unit_names)
+                    continue
+            nodes.extend((a_child, is_repeated) for a_child in a_node.getChildren())
+        a_tree.is_folded = True
+        return
+
+
+    def __get_unit_names(self, ctx, unit_names_of):
+        """Returns a list of names of units in a literal-only subtree, or None when it's not literal-only.
+
+        A result is kept in unit_names_of, so each context is checked once
+        even when fold() checks its ancestors and itself.
+        """
+        if ctx in unit_names_of: return unit_names_of[ctx]
+        unit_names_of[ctx] = unit_names = self.__check_literal_only(ctx, unit_names_of)
+        return unit_names
+
+
+    def __check_literal_only(self, ctx, unit_names_of):
+        """Checks whether a subtree is literal-only by results of its children. See __get_unit_names()."""
+        if isinstance(ctx, UnitXParser.ExpressionContext):
+            return self.__get_unit_names(ctx.getChild(0), unit_names_of)
+        if isinstance(ctx, ConstantFolder.__OPERATOR_CONTEXTS):
+            unit_names = []
+            for i in range(0, ctx.getChildCount(), 2):
+                operand_unit_names = self.__get_unit_names(ctx.getChild(i), unit_names_of)
+                if operand_unit_names is None: return None
+                unit_names.extend(operand_unit_names)
+            return unit_names
+        if isinstance(ctx, ConstantFolder.__TIER_CONTEXTS):
+            return self.__get_unit_names(ctx.getChild(0), unit_names_of) if ctx.getChildCount() == 1 else None
+        if not isinstance(ctx, UnitXParser.PrimaryContext): return None
+
+        if ctx.literal():
+            a_literal = ctx.literal()
+            if not (a_literal.number() or (a_literal.string() and not a_literal.string().halfString())): return None
+            unit_names = []
+        elif ctx.start.type == UnitXParser.LPAREN:
+            unit_names = self.__get_unit_names(ctx.expression(i=0), unit_names_of)
+            if unit_names is None: return None
+            unit_names = list(unit_names)
+        else:
+            return None # A variable, a function or a list
+        if ctx.unit() and not self.__is_static_unit(ctx.unit(), unit_names): return None
+        return unit_names
+
+
+    def __is_static_unit(self, ctx, unit_names):
+        """Returns whether all names of a unit are in groups of constant criterions."""
+        a_unit = ctx.unitSingleOrPairOperator()
+        if a_unit.start.type == UnitXParser.AT: return True
+        for an_operator in a_unit.unitOperator():
+            for a_token in an_operator.unitToken():
+                if not self.mediator.get_unit_manager().is_static_unit(a_token.start.text): return False
+                unit_names.append(a_token.start.text)
+        return True
+
+
+    def __fold_subtree(self, ctx, unit_names):
+        """Evaluates a literal-only subtree with muted error listeners, and keeps the result.
+
+        The result is kept in the context which EvalVisitor reaches first
+        by skipping tiers with one child. Nothing is kept when an error is reported.
+        """
+        if isinstance(ctx, UnitXParser.ExpressionContext): ctx = ctx.getChild(0)
+        while isinstance(ctx, ConstantFolder.__TIER_CONTEXTS) and ctx.getChildCount() == 1:
+            ctx = ctx.getChild(0)
+
+        parser = self.mediator.get_parser()
+        listeners, syntax_errors = parser._listeners, parser._syntaxErrors
+        parser._listeners = []
+        try:
+            unitx_obj = ctx.accept(self.mediator)
+        except Exception:
+            unitx_obj = None # e.g. ZeroDivisionError is raised on its execution.
+        finally:
+            is_failed = parser._syntaxErrors != syntax_errors
+            parser._listeners, parser._syntaxErrors = listeners, syntax_errors
+
+        if unitx_obj is None or is_failed or unitx_obj.unit is None: return
+        ctx.folded_constant = (unitx_obj, tuple(set(unit_names)))
+        return
+
+
+    def get_constant(self, ctx):
+        """Returns a copy of a folded constant of a context.
+
+        Args:
+            ctx: An instance of ParserRuleContext which EvalVisitor visits.
+        Returns:
+            An instance of UnitXObject, or None when the context is not folded
+            or a name of its units is a variable now.
+        """
+        folded_constant = getattr(ctx, 'folded_constant', None)
+        if folded_constant is None: return None
+        unitx_obj, unit_names = folded_constant
+        if unit_names:
+            current_scope = self.mediator.get_scopes().peek()
+            if any(current_scope.find_scope_of(a_name) for a_name in unit_names): return None
+        return unitx_obj.copy()
+
+
+    def set_mediator(self, mediator):
+        """Sets a mediator for Mediator pattern of GoF.
+
+        Args:
+            mediator: An instance of a EvalVisitor class inherited Mediator class.
+        """
+        self.mediator = mediator
+
+
+def main():
+    """Run an example for a ConstantFolder class."""
+    from example import Example
+    from antlr4.InputStream import InputStream
+    from context_linker import ContextLinker
+
+    cmd = Example(is_intaractive_run=False)
+    a_tree = cmd.build_tree(InputStream(u'rep i,3 {\n    x = (17.19 + 47.68 + 15.67){USD}\n    y = 7 + 10 * 2\n    z = 5{km->m} + x{m}\n}\n'))
+    ContextLinker.link(a_tree)
+    cmd.visitor.constant_folder.fold(a_tree)
+    nodes = [a_tree]
+    while nodes:
+        a_node = nodes.pop()
+        if isinstance(a_node, TerminalNode): continue
+        if hasattr(a_node, 'folded_constant'):
+            print '%s -> %s' % (a_node.getText().encode('utf-8'), a_node.folded_constant[0].get_unit_value())
+        nodes.extend(reversed(list(a_node.getChildren())))
+
+    return Constants.EXIT_SUCCESS
+
+
+if __name__ == '__main__':
+    sys.exit(main())
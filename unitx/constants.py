@@ -18,6 +18,33 @@ class Constants(object):
     #
     SYSTEM_UNIT_DATA = 'data/unit_table.dat'
 
+    #
+    # Currency exchange rates
+    #
+    RATE_URL = 'http://www.ecb.int/stats/eurofxref/eurofxref-daily.xml'
+    RATE_REFRESH_INTERVAL = 60 * 60 # seconds
+    RATE_FIRST_WAIT = 3.0 # seconds
+    RATE_HISTORY_DATA = '~/.unitx/rate_history.dat'
+
+    #
+    # Parse trees
+    #
+    PARSE_CACHE_DIR = '~/.unitx/cache'
+    PARSE_CACHE_VERSION = 2 # Increments when an encoding or a shape of a cached tree is changed.
+    PARSE_CACHE_MAX_BYTES = 32 * 1024 * 1024 # A total size of caches of parse trees
+    PARSER_SNAPSHOT_DATA = 'data/parser_snapshot.dat'
+    PARSER_SNAPSHOT_RECURSION_LIMIT = 100000
+    PARSER_ANTLR = 'antlr' # UnitXParser generated by ANTLR
+    PARSER_PRATT = 'pratt' # PrattParser falling back to UnitXParser on errors
+    LEXER_ANTLR = 'antlr' # UnitXLexer generated by ANTLR
+    LEXER_REGEX = 'regex' # RegexLexer by a master regex
+    LAZY_BODY_CHANNEL = 2 # A token channel of function bodies which are parsed on their first calls
+    POSITION_COLUMN_BITS = 20 # Bits of a column in a position id of SourcePosition
+    CALL_STACK_SIZE = 512 * 1024 * 1024 # Bytes of a stack of a thread executing a code for deep recursive calls
+    CALL_RECURSION_LIMIT = 1000000
+    MEMO_CACHE_SIZE = 128 # A default number of results cached by memoize()
+    TZ_OFFSET_CACHE_SIZE = 256 # UTC offsets cached per timezone and day
+
     #
     # Error names
     #
@@ -29,6 +56,18 @@ class Constants(object):
     TYPE_ERR_UNSUPPORTED_VALUE = "TypeError: unsupported operand for %s: '%s' and '%s'"
     TYPE_ERR_UNSUPPORTED_UNIT = "TypeError: unsupported operand for %s: unit '%s' and unit '%s'"
     TYPE_ERR_ARGS = "TypeError: %s() takes exactly %s arguments (%s given)"
+    VALUE_ERR_BASE = "ValueError: invalid literal '%s' for base %s"
+    VALUE_ERR_DATE = "ValueError: invalid date '%s'"
+    VALUE_ERR_NO_RATE = "ValueError: no rate of '%s' on %s in the rate history"
+    VALUE_ERR_HOUR = "ValueError: hour must be in 0..23, not '%s'"
+    VALUE_ERR_MINUTE = "ValueError: minute must be in 0..59, not '%s'"
+    VALUE_ERR_CACHE_SIZE = "ValueError: invalid cache size '%s'"
+    TYPE_ERR_NOT_DEFINED_FUNC = "TypeError: %s() takes a defined function, not '%s'"
+    TYPE_ERR_NOT_NUMBERS = "TypeError: %s() takes a list of numbers, not '%s'"
+    TYPE_ERR_LIST_UNITS = "TypeError: %s() takes a list of one unit, not unit '%s' and unit '%s'"
+    VALUE_ERR_EMPTY_LIST = "ValueError: %s() of an empty list"
+    VALUE_ERR_LIST_LENGTHS = "ValueError: %s() takes lists of the same length (%s and %s)"
+    IO_ERR_RATE_HISTORY = "IOError: no rate history in '%s'. Import it by 'python rate_history.py <csv>'."
 
     ASSERT_ERR = "AssertionError"
     EXPECT_ERR = "ExpectError: '%s' didn't coincide with '%s'."
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+
+import sys
+from antlr4.tree.Tree import TerminalNode
+from UnitXParser import UnitXParser
+from constants import Constants
+
+class ContextLinker(object):
+    """A pass linking statements and calls to their enclosing function and loop.
+
+    link() walks a tree once before it's executed, and keeps references in
+    each statement and call expression as attributes:
+        enclosing_func: An instance of FunctionDeclarationContext, or None at the top level.
+        enclosing_loop: An instance of RepStatementContext in the same function, or None.
+    So, 'return', 'break' and a traceback of a call find them without walking parent contexts.
+    A body of a function parsed lazily is linked by LazyBody when it's parsed.
+    """
+
+    __LINKED_CONTEXTS = (
+        UnitXParser.StatementContext,
+        UnitXParser.CallExpressionContext,
+    )
+
+    @classmethod
+    def link(cls, a_tree, func_ctx=None, loop_ctx=None):
+        """Links statements and calls in a tree to their enclosing function and loop.
+
+        Args:
+            a_tree: An instance of ParserRuleContext (e.g. ProgramContext or BlockContext).
+            func_ctx: An instance of FunctionDeclarationContext enclosing a_tree, or None.
+            loop_ctx: An instance of RepStatementContext enclosing a_tree, or None.
+        """
+        nodes = [(a_tree, func_ctx, loop_ctx)]
+        while nodes:
+            a_node, func_ctx, loop_ctx = nodes.pop()
+            if isinstance(a_node, TerminalNode): continue
+            if isinstance(a_node, cls.__LINKED_CONTEXTS):
+                a_node.enclosing_func, a_node.enclosing_loop = func_ctx, loop_ctx
+            if isinstance(a_node, UnitXParser.FunctionDeclarationContext): func_ctx, loop_ctx = a_node, None
+            elif isinstance(a_node, UnitXParser.RepStatementContext): loop_ctx = a_node
+            nodes.extend((a_child, func_ctx, loop_ctx) for a_child in a_node.getChildren())
+        return
+
+
+def main():
+    """Run an example for a ContextLinker class."""
+    from example import Example
+    from antlr4.InputStream import InputStream
+    from lazy_body import LazyBody
+
+    code = u'def f(a) {\n    rep i,3 {\n        break\n    }\n    return g(a)\n}\nrep j,2 { print f(j) }\n'
+    cmd = Example(is_intaractive_run=False)
+    a_tree = cmd.build_tree(InputStream(code))
+    ContextLinker.link(a_tree)
+    LazyBody.parse(a_tree.typeDeclaration(0).functionDeclaration(), cmd.parser) # Links the body
+    nodes = [a_tree]
+    while nodes:
+        a_node = nodes.pop()
+        if isinstance(a_node, TerminalNode): continue
+        if hasattr(a_node, 'enclosing_func'):
+            func_ctx, loop_ctx = a_node.enclosing_func, a_node.enclosing_loop
+            print '%s: func=%s loop=%s' % (a_node.getText().encode('utf-8'),
+                                           func_ctx.Identifier().getText() if func_ctx else None,
+                                           loop_ctx.repControl().Identifier().getText() if loop_ctx else None)
+        nodes.extend(reversed(list(a_node.getChildren())))
+
+    return Constants.EXIT_SUCCESS
+
+
+if __name__ == '__main__':
+    sys.exit(main())
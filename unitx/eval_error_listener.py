@@ -6,6 +6,7 @@ from antlr4.error.ErrorListener import ErrorListener
 from collegue import Collegue
 from util import Util
 from constants import Constants
+from source_position import SourcePosition
 import linecache
 from function import DefinedFunction
 
@@ -36,7 +37,7 @@ class EvalErrorListener(ErrorListener, Collegue):
         """
         if func:
             if func.ctx:
-                tracing_info = {'name': func.name, 'line': func.func_obj.token.line, 'code': func.code}
+                tracing_info = {'name': func.name, 'line': SourcePosition.get_line(func.func_obj.pos), 'code': func.code}
                 tracing_infos.insert(0,tracing_info)
             return self.trace_the_error(func.called_func, tracing_infos)
         else:
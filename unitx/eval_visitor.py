@@ -13,13 +13,19 @@ from UnitXLexer import UnitXLexer
 from unitx_object import UnitXObject
 from scope_list import ScopeList
 from util import Util
-from function import DefinedFunction
+from function import Function, DefinedFunction
 from unit import Unit
 from unit_manager import UnitManager
 from mediator import Mediator
 from scope import Scope
+from frame import Frame
 from stdlib import Stdlib
+from constant_folder import ConstantFolder
+from optimizer import Optimizer
+from inliner import Inliner
+from context_linker import ContextLinker
 from constants import Constants
+from source_position import SourcePosition
 
 
 class EvalVisitor(UnitXVisitor, Mediator):
@@ -41,13 +47,18 @@ class EvalVisitor(UnitXVisitor, Mediator):
         self.scopes = ScopeList()
         self.is_break = False
         self.is_return = False
-        self.return_value = UnitXObject(value=None, varname=None, unit=None, token=None, is_none=True)
+        self.return_value = UnitXObject(value=None, varname=None, unit=None, pos=None, is_none=True)
+        self.tail_call = None # (function, arguments, func_obj, called_func) of 'return f(...)'
+        self.is_stdlib_built = False
 
         this_dir, _ = os.path.split(__file__)
         data_path = os.path.join(this_dir, Constants.SYSTEM_UNIT_DATA)
         self.unit_manager = UnitManager(data_path) # Sets a database(data/unit_table.dat) for calculating units.
         self.stdlib = Stdlib()
-        self.NULL_UNITX_OBJ = UnitXObject(value=None, varname=None, is_none=True, unit=Unit(), token=None)
+        self.constant_folder = ConstantFolder()
+        self.optimizer = Optimizer()
+        self.inliner = Inliner()
+        self.NULL_UNITX_OBJ = UnitXObject(value=None, varname=None, is_none=True, unit=Unit(), pos=None)
         
         #
         # Sets a mediator to each classes for a management,
@@ -58,6 +69,9 @@ class EvalVisitor(UnitXVisitor, Mediator):
         self.scopes.set_mediator(self)
         self.unit_manager.set_mediator(self)
         self.stdlib.set_mediator(self)
+        self.constant_folder.set_mediator(self)
+        self.optimizer.set_mediator(self)
+        self.inliner.set_mediator(self)
         UnitXObject.set_mediator(self)
         Unit.set_mediator(self)
         Scope.set_mediator(self)
@@ -87,6 +101,15 @@ class EvalVisitor(UnitXVisitor, Mediator):
     
     def get_unit_manager(self):
         return self.unit_manager
+
+    def get_constant_folder(self):
+        return self.constant_folder
+
+    def get_optimizer(self):
+        return self.optimizer
+
+    def get_inliner(self):
+        return self.inliner
     
     def set_errlistener(self, errlistener):
         self._listener = errlistener
@@ -94,22 +117,12 @@ class EvalVisitor(UnitXVisitor, Mediator):
     def get_errlistener(self):
         return self._listener
 
-    def is_context_in_ancestor(self, crr_ctx, seeking_ctx):
-        """
-        Args:
-            
-        Return:
-        """
-        if crr_ctx.parentCtx:
-            if isinstance(crr_ctx.parentCtx, seeking_ctx):
-                return True
-            return self.is_context_in_ancestor(crr_ctx.parentCtx, seeking_ctx)
-        return False
-
-
     def build_stdlib(self):
+        """ 標準ライブラリの関数を一度だけ登録する．
+            対話モードでは行ごとにvisitされるため，ユーザが定義した同名の関数(e.g. count)を上書きしない．
         """
-        """
+        if self.is_stdlib_built: return
+        self.is_stdlib_built = True
         for func in self.stdlib.funcs:
             #func.code = self.get_errlistener().get_code()
             var_unitx_obj = UnitXObject(value=None, varname=func.name, unit=Unit())
@@ -121,7 +134,9 @@ class EvalVisitor(UnitXVisitor, Mediator):
         """
         self.build_stdlib() # Sets a standard library
         if self.is_intaractive_run: self.get_errlistener().reset_exit()
-        super(EvalVisitor, self).visit(tree)
+        ContextLinker.link(tree)
+        self.constant_folder.fold(tree)
+        Util.run_on_large_stack(super(EvalVisitor, self).visit, tree)
 
 
     #
@@ -150,8 +165,10 @@ class EvalVisitor(UnitXVisitor, Mediator):
         code = self.get_errlistener().get_code()
 
         def_func = DefinedFunction(func_name, func_args, ctx, code)
-        var_unitx_obj = UnitXObject(value=None, varname=func_name, unit=Unit(), token=func_token)
-        unitx_obj = UnitXObject(value=def_func, varname=func_name, unit=Unit(), token=func_token)
+        ctx.defined_function = def_func # A caller of calls in the body for tracebacks
+        SourcePosition.detach(ctx) # Only the declaration is kept, not the whole tree and source.
+        var_unitx_obj = UnitXObject(value=None, varname=func_name, unit=Unit(), pos=SourcePosition.of(func_token))
+        unitx_obj = UnitXObject(value=def_func, varname=func_name, unit=Unit(), pos=SourcePosition.of(func_token))
         var_unitx_obj.assign(unitx_obj, None)
         return
 
@@ -174,7 +191,7 @@ class EvalVisitor(UnitXVisitor, Mediator):
              varname -- A key registing in a scope
         """
         var_token = ctx.Identifier().getSymbol()
-        variable = UnitXObject(value = None, varname = var_token.text, unit=Unit(), token=var_token)
+        variable = UnitXObject(value = None, varname = var_token.text, unit=Unit(), pos=SourcePosition.of(var_token))
 
         if ctx.expression(): default_value = self.visitExpression(ctx.expression())
         else: default_value = None
@@ -208,11 +225,12 @@ class EvalVisitor(UnitXVisitor, Mediator):
         # don't create a scope in this visitBlock function because of initializing it in another function.
         # Also, the block is that a "block" statement such as '{' .... '}' must create a scope.
         #
+        # Statements are visited directly, because a deep recursive call passes here on each level.
         if is_special_block:
-            self.visitChildren(ctx)
+            for a_block_statement in ctx.blockStatement(): self.visitStatement(a_block_statement.statement())
         else:
             self.scopes.new_scope()
-            self.visitChildren(ctx)
+            for a_block_statement in ctx.blockStatement(): self.visitStatement(a_block_statement.statement())
             self.scopes.del_scope()
 
         return 
@@ -230,22 +248,31 @@ class EvalVisitor(UnitXVisitor, Mediator):
             if self.get_errlistener().is_exit(): return
         if self.is_break or self.is_return: return
 
+        last_values = self.optimizer.begin(ctx)
+        self.__visit_statement(ctx)
+        self.optimizer.end(ctx, last_values)
+        return
+
+
+    def __visit_statement(self, ctx):
+        """ 文の種類ごとのvisitメソッドを呼び出す．
+        """
         if ctx.block(): self.visitBlock(ctx.block())
         elif ctx.repStatement(): self.visitRepStatement(ctx.repStatement())
         elif ctx.ifStatement(): self.visitIfStatement(ctx.ifStatement())
         elif ctx.expressionStatement(): self.visitExpressionStatement(ctx.expressionStatement())
 
         elif ctx.start.type == UnitXLexer.RETURN:
-            if self.is_context_in_ancestor(ctx, UnitXParser.FunctionDeclarationContext):
+            if ctx.enclosing_func is not None:
+                if ctx.expression(): # A returned expression may call a function (e.g. a recursive call).
+                    self.return_value = self.__visit_returned_expression(ctx.expression())
                 self.is_return = True
-                if ctx.expression():
-                    self.return_value = self.visitExpression(ctx.expression())
             else:
                 msg = Constants.SYNTAX_ERR_RETURN_OUTSIDE
                 self.get_parser().notifyErrorListeners(msg, ctx.start, Exception(msg))
 
         elif ctx.start.type == UnitXLexer.BREAK:
-            if self.is_context_in_ancestor(ctx, UnitXParser.RepStatementContext):
+            if ctx.enclosing_loop is not None:
                 self.is_break = True
             else:
                 msg = Constants.SYNTAX_ERR_BREAK_OUTSIDE
@@ -263,6 +290,44 @@ class EvalVisitor(UnitXVisitor, Mediator):
         return
 
 
+    def __visit_returned_expression(self, ctx):
+        """ return文の式を評価して，応答する．
+            式が定義された関数の呼び出しだけ（ex: return f(n - 1)）なら，呼び出さずに末尾呼び出しとして
+            self.tail_callに予約する．呼び出し中のDefinedFunctionがFrameを入れ替えて実行するため，
+            深い末尾再帰でもPythonのスタックを消費しない．
+        """
+        call_ctx = ctx.getChild(0)
+        while isinstance(call_ctx, EvalVisitor.__TIER_CONTEXTS) and call_ctx.getChildCount() == 1 \
+            and not isinstance(call_ctx, UnitXParser.CallExpressionContext):
+            call_ctx = call_ctx.getChild(0)
+        a_primary = call_ctx.primary() if isinstance(call_ctx, UnitXParser.CallExpressionContext) else None
+        if a_primary is None or call_ctx.getChildCount() not in (3, 4) or not a_primary.Identifier() \
+            or a_primary.unit() or hasattr(call_ctx, 'shared_key'):
+            return self.visitExpression(ctx)
+
+        x = self.__visit_callee(call_ctx)
+        expr_list = call_ctx.expressionList(0)
+        called_args = self.visitExpressionList(expr_list) if expr_list else []
+        def_func = self.__get_cached_func(call_ctx)
+        if not isinstance(def_func, DefinedFunction) or self.inliner.get_expression(def_func) is not None \
+            or not self.__is_replaceable_by(def_func):
+            return self.__call_function(call_ctx, x, called_args, def_func)
+
+        self.tail_call = (def_func, called_args, x, self.__find_called_func(call_ctx))
+        return self.NULL_UNITX_OBJ # A returned value is set by the tail call.
+
+
+    def __is_replaceable_by(self, def_func):
+        """ 呼び出し中の関数のFrame（とその上のスコープ）を，末尾呼び出しされる関数が参照しないかを応答する．
+            スコープは動的なので，参照する変数があれば通常の呼び出しにする．
+        """
+        free_names = def_func.get_free_names()
+        for a_scope in reversed(self.get_scopes()):
+            if not free_names.isdisjoint(a_scope): return False
+            if isinstance(a_scope, Frame): return True
+        return True
+
+
     def visitBorderStatement(self, ctx):
         """ 線を出力して応答する(borderとして3~10個の-を使える）．
             ex: ---, ----, -----
@@ -285,11 +350,13 @@ class EvalVisitor(UnitXVisitor, Mediator):
         else:
             repeat_list = end_value
         self.scopes.new_scope()
+        last_values = self.optimizer.begin(ctx) # Loop-invariant expressions are computed once in the loop.
 
         for unitx_obj in repeat_list:
             var_obj.assign(unitx_obj, None)
             self.visitStatement(ctx.statement())
 
+        self.optimizer.end(ctx, last_values)
         self.scopes.del_scope()
         self.is_break = False
     
@@ -369,7 +436,7 @@ class EvalVisitor(UnitXVisitor, Mediator):
         unitx_obj = self.visitExpression(ctx.expression())
         if not unitx_obj.get_value():
             msg = Constants.ASSERT_ERR
-            self.get_parser().notifyErrorListeners(msg, unitx_obj.token, Exception(msg))
+            self.get_parser().notifyErrorListeners(msg, SourcePosition.to_token(unitx_obj.pos), Exception(msg))
         return
 
     def visitExpressionList(self, ctx):
@@ -404,84 +471,206 @@ class EvalVisitor(UnitXVisitor, Mediator):
 
 
     def __find_called_func(self, ctx):
-        if ctx == None: return None
-        if isinstance(ctx, UnitXParser.FunctionDeclarationContext):
-            func_name = ctx.Identifier().getSymbol().text
-            found_scope = self.get_scopes().peek().find_scope_of(func_name)
-            called_func = found_scope[func_name].get_value()
-            return called_func
-        return self.__find_called_func(ctx.parentCtx)
+        """ 呼び出し式を囲む関数（呼び出し元）を応答する．トップレベルではNoneを応答する．
+            囲む関数はContextLinkerによって事前にリンクされている．
+        """
+        func_ctx = ctx.enclosing_func
+        if func_ctx is None: return None
+        return func_ctx.defined_function
 
     def visitExpression(self, ctx):
         """ UnitXObject同士を計算した結果を返す．
+            式は優先順位の低い順に，代入，論理，等価，関係，加減，乗除，単項，関数呼び出し，primaryの階層になっている．
             return: UnitXObject
         """
-        if ctx.expression(i=0):
-            x = self.visitExpression(ctx.expression(i=0)) # x,y: UnitXObject
+        return self.__visit_operand(ctx.getChild(0))
 
-            if ctx.start.type == UnitXLexer.INC:
-                unitx_obj = x.increment()
 
-            elif ctx.start.type == UnitXLexer.DEC:
-                unitx_obj = x.decrement()
+    def __visit_operand(self, ctx):
+        """ 子が1つだけの階層（ex: 5だけのadditiveExpression）を飛ばして，演算子のある階層かprimaryを辿る．
+            各階層のvisitメソッドを経由しないため，深い木でも呼び出しが増えない．
+            ConstantFolderで畳み込まれた定数があれば，辿らずにそのコピーを応答する．
+            Optimizerで共有される式であれば，その実行中に一度だけ計算した値のコピーを応答する．
+        """
+        while isinstance(ctx, EvalVisitor.__TIER_CONTEXTS) and ctx.getChildCount() == 1:
+            ctx = ctx.children[0]
+        unitx_obj = self.constant_folder.get_constant(ctx)
+        if unitx_obj is not None: return unitx_obj
+        if hasattr(ctx, 'shared_key'): return self.optimizer.get_shared_value(ctx)
+        return ctx.accept(self)
 
-            elif ctx.getChild(i=1).getSymbol().type == UnitXLexer.LPAREN:
-                #
-                # Calls a function.
-                # x: A UnitXObject of called function.
-                #
-                called_func_name = x.varname
-                called_args = []
-                if ctx.expressionList():
-                    called_args = self.visitExpressionList(ctx.expressionList())
 
-                found_scope = self.get_scopes().peek().find_scope_of(called_func_name)
+    __TIER_CONTEXTS = (
+        UnitXParser.AssignmentExpressionContext,
+        UnitXParser.LogicalExpressionContext,
+        UnitXParser.EqualityExpressionContext,
+        UnitXParser.RelationalExpressionContext,
+        UnitXParser.AdditiveExpressionContext,
+        UnitXParser.MultiplicativeExpressionContext,
+        UnitXParser.UnaryExpressionContext,
+        UnitXParser.CallExpressionContext,
+    )
 
-                if found_scope:
-                    def_func = found_scope[called_func_name].get_value()
-                    self.get_scopes().new_scope()
 
-                    called_func = self.__find_called_func(ctx)
-                    self.get_errlistener().set_last_called_func(x.get_value())
-                    unitx_obj = def_func.call(called_args, x, called_func)
-                    self.get_errlistener().set_last_called_func(None)
+    def visitAssignmentExpression(self, ctx):
+        """ 右辺を評価した後，左辺に代入して，結果を応答する（右結合）．
+            ex: x = 5{km}, x += 1, x = y = 0
+        """
+        x = self.__visit_operand(ctx.getChild(0))
+        if ctx.getChildCount() == 1: return x
+        return self.__calc_binary(x, ctx.getChild(1).getSymbol(), self.__visit_operand(ctx.getChild(2)))
 
-                    self.get_scopes().del_scope()
-                else:
-                    msg = Constants.NAME_ERR % called_func_name
-                    self.get_parser().notifyErrorListeners(msg, x.token, Exception(msg))
-                    unitx_obj = UnitXObject(value=None, varname=None, unit=None, token=x, is_none=True)
 
-                self.is_return = False
+    def visitLogicalExpression(self, ctx):
+        """ Not yet."""
+        return self.__fold_binary(ctx)
 
-            else:
-                second_token = ctx.getChild(i=1).getSymbol()
-                y = self.visitExpression(ctx.expression(i=1))
-                if second_token.type == UnitXLexer.ADD: unitx_obj = x.add(y, second_token)
-                elif second_token.type == UnitXLexer.SUB: unitx_obj = x.subtract(y, second_token)
-                elif second_token.type == UnitXLexer.MUL: unitx_obj = x.multiply(y, second_token)
-                elif second_token.type == UnitXLexer.DIV: unitx_obj = x.divide(y, second_token)
-                elif second_token.type == UnitXLexer.MOD: unitx_obj = x.modulo(y, second_token)
-                elif second_token.type == UnitXLexer.ASSIGN: unitx_obj = x.assign(y, second_token)
-                elif second_token.type == UnitXLexer.ADD_ASSIGN: unitx_obj = x.add_assign(y, second_token)
-                elif second_token.type == UnitXLexer.SUB_ASSIGN: unitx_obj = x.substract_assign(y, second_token)
-                elif second_token.type == UnitXLexer.MUL_ASSIGN: unitx_obj = x.multiply_assign(y, second_token)
-                elif second_token.type == UnitXLexer.DIV_ASSIGN: unitx_obj = x.divide_assign(y, second_token)
-                elif second_token.type == UnitXLexer.MOD_ASSIGN: unitx_obj = x.modulo_assign(y, second_token)
-                elif second_token.type == UnitXLexer.EQUAL: unitx_obj = x.equals(y)
-                elif second_token.type == UnitXLexer.EQUAL_X: unitx_obj = x.equals(y)
-                elif second_token.type == UnitXLexer.NOTEQUAL:
-                    unitx_obj = x.equals(y)
-                    unitx_obj.set_value(not unitx_obj.get_value())
-                else: unitx_obj = None
-
-        elif ctx.primary(): unitx_obj = self.visitPrimary(ctx.primary())
-        else:
-            if not self.is_intaractive_run:
-                raise Exception("Syntax error. EvalVisitor#visitExpression") # Never happen.
+
+    def visitEqualityExpression(self, ctx):
+        """ ex: x == y, x != y, x is y"""
+        return self.__fold_binary(ctx)
+
+
+    def visitRelationalExpression(self, ctx):
+        """ Not yet."""
+        return self.__fold_binary(ctx)
+
+
+    def visitAdditiveExpression(self, ctx):
+        """ ex: x + y - z"""
+        return self.__fold_binary(ctx)
+
+
+    def visitMultiplicativeExpression(self, ctx):
+        """ ex: x * y / z % w"""
+        return self.__fold_binary(ctx)
+
+
+    def __fold_binary(self, ctx):
+        """ 同じ優先順位の二項演算を左から順に計算して，結果を応答する（左結合）．
+            ctxの子は，<operand> (<operator> <operand>)* の並びになっている．
+        """
+        children = ctx.children
+        x = self.__visit_operand(children[0])
+        for i in range(1, len(children), 2):
+            y = self.__visit_operand(children[i+1])
+            x = self.__calc_binary(x, children[i].getSymbol(), y)
+        return x
+
+
+    def __calc_binary(self, x, second_token, y):
+        """ 二項演算子のトークンに従って，UnitXObject同士を計算した結果を応答する．
+        """
+        if second_token.type == UnitXLexer.ADD: unitx_obj = x.add(y, second_token)
+        elif second_token.type == UnitXLexer.SUB: unitx_obj = x.subtract(y, second_token)
+        elif second_token.type == UnitXLexer.MUL: unitx_obj = x.multiply(y, second_token)
+        elif second_token.type == UnitXLexer.DIV: unitx_obj = x.divide(y, second_token)
+        elif second_token.type == UnitXLexer.MOD: unitx_obj = x.modulo(y, second_token)
+        elif second_token.type == UnitXLexer.ASSIGN: unitx_obj = x.assign(y, second_token)
+        elif second_token.type == UnitXLexer.ADD_ASSIGN: unitx_obj = x.add_assign(y, second_token)
+        elif second_token.type == UnitXLexer.SUB_ASSIGN: unitx_obj = x.subtract_assign(y, second_token)
+        elif second_token.type == UnitXLexer.MUL_ASSIGN: unitx_obj = x.multiply_assign(y, second_token)
+        elif second_token.type == UnitXLexer.DIV_ASSIGN: unitx_obj = x.divide_assign(y, second_token)
+        elif second_token.type == UnitXLexer.MOD_ASSIGN: unitx_obj = x.modulo_assign(y, second_token)
+        elif second_token.type == UnitXLexer.EQUAL: unitx_obj = x.equals(y)
+        elif second_token.type == UnitXLexer.EQUAL_X: unitx_obj = x.equals(y)
+        elif second_token.type == UnitXLexer.NOTEQUAL:
+            unitx_obj = x.equals(y)
+            unitx_obj.set_value(not unitx_obj.get_value())
+        else: unitx_obj = None
+
+        assert(isinstance(unitx_obj, UnitXObject))
+        return unitx_obj
+
+
+    def visitUnaryExpression(self, ctx):
+        """ ex: ++x, --x
+        """
+        if ctx.getChildCount() == 1: return self.__visit_operand(ctx.getChild(0))
+
+        x = self.__visit_operand(ctx.getChild(1))
+        if ctx.start.type == UnitXLexer.INC: unitx_obj = x.increment(ctx.start)
+        elif ctx.start.type == UnitXLexer.DEC: unitx_obj = x.decrement(ctx.start)
+        else: unitx_obj = None # Not yet
 
         assert(isinstance(unitx_obj, UnitXObject))
+        return unitx_obj
+
 
+    def visitCallExpression(self, ctx):
+        """ primaryを評価し，関数呼び出しの括弧があれば，その関数を呼び出した結果を応答する．
+            ex: f(1, 2), expect(x, 5{km})
+        """
+        if ctx.getChildCount() == 1: return self.visitPrimary(ctx.getChild(0))
+        x = self.__visit_callee(ctx)
+
+        expr_list, is_callee = None, True
+        for child in ctx.children[1:]:
+            if isinstance(child, UnitXParser.ExpressionListContext): expr_list = child
+            elif child.getSymbol().type == UnitXLexer.RPAREN:
+                called_args = self.visitExpressionList(expr_list) if expr_list else []
+                def_func = self.__get_cached_func(ctx) if is_callee else None # ex: f()() calls a returned value
+                x = self.__call_function(ctx, x, called_args, def_func)
+                expr_list, is_callee = None, False
+        return x
+
+
+    def __visit_callee(self, ctx):
+        """ 呼び出し式の関数名（primary）を評価して，応答する．
+            関数名による呼び出しは，解決した関数をScopeListのdef_versionと共に呼び出し箇所へキャッシュする（インラインキャッシュ）．
+            def，関数名への代入，同名の引数やスコープの破棄でバージョンが変わるまでは，スコープを辿らずにキャッシュを使う．
+        """
+        cache = getattr(ctx, 'call_cache', None)
+        if cache and cache[0] == self.get_scopes().def_version:
+            x = cache[1]
+            x.pos = cache[3]
+            return x
+
+        a_primary = ctx.getChild(0)
+        x = self.visitPrimary(a_primary)
+        if a_primary.Identifier() and not a_primary.unit():
+            def_func = x.get_value(error=False)
+            if isinstance(def_func, Function):
+                self.get_scopes().watch(x.varname)
+                ctx.call_cache = (self.get_scopes().def_version, x, def_func, x.pos)
+        return x
+
+
+    def __get_cached_func(self, ctx):
+        """ 呼び出し箇所にキャッシュされた関数を応答する．キャッシュがないか，引数の評価などで古くなっていればNoneを応答する．
+        """
+        cache = getattr(ctx, 'call_cache', None)
+        if cache and cache[0] == self.get_scopes().def_version: return cache[2]
+        return None
+
+
+    def __call_function(self, ctx, x, called_args, def_func=None):
+        """ 関数を呼び出して，結果を応答する．
+            x: A UnitXObject of called function.
+            called_args: A list of UnitXObject of evaluated arguments.
+            def_func: A Function cached at the call site, or None to find it from scopes.
+                Only a cached function is inlined by Inliner.
+        """
+        called_func_name = x.varname
+        found_scope, an_expr = None, None
+        if def_func is None:
+            found_scope = self.get_scopes().peek().find_scope_of(called_func_name)
+            if found_scope: def_func = found_scope[called_func_name].get_value()
+        elif isinstance(def_func, DefinedFunction):
+            an_expr = self.inliner.get_expression(def_func)
+
+        if def_func is not None or found_scope:
+            called_func = self.__find_called_func(ctx)
+            self.get_errlistener().set_last_called_func(def_func)
+            if an_expr is not None: unitx_obj = self.inliner.call(def_func, an_expr, called_args, x, called_func)
+            else: unitx_obj = def_func.call(called_args, x, called_func) # A defined function pushes its Frame.
+            self.get_errlistener().set_last_called_func(None)
+        else:
+            msg = Constants.NAME_ERR % called_func_name
+            self.get_parser().notifyErrorListeners(msg, SourcePosition.to_token(x.pos), Exception(msg))
+            unitx_obj = UnitXObject(value=None, varname=None, unit=None, pos=x.pos, is_none=True)
+
+        self.is_return = False
         return unitx_obj
 
 
@@ -489,7 +678,7 @@ class EvalVisitor(UnitXVisitor, Mediator):
         """ Just visiting child nodes of UnitX syntax."""
         unit = self.visitUnitSingleOrPairOperator(ctx.unitSingleOrPairOperator())
         unit.replace_tokens()
-        unit.token = ctx.start
+        unit.pos = SourcePosition.of(ctx.start)
         return unit
 
 
@@ -520,10 +709,16 @@ class EvalVisitor(UnitXVisitor, Mediator):
     def visitUnitOperator(self, ctx):
         """
         """
-        if ctx.Identifier(i=1):
-            return [ctx.Identifier(i=0).getSymbol(), ctx.Identifier(i=1).getSymbol()]
+        if ctx.unitToken(i=1):
+            return [self.visitUnitToken(ctx.unitToken(i=0)), self.visitUnitToken(ctx.unitToken(i=1))]
         else:
-            return [ctx.Identifier(i=0).getSymbol()]
+            return [self.visitUnitToken(ctx.unitToken(i=0))]
+
+
+    def visitUnitToken(self, ctx):
+        """ 単位の名前(Identifier)または進数(DECIMAL_INTEGER)のトークンを応答する．
+        """
+        return ctx.start
 
 
     def visitPrimary(self, ctx):
@@ -558,7 +753,7 @@ class EvalVisitor(UnitXVisitor, Mediator):
                     unitx_obj.unit = unit
             else:
                 unitx_obj = UnitXObject(value=None, varname=varname, unit=unit)
-            unitx_obj.token = ctx.Identifier().getSymbol()
+            unitx_obj.pos = SourcePosition.of(ctx.Identifier().getSymbol())
 
         elif ctx.literal():
             unitx_obj = self.visitLiteral(ctx.literal())
@@ -568,17 +763,13 @@ class EvalVisitor(UnitXVisitor, Mediator):
             unitx_obj = self.visitExpression(ctx.expression(i=0))
             if not unit.is_empty():
                 unitx_obj.unit = unit
-            unitx_obj.token = ctx.start
+            unitx_obj.pos = SourcePosition.of(ctx.start)
 
         elif ctx.start.type == UnitXLexer.LBRACK:
-            unitx_objs = []
-            for an_expr in ctx.expression():
-                an_obj = self.visitExpression(an_expr)
-                if not unit.is_empty():
-                    an_obj.unit = unit
-                unitx_objs.append(an_obj)
+            # A unit of the list is applied to elements by UnitXObject at once.
+            unitx_objs = [self.visitExpression(an_expr) for an_expr in ctx.expression()]
 
-            unitx_obj = UnitXObject(value = unitx_objs, varname = None, unit=unit, token=ctx.start)
+            unitx_obj = UnitXObject(value = unitx_objs, varname = None, unit=unit, pos=SourcePosition.of(ctx.start))
 
         else:
             if not self.is_intaractive_run:
@@ -611,7 +802,7 @@ class EvalVisitor(UnitXVisitor, Mediator):
             if self.is_intaractive_run:
                 self.visitHalfString(ctx.halfString())
 
-        return UnitXObject(value=value, varname=None, unit=Unit(), token=token)
+        return UnitXObject(value=value, varname=None, unit=Unit(), pos=SourcePosition.of(token))
 
 
     def visitHalfString(self, ctx):
@@ -632,7 +823,7 @@ class EvalVisitor(UnitXVisitor, Mediator):
             value = complex(ctx.IMAG_NUMBER().getText())
             token = ctx.IMAG_NUMBER().getSymbol()
 
-        return UnitXObject(value=value, varname=None, unit=Unit(), token=token)
+        return UnitXObject(value=value, varname=None, unit=Unit(), pos=SourcePosition.of(token))
 
 
     def visitInteger(self, ctx):
@@ -655,25 +846,25 @@ class EvalVisitor(UnitXVisitor, Mediator):
             value = int(ctx.BIN_INTEGER().getText(),2)
             token = ctx.BIN_INTEGER().getSymbol()
         
-        return UnitXObject(value=value, varname=None, unit=None, token=token)
+        return UnitXObject(value=value, varname=None, unit=None, pos=SourcePosition.of(token))
 
 
     def visitBoolean(self, ctx):
         """ 文字列からbooleanへ変換し，応答する．
         """
         value = True if ctx.start.text == 'true' else False
-        return UnitXObject(value=value, varname=None, unit=None, token=ctx.start)
+        return UnitXObject(value=value, varname=None, unit=None, pos=SourcePosition.of(ctx.start))
 
     
     def visitNone(self, ctx):
         """ 文字列からNoneへ変換し，応答する．
         """
-        return UnitXObject(value=None, varname=None, unit=None, token=ctx.start, is_none=True)
+        return UnitXObject(value=None, varname=None, unit=None, pos=SourcePosition.of(ctx.start), is_none=True)
 
 
     def visitComment(self, ctx):
         """ 
         """
-        return UnitXObject(value=None, varname=None, unit=None, token=ctx.start, is_none=True)
+        return UnitXObject(value=None, varname=None, unit=None, pos=SourcePosition.of(ctx.start), is_none=True)
 
 
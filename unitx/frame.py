@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+
+import sys
+from scope import Scope
+from unitx_object import UnitXObject
+from unit import Unit
+from constants import Constants
+
+class Frame(Scope):
+    """A scope of a call of a defined function.
+
+    This class is created on each call, and its parameters are laid out
+    in slots of new instances of UnitXObject when it's created.
+    So, a recursive call never shares parameters with its caller.
+
+    Attributes:
+        parent: An instance of a parent Scope of this class (a scope of a caller).
+    """
+
+    def __init__(self, parent, slots, args):
+        """Inits attributes of a Frame class, and lays out parameters.
+
+        Args:
+            parent: An instance of a Scope class of a caller.
+            slots: A list of tuples of a name, a position id and a default value
+                (an instance of UnitXObject or None) of each parameter.
+            args: A list of instances of UnitXObject given by a caller.
+        """
+        super(Frame, self).__init__(parent)
+        for i, (varname, pos, default_value) in enumerate(slots):
+            if i < len(args):
+                a_slot = UnitXObject(value=None, varname=varname, unit=Unit(), pos=pos).bind(args[i])
+            elif default_value:
+                a_slot = default_value.copy() # A default value is never changed by a call.
+            else:
+                a_slot = UnitXObject(value=None, varname=varname, unit=Unit(), pos=pos, is_none=True)
+            self[varname] = a_slot
+
+
+def main():
+    """Run an example for a Frame class."""
+    from scope_list import ScopeList
+
+    scopes = ScopeList()
+    UnitXObject.scopes = scopes
+    slots = [('x', None, None), ('y', None, UnitXObject(value=2, varname='y', unit=Unit()))]
+    for args in [[UnitXObject(value=5, varname=None, unit=Unit())], []]:
+        scopes.push_scope(Frame(scopes.peek(), slots, args))
+        print 'A frame instance: ', scopes.peek()
+        scopes.del_scope()
+
+    return Constants.EXIT_SUCCESS
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+
+import sys
+from antlr4.tree.Tree import TerminalNode, ErrorNode
+from UnitXParser import UnitXParser
+from collegue import Collegue
+from function import Function
+from lazy_body import LazyBody
+from frame import Frame
+from constants import Constants
+
+class Inliner(Collegue):
+    """A pass inlining calls of small defined functions at their call sites.
+
+    A defined function is inlined when its body is only 'return' of an expression
+    which has no call, no assignment and no '++' and '--' (e.g. def sq(x) { return x * x }).
+    So, it never calls itself, and no other function reads its parameters.
+    The expression is found after the first call parses the body lazily,
+    and the next calls evaluate it directly instead of running the body
+    (a block, a 'return' statement and its flags, a check of a tail call and sharing values).
+    A memoized function is not inlined, because its cache counts calls.
+
+    Scoping is dynamic, so parameters are laid out in a Frame as usual
+    instead of renamed variables in a scope of a caller,
+    and the expression never captures variables of the caller.
+    A call site inlines only a function found by its inline cache,
+    so a function redefined at runtime is called as usual until the cache finds it again.
+
+    Attributes:
+        is_enabled: A bool indicating whether calls are inlined.
+    """
+
+    __WRITING_TOKEN_TYPES = frozenset([
+        UnitXParser.ASSIGN, UnitXParser.ADD_ASSIGN, UnitXParser.SUB_ASSIGN, UnitXParser.MUL_ASSIGN,
+        UnitXParser.DIV_ASSIGN, UnitXParser.MOD_ASSIGN, UnitXParser.AND_ASSIGN, UnitXParser.OR_ASSIGN,
+        UnitXParser.XOR_ASSIGN, UnitXParser.INC, UnitXParser.DEC,
+    ])
+
+    def __init__(self):
+        """Inits attributes of an Inliner class."""
+        self.is_enabled = True
+
+
+    def get_expression(self, a_func):
+        """Returns a returned expression of a defined function when it can be inlined, or None.
+
+        It's kept in the function, because the parsed body is never changed.
+
+        Args:
+            a_func: An instance of DefinedFunction.
+        Returns:
+            An instance of ExpressionContext, or None.
+        """
+        if not self.is_enabled or a_func.memo is not None: return None
+        if hasattr(a_func, 'inlined_expression'): return a_func.inlined_expression
+        a_block = a_func.ctx.block()
+        if LazyBody.get_hidden_tokens(a_block): return None # The body is parsed on the first call.
+        a_func.inlined_expression = self.__find_expression(a_block)
+        return a_func.inlined_expression
+
+
+    def __find_expression(self, a_block):
+        """Returns an expression of a block which is only 'return' of the expression, or None."""
+        block_statements = a_block.blockStatement()
+        if a_block.exception is not None or len(block_statements) != 1: return None
+        a_statement = block_statements[0].statement()
+        if a_statement is None or a_statement.start.type != UnitXParser.RETURN: return None
+        an_expr = a_statement.expression()
+        if an_expr is None: return None
+
+        nodes = [an_expr]
+        while nodes:
+            a_node = nodes.pop()
+            if isinstance(a_node, ErrorNode): return None
+            if isinstance(a_node, TerminalNode):
+                if a_node.symbol.type in Inliner.__WRITING_TOKEN_TYPES: return None
+                continue
+            if a_node.exception is not None: return None
+            if isinstance(a_node, UnitXParser.CallExpressionContext) and a_node.getChildCount() > 1: return None
+            nodes.extend(a_node.getChildren())
+        return an_expr
+
+
+    def call(self, a_func, an_expr, args, func_obj, called_func):
+        """Evaluates an inlined expression of a defined function with called arguments.
+
+        Arguments are checked, and a caller is kept for tracebacks as a usual call.
+        A returned value is kept in the mediator as 'return' keeps it.
+
+        Args:
+            a_func: An instance of DefinedFunction.
+            an_expr: An instance of ExpressionContext returned by get_expression().
+            args: A list of a argument appointed/called by user.
+            func_obj: An instance of UnitXObject including a function name.
+            called_func: An instantce of Function which called this function.
+        Returns:
+            An instance of UnitXObject calculated by the function.
+        """
+        Function.call(a_func, args, func_obj, called_func)
+        scopes = self.mediator.get_scopes()
+        scopes.push_scope(Frame(scopes.peek(), a_func.slots, args))
+        unitx_obj = self.mediator.visitExpression(an_expr)
+        scopes.del_scope()
+        self.mediator.return_value = unitx_obj
+        return unitx_obj
+
+
+    def set_mediator(self, mediator):
+        """Sets a mediator for Mediator pattern of GoF.
+
+        Args:
+            mediator: An instance of a EvalVisitor class inherited Mediator class.
+        """
+        self.mediator = mediator
+
+
+def main():
+    """Run an example for an Inliner class."""
+    from example import Example
+    from antlr4.InputStream import InputStream
+
+    code = u'def sq(x) {\n    return x * x\n}\ndef fact(n) {\n    if n == 0 { return 1 }\n    return n * fact(n - 1)\n}\n' \
+           u'print sq(3)\nprint sq(4)\nprint fact(3)\n'
+    cmd = Example(is_intaractive_run=False)
+    cmd.visitor.get_errlistener().set_codepath('<example>')
+    a_tree = cmd.build_tree(InputStream(code))
+    cmd.visitor.visit(a_tree)
+    for a_declaration in a_tree.typeDeclaration():
+        func_ctx = a_declaration.functionDeclaration()
+        if func_ctx is None: continue
+        an_expr = cmd.visitor.get_inliner().get_expression(func_ctx.defined_function)
+        print '%s: %s' % (func_ctx.Identifier().getText(), an_expr.getText().encode('utf-8') if an_expr else None)
+
+    return Constants.EXIT_SUCCESS
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+
+import sys
+from antlr4.Token import Token
+from antlr4.ListTokenSource import ListTokenSource
+from antlr4.CommonTokenStream import CommonTokenStream
+from antlr4.tree.Tree import TerminalNode
+from UnitXParser import UnitXParser
+from context_linker import ContextLinker
+from constants import Constants
+
+class LazyBody(object):
+    """Bodies of function declarations which are parsed on their first calls.
+
+    hide() moves tokens in a body to Constants.LAZY_BODY_CHANNEL before parsing,
+    so the parser only reads "def f(a) {}" and skips the body.
+    A body is found by matching '{' and '}' (or ':' and 'end') on the tokens.
+    attach() keeps the hidden tokens in the empty block of the parse tree,
+    and parse() parses them into the block when the function is called first.
+    A parsed body is linked by ContextLinker at once, because the tree was linked without it.
+    Syntax errors in a body are reported on the call, or by the check mode (--check).
+    """
+
+    __CLOSINGS = {UnitXParser.LBRACE: UnitXParser.RBRACE, UnitXParser.COLON: UnitXParser.END}
+
+    @classmethod
+    def hide(cls, tokens):
+        """Moves tokens in bodies of function declarations to Constants.LAZY_BODY_CHANNEL.
+
+        A body is hidden only when its parameters are empty or in parentheses,
+        and its closing is found. Otherwise, it's parsed as usual.
+
+        Args:
+            tokens: A list of tokens of a filled CommonTokenStream.
+        """
+        visible_tokens = [t for t in tokens if t.channel == Token.DEFAULT_CHANNEL]
+        i = 0
+        while i < len(visible_tokens) - 2:
+            if visible_tokens[i].type != UnitXParser.DEF or visible_tokens[i+1].type != UnitXParser.Identifier:
+                i += 1
+                continue
+            opening = i + 2
+            if visible_tokens[opening].type == UnitXParser.LPAREN:
+                opening = cls.__find_closing(visible_tokens, opening, UnitXParser.RPAREN) + 1
+            if 0 < opening < len(visible_tokens) and visible_tokens[opening].type in cls.__CLOSINGS:
+                closing = cls.__find_closing(visible_tokens, opening, cls.__CLOSINGS[visible_tokens[opening].type])
+                if closing > 0:
+                    for a_token in visible_tokens[opening+1:closing]:
+                        a_token.channel = Constants.LAZY_BODY_CHANNEL
+                    i = closing
+            i += 1
+        return
+
+
+    @classmethod
+    def __find_closing(cls, tokens, opening, closing_type):
+        """Returns an index of the closing token matching tokens[opening], or -1."""
+        opening_type, depth = tokens[opening].type, 0
+        for i in xrange(opening, len(tokens)):
+            if tokens[i].type == opening_type: depth += 1
+            elif tokens[i].type == closing_type:
+                depth -= 1
+                if depth == 0: return i
+        return -1
+
+
+    @classmethod
+    def attach(cls, a_tree, tokens):
+        """Keeps hidden tokens of bodies in blocks of function declarations.
+
+        Args:
+            a_tree: An instance of ProgramContext.
+            tokens: A list of tokens of the token stream which made a_tree.
+        """
+        for a_declaration in a_tree.typeDeclaration():
+            func_ctx = a_declaration.functionDeclaration()
+            if func_ctx is None: continue
+            a_block = func_ctx.block()
+            if a_block is None or a_block.start is None or a_block.stop is None: continue
+            hidden_tokens = [t for t in tokens[a_block.start.tokenIndex+1:a_block.stop.tokenIndex]
+                             if t.channel == Constants.LAZY_BODY_CHANNEL]
+            if hidden_tokens: a_block.lazy_tokens = hidden_tokens
+        return
+
+
+    @classmethod
+    def get_hidden_tokens(cls, a_block):
+        """Returns a list of hidden tokens of a block which is not parsed yet."""
+        return getattr(a_block, 'lazy_tokens', [])
+
+
+    @classmethod
+    def get_tokens(cls, a_block):
+        """Returns a list of tokens in a block in order, whether it's parsed or not.
+
+        Tokens of a block which is not parsed yet are its hidden tokens,
+        so tokens of a body are scanned without parsing it.
+        """
+        tokens = cls.get_hidden_tokens(a_block)
+        if tokens: return tokens
+        tokens, nodes = [], [a_block]
+        while nodes:
+            a_node = nodes.pop()
+            if isinstance(a_node, TerminalNode): tokens.append(a_node.symbol)
+            else: nodes.extend(reversed(list(a_node.getChildren())))
+        return tokens
+
+
+    @classmethod
+    def parse(cls, func_ctx, parser):
+        """Parses a hidden body of a function declaration into its block once.
+
+        The block of the parse tree is replaced with the parsed one,
+        so the next calls use it as it is.
+
+        Args:
+            func_ctx: An instance of FunctionDeclarationContext.
+            parser: An instance of UnitXParser for parsing and reporting errors.
+        Returns:
+            An instance of BlockContext of the function.
+        """
+        a_block = func_ctx.block()
+        hidden_tokens = cls.get_hidden_tokens(a_block)
+        if not hidden_tokens: return a_block
+
+        tokens = [a_token.clone() for a_token in [a_block.start] + hidden_tokens + [a_block.stop, a_block.stop]]
+        for a_token in tokens: a_token.channel = Token.DEFAULT_CHANNEL
+        tokens[-1].type = Token.EOF # ListTokenSource of this runtime fails to make EOF.
+        last_token_stream = parser.getTokenStream()
+        parser.setTokenStream(CommonTokenStream(ListTokenSource(tokens)))
+        try:
+            parsed_block = parser.block()
+        finally:
+            parser.setTokenStream(last_token_stream)
+
+        parsed_block.parentCtx = func_ctx
+        func_ctx.children[func_ctx.children.index(a_block)] = parsed_block
+        ContextLinker.link(parsed_block, func_ctx)
+        return parsed_block
+
+
+def main():
+    """Run an example for a LazyBody class."""
+    from antlr4.InputStream import InputStream
+    from UnitXLexer import UnitXLexer
+
+    code = u'def f(a) {\n    return a * 2\n}\nprint f(3)\n'
+    token_stream = CommonTokenStream(UnitXLexer(InputStream(code)))
+    token_stream.fill()
+    LazyBody.hide(token_stream.tokens)
+    parser = UnitXParser(token_stream)
+    a_tree = parser.program()
+    LazyBody.attach(a_tree, token_stream.tokens)
+    print a_tree.toStringTree(recog=parser)
+
+    func_ctx = a_tree.typeDeclaration(0).functionDeclaration()
+    LazyBody.parse(func_ctx, parser)
+    print a_tree.toStringTree(recog=parser)
+
+    return Constants.EXIT_SUCCESS
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+
+import sys
+from collections import OrderedDict
+from constants import Constants
+
+class MemoCache(object):
+    """A bounded cache of results of a memoized function.
+
+    A key is made of values of arguments in their canonical units
+    (e.g. 5{km->m} and 5000{m} are the same key), and a least recently used
+    result is evicted when the cache is full.
+
+    Attributes:
+        size: An int indicating the maximum number of results.
+        hits: An int indicating the number of calls answered by the cache.
+        misses: An int indicating the number of calls executing the function.
+        __results: An OrderedDict of keys and results in order of use.
+    """
+
+    def __init__(self, size):
+        """Inits attributes of a MemoCache class."""
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self.__results = OrderedDict()
+
+
+    def make_key(self, args):
+        """Returns a key of arguments, or None when an argument can't be a key (e.g. a list).
+
+        Args:
+            args: A list of instances of UnitXObject given by a caller.
+        """
+        key = tuple((type(a_value), a_value, an_arg.unit.numer, an_arg.unit.denom, an_arg.is_none)
+                    for an_arg, a_value in ((an_arg, an_arg.get_value()) for an_arg in args))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+
+    def get(self, key):
+        """Returns a copy of a result of a key, or None when it's not cached."""
+        unitx_obj = self.__results.pop(key, None)
+        if unitx_obj is None:
+            self.misses += 1
+            return None
+        self.__results[key] = unitx_obj # The most recently used
+        self.hits += 1
+        return unitx_obj.copy()
+
+
+    def put(self, key, unitx_obj):
+        """Keeps a copy of a result of a key, and evicts the least recently used result."""
+        self.__results[key] = unitx_obj.copy()
+        if len(self.__results) > self.size: self.__results.popitem(last=False)
+        return
+
+
+    def __len__(self):
+        """Returns the number of cached results."""
+        return len(self.__results)
+
+
+    def __unicode__(self):
+        """Returns a string of counters of this cache."""
+        return u'hits=%s misses=%s size=%s/%s' % (self.hits, self.misses, len(self), self.size)
+
+    def __str__(self):
+        """Returns an encoded string of counters of this cache."""
+        return unicode(self).encode('utf-8')
+
+
+def main():
+    """Run an example for a MemoCache class."""
+    from unitx_object import UnitXObject
+    from unit import Unit
+
+    a_cache = MemoCache(2)
+    for value in [1, 2, 1, 3, 2]:
+        key = (value,)
+        if a_cache.get(key) is None:
+            a_cache.put(key, UnitXObject(value=value * 2, varname=None, unit=Unit()))
+    print a_cache
+
+    return Constants.EXIT_SUCCESS
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+
+import sys
+import os
+import hashlib
+import cPickle
+import UnitXParser as parser_module
+import UnitXLexer as lexer_module
+from UnitXParser import UnitXParser
+from UnitXLexer import UnitXLexer
+from antlr4.RuleContext import RuleContext
+from antlr4.PredictionContext import PredictionContext
+from antlr4.atn.ATNSimulator import ATNSimulator
+from antlr4.atn.SemanticContext import SemanticContext
+from antlr4.atn.LexerAction import LexerSkipAction, LexerPopModeAction, LexerMoreAction
+from constants import Constants
+
+class ParserSnapshot(object):
+    """A snapshot of ATNs and DFAs of the parser and the lexer.
+
+    ANTLR builds DFAs for predictions while parsing, and a new process
+    starts with empty DFAs, so a first parse is much slower than the next ones.
+    A snapshot keeps the DFAs warmed by parsing a representative corpus
+    (demo/ and tests/) with the ATNs which they refer to, and it's loaded
+    into UnitXParser and UnitXLexer before the first parser is created.
+
+    A snapshot is optional. It's made by "make snapshot" at install time,
+    and it's ignored when it doesn't exist or when the grammar is changed.
+
+    Singletons of the runtime are compared by identity (e.g. "is SemanticContext.NONE"),
+    so they are saved as persistent ids and they are restored as the same objects.
+
+    Attributes:
+        __is_loaded: A bool indicating whether a snapshot is already loaded.
+        __singletons: A list of singletons of the runtime of ANTLR.
+    """
+
+    __is_loaded = False
+    __singletons = [SemanticContext.NONE, PredictionContext.EMPTY, ATNSimulator.ERROR, RuleContext.EMPTY,
+                    LexerSkipAction.INSTANCE, LexerPopModeAction.INSTANCE, LexerMoreAction.INSTANCE]
+
+    @classmethod
+    def __persistent_id(cls, an_obj):
+        for i, a_singleton in enumerate(cls.__singletons):
+            if an_obj is a_singleton: return str(i)
+        return None
+
+
+    @classmethod
+    def __persistent_load(cls, pid):
+        return cls.__singletons[int(pid)]
+
+
+    @classmethod
+    def get_path(cls):
+        """Returns a path of a snapshot in the data directory."""
+        this_dir, _ = os.path.split(__file__)
+        return os.path.join(this_dir, Constants.PARSER_SNAPSHOT_DATA)
+
+
+    @classmethod
+    def get_grammar_hash(cls):
+        """Returns a string identifying versions of the grammar and the runtime."""
+        a_hash = hashlib.sha1(parser_module.serializedATN().encode('utf-8'))
+        a_hash.update(lexer_module.serializedATN().encode('utf-8'))
+        a_hash.update(sys.version)
+        return a_hash.hexdigest()
+
+
+    @classmethod
+    def save(cls, path):
+        """Saves the current ATNs and DFAs of the parser and the lexer.
+
+        Args:
+            path: A string indicating a path of a snapshot.
+        """
+        states = (UnitXParser.atn, UnitXParser.decisionsToDFA, UnitXParser.sharedContextCache,
+                  UnitXLexer.atn, UnitXLexer.decisionsToDFA)
+        limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(Constants.PARSER_SNAPSHOT_RECURSION_LIMIT) # An ATN is a deep graph.
+        try:
+            with open(path, 'wb') as wf:
+                pickler = cPickle.Pickler(wf, cPickle.HIGHEST_PROTOCOL)
+                pickler.persistent_id = cls.__persistent_id
+                pickler.dump(cls.get_grammar_hash())
+                pickler.dump(states)
+        finally:
+            sys.setrecursionlimit(limit)
+        return
+
+
+    @classmethod
+    def load(cls, path=None):
+        """Loads a snapshot into UnitXParser and UnitXLexer once.
+
+        It must be called before parsers and lexers are created,
+        because they take the ATNs and the DFAs when they are created.
+
+        Args:
+            path: A string indicating a path of a snapshot.
+        Returns:
+            A bool indicating whether a snapshot is loaded.
+        """
+        if cls.__is_loaded: return True
+        if path is None: path = cls.get_path()
+        if not os.path.exists(path): return False
+
+        limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(Constants.PARSER_SNAPSHOT_RECURSION_LIMIT)
+        try:
+            with open(path, 'rb') as rf:
+                unpickler = cPickle.Unpickler(rf)
+                unpickler.persistent_load = cls.__persistent_load
+                if unpickler.load() != cls.get_grammar_hash(): return False
+                states = unpickler.load()
+        except (IOError, EOFError, cPickle.UnpicklingError, ValueError):
+            return False
+        finally:
+            sys.setrecursionlimit(limit)
+
+        UnitXParser.atn, UnitXParser.decisionsToDFA, UnitXParser.sharedContextCache, \
+            UnitXLexer.atn, UnitXLexer.decisionsToDFA = states
+        cls.__is_loaded = True
+        return True
+
+
+def main(argv):
+    """Makes a snapshot by parsing codes in directories.
+
+    Usage:
+        $ python parser_snapshot.py demo tests
+    """
+    from antlr4.InputStream import InputStream
+    from example import Example
+
+    if len(argv) < 2:
+        print 'Usage: python %s <directory>*' % argv[0]
+        return Constants.EXIT_FAILURE
+
+    path = ParserSnapshot.get_path()
+    if os.path.exists(path): os.remove(path) # Warms up from empty DFAs.
+    cmd = Example(is_intaractive_run=False)
+    cmd.parser._listeners = [] # Codes with syntax errors are also parsed.
+    cmd.is_lazy_body = False # Function bodies also warm the DFAs.
+    count = 0
+    for a_dir in argv[1:]:
+        for filename in sorted(os.listdir(a_dir)):
+            if os.path.splitext(filename)[1] != '.unit': continue
+            with open(os.path.join(a_dir, filename), 'r') as rf:
+                code = rf.read()
+            cmd.build_tree(InputStream(code.decode('utf-8')))
+            count += 1
+
+    ParserSnapshot.save(path)
+    print 'Parsed %s codes and saved a snapshot into %s' % (count, path)
+
+    return Constants.EXIT_SUCCESS
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
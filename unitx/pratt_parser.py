@@ -0,0 +1,504 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+
+import sys
+from antlr4.Token import Token
+from antlr4.error.Errors import ParseCancellationException
+from UnitXParser import UnitXParser
+from collapsing_parser import CollapsingParser
+from constants import Constants
+
+def _types(*literals):
+    """Returns a frozenset of token types of literals such as 'print'."""
+    return frozenset(UnitXParser.literalNames.index(u"'%s'" % a_literal) for a_literal in literals)
+
+def _type(a_literal):
+    """Returns a token type of a literal such as 'print'."""
+    return UnitXParser.literalNames.index(u"'%s'" % a_literal)
+
+
+class PrattParser(object):
+    """A hand-written parser of UnitX as an alternative to UnitXParser.
+
+    It parses the same grammar as UnitX.g4 by recursive descent, and expressions
+    are parsed by a table of binding powers (a Pratt parser). It builds the same
+    contexts of UnitXParser with the same children, tokens and parents,
+    so EvalVisitor and ParseCache work with them without any change.
+    Tiers with one operand are removed as CollapsingParser does.
+
+    It only parses valid codes. It raises ParseCancellationException
+    at the first syntax error, and the caller parses the code again by UnitXParser,
+    so errors are reported by EvalErrorStrategy at the same positions as before.
+
+    Where the grammar is ambiguous, it decides the same as the adaptive
+    prediction of ANTLR: optional and repeated parts are taken greedily,
+    and a unit after an operand is taken only when it's a complete unit.
+    A unit or arguments ending a condition of rep and if such as "if x {y}"
+    are taken only when the statement after them parses, or else they're the statement.
+
+    Attributes:
+        parser: An instance of UnitXParser which owns contexts and reports errors.
+        __tokens: A list of tokens on the default channel.
+        __p: An int indicating an index of the current token.
+        __ctx: An instance of the current context.
+        __last_choice: An int indicating an index of '{' or '(' of the last unit or arguments.
+        __stop_at: An int indicating an index of '{' or '(' which starts a statement instead.
+    """
+
+    #
+    # Binary tiers from the lowest binding power to the highest one.
+    # A tier is (a context class, a set of operator types, whether it is right associative).
+    #
+    BINARY_TIERS = [
+        (UnitXParser.AssignmentExpressionContext, _types('=', '+=', '-=', '*=', '/=', '%='), True),
+        (UnitXParser.LogicalExpressionContext, _types('&&', '||', 'and', 'or'), False),
+        (UnitXParser.EqualityExpressionContext, _types('==', '!=', 'is'), False),
+        (UnitXParser.RelationalExpressionContext, _types('<=', '>=', '>', '<'), False),
+        (UnitXParser.AdditiveExpressionContext, _types('+', '-'), False),
+        (UnitXParser.MultiplicativeExpressionContext, _types('*', '/', '%'), False),
+    ]
+
+    PREFIX_OPERATORS = _types('++', '--', '!', 'not')
+    INTEGERS = frozenset([UnitXParser.DECIMAL_INTEGER, UnitXParser.OCT_INTEGER, UnitXParser.HEX_INTEGER, UnitXParser.BIN_INTEGER])
+    NUMBERS = INTEGERS | frozenset([UnitXParser.FLOAT_NUMBER, UnitXParser.IMAG_NUMBER])
+    STRINGS = frozenset([UnitXParser.STRING_LITERAL, UnitXParser.BYTES_LITERAL])
+    HALF_STRINGS = frozenset([_type('"""'), _type("'''")])
+    BOOLEANS = _types('true', 'false')
+    LITERALS = NUMBERS | STRINGS | HALF_STRINGS | BOOLEANS | _types('NULL')
+    EXPRESSION_STARTS = LITERALS | PREFIX_OPERATORS | frozenset([UnitXParser.Identifier, UnitXParser.LPAREN, UnitXParser.LBRACK])
+    BORDERS = frozenset([UnitXParser.THREE_BORDER, UnitXParser.FOUR_BORDER, UnitXParser.FIVE_BORDER, UnitXParser.SIX_BORDER,
+                         UnitXParser.SEVEN_BORDER, UnitXParser.EIGHT_BORDER, UnitXParser.NINE_BORDER, UnitXParser.TEN_BORDER])
+    UNIT_TOKENS = frozenset([UnitXParser.Identifier, UnitXParser.DECIMAL_INTEGER])
+    ELSE = _type('else')
+    ASSERT = _type('assert')
+
+    def __init__(self, parser):
+        """Inits attributes of a PrattParser class."""
+        self.parser = parser
+        self.__tokens = []
+        self.__p = 0
+        self.__ctx = None
+        self.__last_choice = None
+        self.__stop_at = None
+
+
+    def parse(self, token_stream):
+        """Parses tokens of a stream and returns a parse tree.
+
+        Args:
+            token_stream: An instance of CommonTokenStream.
+        Returns:
+            An instance of ProgramContext.
+        Raises:
+            ParseCancellationException: An error occurred by a syntax error.
+        """
+        token_stream.fill()
+        self.__tokens = [t for t in token_stream.tokens if t.channel == Token.DEFAULT_CHANNEL]
+        self.__p = 0
+        self.__ctx = None
+        self.__last_choice = None
+        self.__stop_at = None
+        return self.__program()
+
+
+    #
+    # Helpers doing the same as enterRule(), exitRule(), match() and consume() of ANTLR.
+    #
+    def __la(self, i=1):
+        index = self.__p + i - 1
+        if index < len(self.__tokens): return self.__tokens[index].type
+        return Token.EOF
+
+
+    def __enter(self, ctx_class):
+        ctx = ctx_class(self.parser, self.__ctx)
+        ctx.start = self.__tokens[self.__p]
+        if self.__ctx is not None: self.__ctx.addChild(ctx)
+        self.__ctx = ctx
+        return ctx
+
+
+    def __exit(self):
+        ctx = self.__ctx
+        ctx.stop = self.__tokens[self.__p - 1] if self.__p > 0 else None
+        CollapsingParser.collapse(ctx)
+        self.__ctx = ctx.parentCtx
+        return ctx
+
+
+    def __consume(self):
+        a_token = self.__tokens[self.__p]
+        if a_token.type != Token.EOF: self.__p += 1
+        self.__ctx.addTokenNode(a_token)
+        return a_token
+
+
+    def __match(self, a_type):
+        if self.__la() != a_type: self.__fail()
+        return self.__consume()
+
+
+    def __fail(self):
+        raise ParseCancellationException(self.__tokens[self.__p])
+
+
+    #
+    # Statements
+    #
+    def __program(self):
+        self.__enter(UnitXParser.ProgramContext)
+        while self.__la() != Token.EOF:
+            self.__type_declaration()
+        self.__match(Token.EOF)
+        return self.__exit()
+
+
+    def __type_declaration(self):
+        self.__enter(UnitXParser.TypeDeclarationContext)
+        if self.__la() == UnitXParser.DEF: self.__function_declaration()
+        else: self.__statement()
+        return self.__exit()
+
+
+    def __function_declaration(self):
+        self.__enter(UnitXParser.FunctionDeclarationContext)
+        self.__match(UnitXParser.DEF)
+        self.__match(UnitXParser.Identifier)
+        self.__enter(UnitXParser.FormalParametersContext)
+        if self.__la() == UnitXParser.LPAREN:
+            self.__consume()
+            if self.__la() == UnitXParser.Identifier: self.__formal_parameter_list()
+            self.__match(UnitXParser.RPAREN)
+        elif self.__la() == UnitXParser.Identifier:
+            self.__formal_parameter_list()
+        self.__exit()
+        self.__block()
+        return self.__exit()
+
+
+    def __formal_parameter_list(self):
+        self.__enter(UnitXParser.FormalParameterListContext)
+        self.__formal_parameter()
+        while self.__la() == UnitXParser.COMMA:
+            self.__consume()
+            self.__formal_parameter()
+        return self.__exit()
+
+
+    def __formal_parameter(self):
+        self.__enter(UnitXParser.FormalParameterContext)
+        self.__match(UnitXParser.Identifier)
+        if self.__la() == UnitXParser.ASSIGN:
+            self.__consume()
+            self.__expression()
+        return self.__exit()
+
+
+    def __block(self):
+        self.__enter(UnitXParser.BlockContext)
+        if self.__la() == UnitXParser.LBRACE: closing = UnitXParser.RBRACE
+        elif self.__la() == UnitXParser.COLON: closing = UnitXParser.END
+        else: self.__fail()
+        self.__consume()
+        while self.__la() != closing:
+            self.__enter(UnitXParser.BlockStatementContext)
+            self.__statement()
+            self.__exit()
+        self.__consume()
+        return self.__exit()
+
+
+    def __statement(self):
+        self.__enter(UnitXParser.StatementContext)
+        la = self.__la()
+        if la == UnitXParser.LBRACE or la == UnitXParser.COLON:
+            self.__block()
+            return self.__exit()
+        elif la == UnitXParser.REP:
+            self.__rep_statement()
+            return self.__exit()
+        elif la == UnitXParser.IF:
+            self.__if_statement()
+            return self.__exit()
+        elif la == UnitXParser.RETURN:
+            self.__consume()
+            if self.__la() in PrattParser.EXPRESSION_STARTS: self.__expression()
+        elif la == UnitXParser.BREAK or la == UnitXParser.CONTINUE:
+            self.__consume()
+        elif la == UnitXParser.PRINT:
+            self.__enter(UnitXParser.PrintStatementContext)
+            self.__consume()
+            self.__expressions()
+            self.__exit()
+        elif la == PrattParser.ASSERT:
+            self.__enter(UnitXParser.AssertStatementContext)
+            self.__consume()
+            if self.__la() in PrattParser.EXPRESSION_STARTS: self.__expression()
+            self.__exit()
+        elif la == UnitXParser.GT:
+            self.__enter(UnitXParser.DumpStatementContext)
+            self.__consume()
+            self.__match(UnitXParser.GT)
+            self.__expressions()
+            self.__exit()
+        elif la in PrattParser.BORDERS:
+            self.__enter(UnitXParser.BorderStatementContext)
+            self.__consume()
+            self.__exit()
+        elif la in PrattParser.EXPRESSION_STARTS:
+            self.__enter(UnitXParser.ExpressionStatementContext)
+            self.__expression()
+            self.__exit()
+        else:
+            self.__fail()
+
+        if self.__la() == UnitXParser.SEMICOLON: self.__consume()
+        return self.__exit()
+
+
+    def __expressions(self):
+        """Parses "expression? (',' expression)*" of print and dump statements."""
+        if self.__la() in PrattParser.EXPRESSION_STARTS: self.__expression()
+        while self.__la() == UnitXParser.COMMA:
+            self.__consume()
+            self.__expression()
+
+
+    def __rep_statement(self):
+        self.__enter(UnitXParser.RepStatementContext)
+        self.__match(UnitXParser.REP)
+        if self.__la() == UnitXParser.LPAREN:
+            self.__consume()
+            self.__rep_control()
+            self.__match(UnitXParser.RPAREN)
+            self.__statement()
+        else:
+            self.__condition_and_statement(self.__rep_control)
+        return self.__exit()
+
+
+    def __rep_control(self):
+        self.__enter(UnitXParser.RepControlContext)
+        self.__match(UnitXParser.Identifier)
+        self.__match(UnitXParser.COMMA)
+        self.__enter(UnitXParser.EndRepContext)
+        self.__expression()
+        self.__exit()
+        return self.__exit()
+
+
+    def __if_statement(self):
+        self.__enter(UnitXParser.IfStatementContext)
+        self.__match(UnitXParser.IF)
+        self.__condition_and_statement(self.__par_expression)
+        if self.__la() == PrattParser.ELSE:
+            self.__consume()
+            self.__statement()
+        return self.__exit()
+
+
+    def __par_expression(self):
+        # "(x)" is also an expression, and ANTLR takes the first alternative for it.
+        self.__enter(UnitXParser.ParExpressionContext)
+        self.__expression()
+        return self.__exit()
+
+
+    def __condition_and_statement(self, condition):
+        """Parses a condition of rep or if and the statement after it.
+
+        "{y}" of "if x {y}" is a unit of x or a block, and "(y)" of "if x (y)"
+        is arguments of x or a statement. ANTLR looks ahead and takes them
+        for the condition when the statement after them parses, so the condition
+        is parsed again up to the last of them when the statement fails.
+        """
+        ctx, p, n = self.__ctx, self.__p, len(self.__ctx.children)
+        self.__last_choice = None
+        condition()
+        if self.__last_choice is None:
+            self.__statement()
+            return
+        stop_at = self.__last_choice
+        try:
+            self.__statement()
+        except ParseCancellationException:
+            self.__ctx, self.__p = ctx, p
+            del ctx.children[n:]
+            self.__stop_at = stop_at
+            condition()
+            self.__stop_at = None
+            self.__statement()
+
+
+    #
+    # Expressions
+    #
+    def __expression(self):
+        self.__enter(UnitXParser.ExpressionContext)
+        self.__binary(0)
+        return self.__exit()
+
+
+    def __binary(self, level):
+        """Parses a binary tier and the tiers binding tighter than it."""
+        if level == len(PrattParser.BINARY_TIERS): return self.__unary()
+
+        ctx_class, operators, is_right = PrattParser.BINARY_TIERS[level]
+        self.__enter(ctx_class)
+        self.__binary(level + 1)
+        while self.__la() in operators and self.__la(2) in PrattParser.EXPRESSION_STARTS:
+            self.__consume()
+            if is_right:
+                self.__binary(level)
+                break
+            self.__binary(level + 1)
+        return self.__exit()
+
+
+    def __unary(self):
+        self.__enter(UnitXParser.UnaryExpressionContext)
+        if self.__la() in PrattParser.PREFIX_OPERATORS:
+            self.__consume()
+            self.__unary()
+        else:
+            self.__call()
+        return self.__exit()
+
+
+    def __call(self):
+        self.__enter(UnitXParser.CallExpressionContext)
+        self.__primary()
+        while self.__la() == UnitXParser.LPAREN and self.__p != self.__stop_at:
+            self.__last_choice = self.__p
+            self.__consume()
+            if self.__la() in PrattParser.EXPRESSION_STARTS:
+                self.__enter(UnitXParser.ExpressionListContext)
+                self.__expression()
+                while self.__la() == UnitXParser.COMMA:
+                    self.__consume()
+                    self.__expression()
+                self.__exit()
+            self.__match(UnitXParser.RPAREN)
+        return self.__exit()
+
+
+    def __primary(self):
+        self.__enter(UnitXParser.PrimaryContext)
+        la = self.__la()
+        if la == UnitXParser.Identifier:
+            self.__consume()
+        elif la in PrattParser.LITERALS:
+            self.__literal()
+        elif la == UnitXParser.LPAREN:
+            self.__consume()
+            self.__expression()
+            self.__match(UnitXParser.RPAREN)
+        elif la == UnitXParser.LBRACK:
+            self.__consume()
+            if self.__la() in PrattParser.EXPRESSION_STARTS: self.__expression()
+            while self.__la() == UnitXParser.COMMA:
+                self.__consume()
+                self.__expression()
+            self.__match(UnitXParser.RBRACK)
+        else:
+            self.__fail()
+
+        if self.__la() == UnitXParser.LBRACE and self.__is_unit():
+            self.__last_choice = self.__p
+            self.__unit()
+        return self.__exit()
+
+
+    def __literal(self):
+        self.__enter(UnitXParser.LiteralContext)
+        la = self.__la()
+        if la in PrattParser.NUMBERS:
+            self.__enter(UnitXParser.NumberContext)
+            if la in PrattParser.INTEGERS:
+                self.__enter(UnitXParser.IntegerContext)
+                self.__consume()
+                self.__exit()
+            else:
+                self.__consume()
+            self.__exit()
+        elif la in PrattParser.STRINGS:
+            self.__enter(UnitXParser.StringContext)
+            self.__consume()
+            self.__exit()
+        elif la in PrattParser.BOOLEANS:
+            self.__enter(UnitXParser.BooleanContext)
+            self.__consume()
+            self.__exit()
+        elif la in PrattParser.HALF_STRINGS:
+            self.__fail() # An unclosed string is reported by UnitXParser.
+        else:
+            self.__enter(UnitXParser.NoneContext)
+            self.__consume()
+            self.__exit()
+        return self.__exit()
+
+
+    #
+    # Units
+    #
+    def __is_unit(self):
+        """Returns whether tokens from '{' are a complete unit such as {@km->m/h}."""
+        if self.__p == self.__stop_at: return False
+        i = 2
+        if self.__la(i) == UnitXParser.AT: i += 1
+        for _ in range(2):
+            if self.__la(i) not in PrattParser.UNIT_TOKENS: return False
+            i += 1
+            if self.__la(i) == UnitXParser.ALLOW:
+                if self.__la(i+1) not in PrattParser.UNIT_TOKENS: return False
+                i += 2
+            if self.__la(i) != UnitXParser.DIV: break
+            i += 1
+        return self.__la(i) == UnitXParser.RBRACE
+
+
+    def __unit(self):
+        self.__enter(UnitXParser.UnitContext)
+        self.__consume()
+        self.__enter(UnitXParser.UnitSingleOrPairOperatorContext)
+        if self.__la() == UnitXParser.AT: self.__consume()
+        self.__unit_operator()
+        if self.__la() == UnitXParser.DIV:
+            self.__consume()
+            self.__unit_operator()
+        self.__exit()
+        self.__match(UnitXParser.RBRACE)
+        return self.__exit()
+
+
+    def __unit_operator(self):
+        self.__enter(UnitXParser.UnitOperatorContext)
+        self.__unit_token()
+        if self.__la() == UnitXParser.ALLOW:
+            self.__consume()
+            self.__unit_token()
+        return self.__exit()
+
+
+    def __unit_token(self):
+        self.__enter(UnitXParser.UnitTokenContext)
+        self.__consume()
+        return self.__exit()
+
+
+def main():
+    """Run an example for a PrattParser class."""
+    from antlr4.InputStream import InputStream
+    from antlr4.CommonTokenStream import CommonTokenStream
+    from UnitXLexer import UnitXLexer
+
+    code = u'x = 5{km} + 3{m}\nprint x{km->m}, [1, 2]\n'
+    parser = UnitXParser(None)
+    a_tree = PrattParser(parser).parse(CommonTokenStream(UnitXLexer(InputStream(code))))
+    print a_tree.toStringTree(recog=parser)
+
+    return Constants.EXIT_SUCCESS
+
+
+if __name__ == '__main__':
+    sys.exit(main())
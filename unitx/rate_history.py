@@ -0,0 +1,174 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+
+import sys
+import os
+import mmap
+import struct
+from datetime import datetime
+from constants import Constants
+
+class RateHistory(object):
+    """A store of historical currency exchange rates indexed by date and currency.
+
+    The store is a binary file mapped on memory. Rates are saved as columns
+    of float64 (a column per currency, a row per day from the first date),
+    so a rate of a date is read at a computed offset without loading
+    the whole history into Python objects.
+
+    A data structure:
+        <header> := MAGIC <first ordinal> <days> <currencies> <code>*
+        <body> := float64[<currencies>][<days>] (NaN means no rate)
+
+    Attributes:
+        path: A string indicating a path of the store.
+        first_ordinal: An int indicating a proleptic Gregorian ordinal of the first date.
+        days: An int indicating the number of days.
+        currencies: A list of currency strings.
+        __indexes: A dict from a currency string to a column index.
+        __body_offset: An int indicating where the columns start.
+        __map: An instance of mmap mapping the store.
+    """
+
+    MAGIC = 'UXRH0001'
+    HEADER = struct.Struct('<8siII')
+    CODE = struct.Struct('<4s')
+    RATE = struct.Struct('<d')
+
+    def __init__(self, path):
+        """Opens a store and maps it on memory.
+
+        Args:
+            path: A string indicating a path of the store.
+        Raises:
+            IOError: An error occurred by a store which doesn't exist or is broken.
+        """
+        self.path = path
+        with open(path, 'rb') as rf:
+            magic, self.first_ordinal, self.days, num = RateHistory.HEADER.unpack(rf.read(RateHistory.HEADER.size))
+            if magic != RateHistory.MAGIC:
+                raise IOError("'%s' is not a rate history." % path)
+            self.currencies = [RateHistory.CODE.unpack(rf.read(RateHistory.CODE.size))[0].rstrip('\0') for _ in range(num)]
+            self.__map = mmap.mmap(rf.fileno(), 0, access=mmap.ACCESS_READ)
+        self.__indexes = dict((c, i) for i, c in enumerate(self.currencies))
+        self.__body_offset = RateHistory.HEADER.size + RateHistory.CODE.size * num
+
+
+    def rate(self, currency, a_date):
+        """Returns a currency exchange rate of a date in O(1).
+
+        Args:
+            currency: A string of a currency such as 'USD'.
+            a_date: An instance of date.
+        Returns:
+            A float which is a currency exchange rate against EUR,
+            or None when the store doesn't have the rate.
+        """
+        if currency not in self.__indexes: return None
+        day = a_date.toordinal() - self.first_ordinal
+        if day < 0: return None
+        if day >= self.days: day = self.days - 1 # The latest rate
+        offset = self.__body_offset + (self.__indexes[currency] * self.days + day) * RateHistory.RATE.size
+        a_rate = RateHistory.RATE.unpack_from(self.__map, offset)[0]
+        if a_rate != a_rate: return None # NaN
+        return a_rate
+
+
+    def close(self):
+        """Unmaps the store."""
+        self.__map.close()
+
+
+    @classmethod
+    def __read_rows(cls, rf):
+        """Yields an ordinal and values of each row of a CSV as a stream.
+
+        Args:
+            rf: A file object of a CSV whose header is already read.
+        """
+        for line in rf:
+            cells = line.strip().split(',')
+            if not cells[0]: continue
+            yield datetime.strptime(cells[0], '%Y-%m-%d').toordinal(), cells[1:]
+
+
+    @classmethod
+    def import_csv(cls, csv_path, path):
+        """Imports a CSV of historical rates into a store.
+
+        The CSV is a format of "eurofxref-hist.csv" on the European Central Bank:
+            Date,USD,JPY,...
+            2016-04-08,1.1395,123.3,...
+        It's read twice as a stream. The first pass finds a range of dates,
+        and the second pass writes each rate into the columns mapped on memory.
+        Days without rates (weekends and holidays) are filled by the last rate.
+
+        Args:
+            csv_path: A string indicating a path of the CSV.
+            path: A string indicating a path of the store.
+        """
+        with open(csv_path, 'r') as rf:
+            currencies = [c.strip() for c in rf.readline().strip().split(',')[1:]]
+            first_ordinal = last_ordinal = None
+            for ordinal, _ in cls.__read_rows(rf):
+                if first_ordinal is None or ordinal < first_ordinal: first_ordinal = ordinal
+                if last_ordinal is None or ordinal > last_ordinal: last_ordinal = ordinal
+        days = last_ordinal - first_ordinal + 1
+        columns = [i for i, c in enumerate(currencies) if c]
+        num = len(columns)
+
+        a_dir = os.path.dirname(path)
+        if a_dir and not os.path.isdir(a_dir): os.makedirs(a_dir)
+        with open(path, 'wb') as wf:
+            wf.write(RateHistory.HEADER.pack(RateHistory.MAGIC, first_ordinal, days, num))
+            for i in columns:
+                wf.write(RateHistory.CODE.pack(currencies[i]))
+            empty_column = RateHistory.RATE.pack(float('nan')) * days
+            for _ in columns:
+                wf.write(empty_column)
+
+        body_offset = RateHistory.HEADER.size + RateHistory.CODE.size * num
+        size = RateHistory.RATE.size
+        with open(path, 'r+b') as f:
+            a_map = mmap.mmap(f.fileno(), 0)
+            with open(csv_path, 'r') as rf:
+                rf.readline()
+                for ordinal, cells in cls.__read_rows(rf):
+                    day = ordinal - first_ordinal
+                    for column, i in enumerate(columns):
+                        if i < len(cells) and cells[i].strip() not in ('', 'N/A'):
+                            RateHistory.RATE.pack_into(a_map, body_offset + (column * days + day) * size, float(cells[i]))
+
+            for column in range(num):
+                last_rate = float('nan')
+                for day in range(days):
+                    offset = body_offset + (column * days + day) * size
+                    a_rate = RateHistory.RATE.unpack_from(a_map, offset)[0]
+                    if a_rate != a_rate: RateHistory.RATE.pack_into(a_map, offset, last_rate)
+                    else: last_rate = a_rate
+            a_map.flush()
+            a_map.close()
+        return
+
+
+def main(argv):
+    """Imports a CSV of historical rates into the store of UnitX.
+
+    Usage:
+        $ python rate_history.py eurofxref-hist.csv
+    """
+    if len(argv) < 2:
+        print 'Usage: python %s <eurofxref-hist.csv>' % argv[0]
+        return Constants.EXIT_FAILURE
+
+    path = os.path.expanduser(Constants.RATE_HISTORY_DATA)
+    RateHistory.import_csv(argv[1], path)
+    history = RateHistory(path)
+    print 'Imported %s days of %s currencies into %s' % (history.days, len(history.currencies), path)
+    history.close()
+
+    return Constants.EXIT_SUCCESS
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+
+import sys
+import re
+from antlr4.Token import Token
+from antlr4.Lexer import TokenSource
+from antlr4.CommonTokenFactory import CommonTokenFactory
+from UnitXLexer import UnitXLexer
+from constants import Constants
+
+class RegexLexer(TokenSource):
+    """A tokenizer of UnitX by one precompiled master regex as an alternative to UnitXLexer.
+
+    UnitXLexer simulates the lexer ATN of ANTLR character by character,
+    but RegexLexer matches a token at once by the master regex,
+    and it emits the same tokens (types, channels, indexes, lines and columns).
+    It's a TokenSource, so it's given to CommonTokenStream instead of UnitXLexer.
+
+    The alternatives of the master regex are ordered so that the first match is
+    the longest match of UnitXLexer (e.g. a float before an integer, '---' before '--'),
+    and a keyword is found by a text of an identifier.
+    A character which the regex doesn't match is given to UnitXLexer,
+    so a token recognition error is reported and recovered as before.
+
+    Attributes:
+        __input: An instance of InputStream.
+        __text: A unicode string of the input.
+        __pos: An int indicating an index of the next character.
+        line: An int indicating a line of the next character.
+        column: An int indicating a column of the next character.
+        __line_start: An int indicating an index of the first character of the line.
+        __fallback: An instance of UnitXLexer for characters which the regex doesn't match.
+        _factory: An instance of CommonTokenFactory, which UnitXParser also uses for a missing token.
+        __factory_pair: A tuple of a source and an input of tokens.
+    """
+
+    __literal_types = dict((name[1:-1], i) for i, name in enumerate(UnitXLexer.literalNames) if name != u'<INVALID>')
+    __keywords = dict((a_text, a_type) for a_text, a_type in __literal_types.items() if re.match(r'^[a-zA-Z_]+$', a_text))
+    __operators = dict([(a_text, a_type) for a_text, a_type in __literal_types.items()
+                        if a_text not in __keywords and a_text not in (u'\n', u'\r', u'"""', u"'''")])
+
+    __MASTER = re.compile(u'|'.join([
+        # Skipped tokens
+        u'(?P<COMMENT>/\\*.*?\\*/|//[^\r\n]*|#[^\r\n]*)',
+        u'(?P<CR>\r(?![ \t\r\x0c]))', # '\r' is an implicit token when it's not in whitespaces.
+        u'(?P<WS>[ \t\r\x0c]+|\n)',
+        # Strings
+        u'(?P<LONG_STRING>\'\'\'(?:[^\\\\]|\\\\.)*?\'\'\'|"""(?:[^\\\\]|\\\\.)*?""")',
+        u'(?P<HALF_STRING>\'\'\'|""")',
+        u'(?P<SHORT_STRING>\'(?:\\\\.|[^\\\\\r\n\'])*\'|"(?:\\\\.|[^\\\\\r\n"])*")',
+        # Numbers
+        u'(?P<IMAG_NUMBER>(?:(?:[0-9]+|[0-9]*\\.[0-9]+|[0-9]+\\.)[eE][+-]?[0-9]+|[0-9]*\\.[0-9]+|[0-9]+\\.|[0-9]+)[jJ])',
+        u'(?P<FLOAT_NUMBER>(?:[0-9]+|[0-9]*\\.[0-9]+|[0-9]+\\.)[eE][+-]?[0-9]+|[0-9]*\\.[0-9]+|[0-9]+\\.)',
+        u'(?P<OCT_INTEGER>0[oO][0-7]+)',
+        u'(?P<HEX_INTEGER>0[xX][0-9a-fA-F]+)',
+        u'(?P<BIN_INTEGER>0[bB][01]+)',
+        u'(?P<DECIMAL_INTEGER>[1-9][0-9]*|0+)',
+        # Identifiers and keywords
+        u'(?P<Identifier>(?:[a-zA-Z$_\u0100-\ud7ff\udc00-\uffff]|[\ud800-\udbff][\udc00-\udfff])'
+        u'(?:[a-zA-Z0-9$_\u0100-\ud7ff\udc00-\uffff]|[\ud800-\udbff][\udc00-\udfff])*)',
+        # Operators from the longest one
+        u'(?P<OPERATOR>%s)' % u'|'.join(re.escape(a_text) for a_text in sorted(__operators, key=len, reverse=True)),
+    ]), re.DOTALL | re.UNICODE)
+
+    __types = {
+        'CR': __literal_types[u'\r'],
+        'LONG_STRING': UnitXLexer.STRING_LITERAL,
+        'SHORT_STRING': UnitXLexer.STRING_LITERAL,
+        'IMAG_NUMBER': UnitXLexer.IMAG_NUMBER,
+        'FLOAT_NUMBER': UnitXLexer.FLOAT_NUMBER,
+        'OCT_INTEGER': UnitXLexer.OCT_INTEGER,
+        'HEX_INTEGER': UnitXLexer.HEX_INTEGER,
+        'BIN_INTEGER': UnitXLexer.BIN_INTEGER,
+        'DECIMAL_INTEGER': UnitXLexer.DECIMAL_INTEGER,
+    }
+
+    def __init__(self, an_input=None):
+        """Inits attributes of a RegexLexer class.
+
+        Args:
+            an_input: An instance of InputStream or FileStream, or None to set it later.
+        """
+        self._factory = CommonTokenFactory.DEFAULT
+        self.__fallback = None
+        self.inputStream = an_input
+
+
+    @property
+    def inputStream(self):
+        return self.__input
+
+
+    @inputStream.setter
+    def inputStream(self, an_input):
+        """Sets an input and resets the position like UnitXLexer, so a lexer is reused for inputs."""
+        self.__input = an_input
+        self.__text = an_input.strdata if an_input is not None else u''
+        self.__pos = an_input.index if an_input is not None else 0
+        self.line = 1
+        self.column = 0
+        self.__line_start = self.__pos
+        if self.__fallback is not None: self.__fallback.inputStream = an_input
+        self.__factory_pair = (self, an_input)
+
+
+    def getInputStream(self):
+        return self.__input
+
+
+    def getSourceName(self):
+        return self.__input.getSourceName()
+
+
+    def nextToken(self):
+        """Returns the next token on the default channel, or EOF at the end."""
+        text, size, match = self.__text, len(self.__text), RegexLexer.__MASTER.match
+        while self.__pos < size:
+            a_match = match(text, self.__pos)
+            if a_match is None: return self.__next_token_by_fallback()
+
+            kind, start, stop = a_match.lastgroup, self.__pos, a_match.end()
+            line, column = self.line, start - self.__line_start
+            self.__pos = stop
+            newlines = text.count(u'\n', start, stop)
+            if newlines:
+                self.line += newlines
+                self.__line_start = text.rindex(u'\n', start, stop) + 1
+            if kind == 'COMMENT' or kind == 'WS': continue
+
+            a_token_text = a_match.group()
+            if kind == 'Identifier':
+                a_type = RegexLexer.__keywords.get(a_token_text, UnitXLexer.Identifier)
+            elif kind == 'OPERATOR' or kind == 'HALF_STRING':
+                a_type = RegexLexer.__literal_types[a_token_text]
+            else:
+                a_type = RegexLexer.__types[kind]
+            return self.__create(a_type, start, stop - 1, line, column)
+
+        self.column = self.__pos - self.__line_start
+        return self.__create(Token.EOF, self.__pos, self.__pos - 1, self.line, self.column)
+
+
+    def __create(self, a_type, start, stop, line, column):
+        return self._factory.create(self.__factory_pair, a_type, None, Token.DEFAULT_CHANNEL, start, stop, line, column)
+
+
+    def __next_token_by_fallback(self):
+        """Returns the next token by UnitXLexer from the current position.
+
+        UnitXLexer reports a token recognition error and skips a character,
+        and the next token is lexed by the regex again.
+        """
+        if self.__fallback is None: self.__fallback = UnitXLexer(self.__input)
+        self.__input.seek(self.__pos)
+        self.__fallback.line = self.line
+        self.__fallback.column = self.__pos - self.__line_start
+        a_token = self.__fallback.nextToken()
+        self.__pos = self.__input.index
+        self.line = self.__fallback.line
+        self.__line_start = self.__pos - self.__fallback.column
+        return a_token
+
+
+def main():
+    """Run an example for a RegexLexer class."""
+    from antlr4.InputStream import InputStream
+    from antlr4.CommonTokenStream import CommonTokenStream
+
+    code = u'x = 5{km} + 3.5{m} # A comment\nprint x{km->m}, \'距離\'\n'
+    token_stream = CommonTokenStream(RegexLexer(InputStream(code)))
+    token_stream.fill()
+    for a_token in token_stream.tokens:
+        print '%s:%s' % (a_token.line, a_token.column), a_token.type, a_token.text.encode('utf-8')
+
+    return Constants.EXIT_SUCCESS
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -12,11 +12,20 @@ class ScopeList(list, Collegue):
     
     Actually, This is implemented by a list.
     But it has some functions because this lang needs to create and delete a scope.
+
+    Attributes:
+        def_version: An int indicating a version of names bound to functions.
+            It's increased when a watched name may be bound to another value
+            (e.g. 'def', an assignment, a parameter or a deleted scope),
+            and call sites caching a resolved function compare it.
+        __watched_names: A set of names which are cached by call sites.
     """
 
     def __init__(self):
         """Pushes an empty scope into the top of this ScopeList."""
         self.append(Scope(parent=None))
+        self.def_version = 0
+        self.__watched_names = set()
 
     def new_scope(self):
         """Pushes an empty scope into the top of this ScopeList
@@ -26,12 +35,22 @@ class ScopeList(list, Collegue):
         self.append(Scope(self.peek()))
         return
 
+    def push_scope(self, a_scope):
+        """Pushes a created scope (e.g. a Frame of a function call) into the top of this ScopeList.
+
+        Args:
+            a_scope: An instance of a Scope class whose parent is a current scope.
+        """
+        self.__touch(a_scope)
+        self.append(a_scope)
+        return
+
     def del_scope(self):
         """Deletes a scope which is already used from the top of this ScopeList
 
         To put it simply, it means "delete new current scope".
         """
-        self.pop()
+        self.__touch(self.pop())
         return
 
 
@@ -57,6 +76,23 @@ class ScopeList(list, Collegue):
         """
         current_scope = self.peek()
         current_scope[varname] = unitx_obj
+        self.__touch((varname,))
+        return
+
+
+    def watch(self, varname):
+        """Watches a name which a call site caches with a current def_version.
+
+        Args:
+            varname: A string of a name bound to a function.
+        """
+        self.__watched_names.add(varname)
+        return
+
+
+    def __touch(self, varnames):
+        """Increases def_version, if a watched name is in varnames (e.g. names of a scope)."""
+        if not self.__watched_names.isdisjoint(varnames): self.def_version += 1
         return
 
 
@@ -80,10 +116,12 @@ def main():
     scopes.peek()['y'] = UnitXObject(value=3, varname='y', unit=Unit())
 
     Util.dump(scopes)
+    scopes.watch('x')
     scopes.del_scope()
     Util.dump(scopes)
     scopes.del_scope()
     Util.dump(scopes)
+    print 'A version of definitions: ', scopes.def_version
 
     return Constants.EXIT_SUCCESS
 
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+
+import sys
+from operator import mul
+from decimal import Decimal
+from constants import Constants
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+class UnitList(object):
+    """Numbers of a list in one unit, which built-in functions (e.g. sum()) reduce at once.
+
+    Values are reduced by one pass of Python instead of a UnitXObject and a check
+    of units on each element, or by NumPy if it's installed.
+    NumPy is used only for floats and a sequential reduction (cumsum),
+    so a result is the same as a loop adding elements, whether NumPy is installed or not.
+    Floats are turned into Decimals with Decimals (e.g. currencies on a money mode),
+    as UnitXObject calculates them.
+
+    Attributes:
+        values: A list of numbers (int, long, float or Decimal).
+        unit: An instance of Unit of the values.
+    """
+
+    def __init__(self, values, unit):
+        """Inits attributes of a UnitList class."""
+        types = set(map(type, values))
+        if Decimal in types and float in types:
+            values = [Decimal(repr(v)) if isinstance(v, float) else v for v in values]
+        self.values = values
+        self.unit = unit
+        self.__is_float = types == set([float])
+        self.__has_decimal = Decimal in types
+
+
+    def __len__(self):
+        """Returns the number of values."""
+        return len(self.values)
+
+
+    def sum(self):
+        """Returns a sum of values (0 for an empty list)."""
+        return sum(self.values)
+
+
+    def mean(self):
+        """Returns a mean of values of a non-empty list.
+
+        A mean of ints is an int when it's divisible, or a float.
+        """
+        total, count = self.sum(), len(self.values)
+        if isinstance(total, (int, long)):
+            return total // count if total % count == 0 else float(total) / count
+        return total / count
+
+
+    def min(self):
+        """Returns the minimum value of a non-empty list."""
+        return min(self.values)
+
+
+    def max(self):
+        """Returns the maximum value of a non-empty list."""
+        return max(self.values)
+
+
+    def cumsum(self):
+        """Returns a list of cumulative sums of values."""
+        if numpy is not None and self.__is_float:
+            return numpy.cumsum(numpy.array(self.values, dtype=float)).tolist()
+        sums, total = [], 0
+        for a_value in self.values:
+            total += a_value
+            sums.append(total)
+        return sums
+
+
+    def dot(self, a_list):
+        """Returns a sum of products of values of this list and another list of the same length."""
+        values, other_values = self.values, a_list.values
+        if self.__has_decimal != a_list.__has_decimal:
+            values = [Decimal(repr(v)) if isinstance(v, float) else v for v in values]
+            other_values = [Decimal(repr(v)) if isinstance(v, float) else v for v in other_values]
+        return sum(map(mul, values, other_values))
+
+
+def main():
+    """Run an example for a UnitList class."""
+    from unit import Unit
+
+    a_list = UnitList([1.5, 2.5, 3.0], Unit(numer=u'km'))
+    print 'sum:', a_list.sum(), 'mean:', a_list.mean(), 'min:', a_list.min(), 'max:', a_list.max()
+    print 'cumsum:', a_list.cumsum()
+    print 'dot:', a_list.dot(UnitList([2, 2, 2], Unit()))
+    print 'NumPy:', numpy is not None
+
+    return Constants.EXIT_SUCCESS
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,60 +2,102 @@
 # -*- coding: utf-8 -*-
 
 import sys
+import os
+import ast
 import codecs
+import operator
+from fractions import Fraction
+from decimal import Decimal
 from collegue import Collegue
 from util import Util
 from constants import Constants
+from source_position import SourcePosition
+from unitlib import UnitLib
+from converter_registry import ConverterRegistry
 
 class UnitManager(Collegue):
     """A class parsing/saving unit informations from databases
     
 
     Examples:
-        prepare
-            from fractions import Fraction as Fra
-            from unitlib import UnitLib
-            ul = UnitLib()
+        plugins
+            unitlib
         end
         tokens
             sec minute hour day month year -> {u'sec': 1, u'minute': Fra(60), u'hour': Fra(60*60), u'day': Fra(60*60*24), u'month': Fra(60*60*24*30), u'year': Fra(60*60*24*365)}
-            pm nm μm mm cm m km -> {u'pm': Fra(1), u'nm': Fra(1000), u'nm': Fra(1000**2),  u'μm': Fra(1000**3),  u'mm': Fra(1000**4), u'cm': Fra((1000**4)*10),  u'm': Fra(1000**5),  u'km': Fra(1000**6)}    
+            USD JPY GBP -> rate
+            2 8 10 16 -> base
         end
+        money
+            JPY KRW -> 1
+            USD GBP -> 0.01
+        end
+
+        A group is a dict of criterions, or a name of a converter registered
+        in ConverterRegistry by a module listed in 'plugins'.
+        A dict is read by a small evaluator of numbers, and converters
+        are bound once here, so exec() or eval() are never used.
+        A group of 'money' is a quantum (a power of ten) of currencies for a money mode.
 
     Attributes:
         filename: A string indicating a file name to parse.
         encoding: A string indicating encode for parsing a file of unit infos.
-        exec_str_preparing: A string executing on the python for preparing unit libraries.
-        unit_dict:
-        unit_evals:
-        __unit_id_dict:
-        __is_updated:
+        unit_dict: A dict from a unit string to a criterion.
+        __unit_id_dict: A dict from a unit string to an id of a group.
+        __converters: A list of value converters (or None) for each group.
+        __criterions: A list of criterion converters (or None) for each group.
+        money_mode: A bool indicating whether currencies are computed exactly.
+        __places: A dict from a currency string to the number of decimal places.
+        __money_factors: A dict from a pair of currency strings to a scaled factor.
+        __rate_version: An int indicating a version of currency exchange rates
+            which cached criterions are computed by.
+        history_path: A string indicating a path of a rate history read by asof().
+        __as_of: None, or a pair of an instance of RateHistory and a date selected by asof().
     """
 
     def __init__(self, filename):
         """Inits attributes of a Unit class."""
         self.filename = filename
         self.encoding = 'utf-8'
-        self.exec_str_preparing = ""
         self.unit_dict = {}
-        self.unit_evals = []
         self.__unit_id_dict = {}
-        self.__is_updated = []
+        self.__converters = []
+        self.__criterions = []
+        self.money_mode = False
+        self.__places = {}
+        self.__money_factors = {}
+        self.__rate_version = UnitLib.get_rate_version()
+        self.history_path = os.path.expanduser(Constants.RATE_HISTORY_DATA)
+        self.__as_of = None
         self.__parse(self.filename)
 
     def __parse(self, filename):
         """
-            'prepare' <string> 'end'
+            'plugins' <module name>* 'end'
+            'tokens' <group>* 'end'
+            'money' <currencies -> quantum>* 'end'
         """
         with codecs.open(filename, 'r', encoding=self.encoding) as rf:
             line = rf.readline()
             while line:
                 line = line.lstrip().rstrip()
-                if line == 'prepare': self.__prepare_parsing(rf)
+                if line == 'plugins': self.__parse_plugins(rf)
                 elif line == 'tokens': self.__parse_tokens(rf)
+                elif line == 'money': self.__parse_money(rf)
                 else: pass
                 line = rf.readline()
 
+    def __parse_plugins(self, rf):
+        """Imports modules which register converters into ConverterRegistry.
+        """
+        line = rf.readline()
+        while line:
+            line = line.strip()
+            if line == 'end': return
+            if line: __import__(line.encode('utf-8'), globals(), locals(), [], -1)
+            line = rf.readline()
+        return
+
     def __parse_tokens(self, rf):
         """
         """
@@ -71,52 +113,202 @@ class UnitManager(Collegue):
                 tokens = token_line.split()
                 for a_token in tokens:
                     self.__unit_id_dict[a_token] = unit_id
-                self.unit_evals.append(dict_line)
-                self.__is_updated.append(False)
+                self.__bind_group(dict_line)
                 unit_id += 1
             line = rf.readline()
         return
 
 
-    def __prepare_parsing(self, rf):
+    def __parse_money(self, rf):
         """
         """
         line = rf.readline()
-        self.exec_str_preparing = ""
         while line:
-            line = line.rstrip()
-            if line == 'end':
-                exec(self.exec_str_preparing, globals())
-                return
-            self.exec_str_preparing += line+'\n'
+            line = line.strip()
+            if line == 'end': return
+            if line:
+                token_line, quantum = line.split('->')
+                sign, digits, exponent = Decimal(quantum.strip()).as_tuple()
+                if digits != (1,):
+                    raise ValueError("A quantum '%s' is not a power of ten." % quantum.strip())
+                for a_token in token_line.split():
+                    self.__places[a_token] = -exponent
             line = rf.readline()
         return
 
 
-    def get_exec_str_preparing(self):
-        return self.exec_str_preparing
+    def __bind_group(self, dict_line):
+        """Binds a dict of criterions or a converter of a group.
+
+        Args:
+            dict_line: A string of a dict or a name of a converter.
+        Raises:
+            KeyError: An error occurred by a converter which is not registered.
+        """
+        if dict_line.startswith('{'):
+            self.unit_dict.update(self.__eval_criterions(ast.parse(dict_line, mode='eval').body))
+            self.__converters.append(None)
+            self.__criterions.append(None)
+            return
+
+        converter = ConverterRegistry.get(dict_line)
+        criterion = ConverterRegistry.get_criterion(dict_line)
+        if not converter and not criterion:
+            raise KeyError("A converter '%s' is not registered." % dict_line)
+        self.__converters.append(converter)
+        self.__criterions.append(criterion)
+        return
+
+
+    def __eval_criterions(self, node):
+        """Evaluates a node of a dict of criterions without eval().
 
+        Numbers, strings, '+', '-', '*', '/', '**' and Fra() are supported
+        with the same meanings as the python.
 
-    def __update_dict(self, unit_str, unit):
+        Args:
+            node: An instance of ast.AST.
+        Returns:
+            A dict, a string, or a Fraction.
         """
+        if isinstance(node, ast.Dict):
+            return dict((self.__eval_criterions(k), self.__eval_criterions(v)) for k, v in zip(node.keys, node.values))
+        elif isinstance(node, ast.Str): return unicode(node.s)
+        elif isinstance(node, ast.Num): return node.n
+        elif isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == 'Fra':
+            return Fraction(self.__eval_criterions(node.args[0]))
+        elif isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+            return -self.__eval_criterions(node.operand)
+        elif isinstance(node, ast.BinOp) and type(node.op) in UnitManager.__OPERATORS:
+            return UnitManager.__OPERATORS[type(node.op)](self.__eval_criterions(node.left), self.__eval_criterions(node.right))
+        raise SyntaxError("An unsupported criterion in '%s'." % self.filename)
+
+
+    __OPERATORS = {
+        ast.Add: operator.add,
+        ast.Sub: operator.sub,
+        ast.Mult: operator.mul,
+        ast.Div: operator.div,
+        ast.Pow: operator.pow,
+    }
+
+
+    def __check_rate_version(self):
+        """Invalidates cached criterions of units which are computed by a converter,
+        when currency exchange rates have a new version.
+
+        The refresher thread only publishes new rates, so caches are
+        changed only here on the thread evaluating a code.
+        The criterions are computed again on the next get_criterion().
         """
-        unit_id = self.get_unit_id(unit_str, unit)
-        if self.__is_updated[unit_id]:
-            return
-        adding_dict = eval(self.unit_evals[unit_id])
-        if isinstance(adding_dict, dict):
-            self.unit_dict.update(adding_dict)
-            self.__is_updated[unit_id] = True
+        rate_version = UnitLib.get_rate_version()
+        if rate_version == self.__rate_version: return
+        self.__rate_version = rate_version
+        self.__invalidate_criterions()
+        return
+
+
+    def __invalidate_criterions(self):
+        """Invalidates cached criterions of units which are computed by a converter."""
+        for unit_str, unit_id in self.__unit_id_dict.iteritems():
+            if self.__criterions[unit_id]: self.unit_dict.pop(unit_str, None)
+        self.__money_factors.clear()
         return
-        
+
 
     def get_criterion(self, unit_str, unit):
+        """Returns a criterion of a unit.
+
+        A criterion of a unit computed by a criterion converter is cached
+        until currency exchange rates are changed.
         """
-        """
-        self.__update_dict(unit_str, unit)
+        self.__check_rate_version()
+        if unit_str not in self.unit_dict:
+            unit_id = self.get_unit_id(unit_str, unit)
+            try:
+                self.unit_dict[unit_str] = self.__criterions[unit_id](unit_str, self.__as_of)
+            except ValueError as e:
+                msg = e.args[0]
+                self.mediator.get_parser().notifyErrorListeners(msg, SourcePosition.to_token(unit.pos), Exception(msg))
+                return 1
         return self.unit_dict[unit_str]
 
 
+    def set_as_of(self, a_date):
+        """Selects a date of currency exchange rates of this interpreter.
+
+        The rates of the date are read from a rate history (history_path),
+        and cached criterions of currencies are invalidated.
+        Other interpreters on the process keep their own dates.
+
+        Args:
+            a_date: An instance of date, or None for selecting the latest snapshot.
+        Raises:
+            IOError: An error occurred by a rate history which doesn't exist.
+        """
+        self.__as_of = (UnitLib.open_history(self.history_path), a_date) if a_date is not None else None
+        self.__invalidate_criterions()
+        return
+
+
+    def get_converter(self, unit_str, unit):
+        """Returns a value converter bound to a group of a unit.
+
+        Returns:
+            A function receiving a value and an instance of Unit,
+            or None when the group is a group of criterions.
+        """
+        return self.__converters[self.get_unit_id(unit_str, unit)]
+
+
+    def set_money_mode(self, money_mode):
+        """Turns a money mode on or off.
+
+        On a money mode, values of currencies are Decimals rounded by a quantum
+        of each currency, and they are converted exactly by scaled integers.
+        """
+        self.money_mode = money_mode
+
+
+    def get_money_places(self, unit_str):
+        """Returns the number of decimal places of a currency on a money mode.
+
+        Returns:
+            An int such as 2 for USD and 0 for JPY, or None when a money mode
+            is off or the unit is not a currency.
+        """
+        if not self.money_mode: return None
+        return self.__places.get(unit_str)
+
+
+    def get_money_factor(self, ex_unit_str, unit_str, unit):
+        """Returns a factor converting from a currency to minor units of a currency.
+
+        A factor is a pair of ints (n, d), and an amount x of <ex_unit_str> is
+        round(x * n / d) minor units (e.g. cents) of <unit_str>.
+        It's computed once from criterions, and it's cached
+        until exchange rates of the currencies are changed.
+        """
+        self.__check_rate_version()
+        pair = (ex_unit_str, unit_str)
+        if pair not in self.__money_factors:
+            factor = self.get_criterion(ex_unit_str, unit) / self.get_criterion(unit_str, unit)
+            factor = Fraction(factor) * 10 ** self.__places[unit_str]
+            self.__money_factors[pair] = (factor.numerator, factor.denominator)
+        return self.__money_factors[pair]
+
+
+    def is_static_unit(self, unit_str):
+        """Returns whether a unit is converted only by constant criterions of the unit table.
+
+        Units of a group bound to a converter (e.g. currencies and time zones)
+        and currencies of a money mode are not static.
+        """
+        unit_id = self.__unit_id_dict.get(unit_str)
+        if unit_id is None: return False
+        return not self.__converters[unit_id] and not self.__criterions[unit_id] and unit_str not in self.__places
+
+
     def get_unit_id(self, unit_str, unit):
         """
         """
@@ -124,7 +316,7 @@ class UnitManager(Collegue):
             return self.__unit_id_dict[unit_str]
         else:
             msg = Constants.NAME_ERR % unit_str
-            self.mediator.get_parser().notifyErrorListeners(msg, unit.token, Exception(msg))
+            self.mediator.get_parser().notifyErrorListeners(msg, SourcePosition.to_token(unit.pos), Exception(msg))
 
 
     def set_mediator(self, mediator):
@@ -142,17 +334,18 @@ def main():
     s = Simulator()
     manager = s.get_manager()
 
-    minute = manager.get_criterion(u'分')
-    hour = manager.get_criterion(u'時')
+    minute = manager.get_criterion(u'分', None)
+    hour = manager.get_criterion(u'時', None)
     value = 120 * (hour / minute)
     
     Util.dump(manager.unit_dict)
-    print u'kind of unit:', manager.get_unit_id(u'分')
+    print u'kind of unit:', manager.get_unit_id(u'分', None)
     print '%s分' % value
     print '-' * 10
 
     from unit import Unit
-    print manager._trans_original_value(u"10:00 - 17:00", Unit(u'US_Eastern', u'Asia_Tokyo'))
+    unit = Unit(u'US_Eastern', u'Asia_Tokyo')
+    print manager.get_converter(unit.numer, unit)(u"10:00 - 17:00", unit)
 
     return Constants.EXIT_SUCCESS
 
@@ -2,10 +2,15 @@
 # -*- coding: utf-8 -*-
 
 import sys
+from operator import attrgetter, mul, truediv
+from itertools import imap, repeat
+from decimal import Decimal
+from fractions import Fraction
 from unit import Unit
 from util import Util
 from collegue import Collegue
 from constants import Constants
+from source_position import SourcePosition
 
 class UnitXObject(Collegue):
     """ Primary情報（数値，文字列，真偽値，リスト，変数，関数などの情報）を持つクラス．
@@ -14,13 +19,16 @@ class UnitXObject(Collegue):
         ex: 5, "Tasuku", true, [1,2,3], a_var, 5{MB}, 20{kg->g}, 3{N*m}
     """
 
-    is_prepared_unit_table = False # start variable
+    NUMBER_TYPES = frozenset([int, long, float, Decimal])
+    EXACT_FLOAT_LIMIT = 2 ** 53 # Integers below it are exact in a float.
 
-    def __init__(self, value, varname, unit, token=None, is_none=False):
+    def __init__(self, value, varname, unit, pos=None, is_none=False):
         """ UnitXObjectの初期化
             ここでのvalueとは，数値，文字列，変数名を表す．
+            posとは，エラー出力のためのソースコード上の位置（SourcePositionの整数）を表す．
+            トークンを持つと字句解析器と入力全体が解放されないため，トークンは持たない．
         """
-        self.token = token
+        self.pos = pos
         self._value = value
         self.varname = varname
         self.is_none = is_none
@@ -46,63 +54,181 @@ class UnitXObject(Collegue):
             else:
                 if error:
                     msg = Constants.NAME_ERR % self.varname
-                    self.mediator.get_parser().notifyErrorListeners(msg, self.token, Exception(msg))
+                    self.mediator.get_parser().notifyErrorListeners(msg, SourcePosition.to_token(self.pos), Exception(msg))
                 else: return None
         else:
             return self.__trans_all_unit(self._value)
 
+    def get_list_values(self):
+        """ リストの要素の値と，その単位（numer, denom）の集合を，要素ごとのget_valueを使わずに応答する．
+            同じ単位の要素はまとめて一度に変換し，係数は単位ごとに一度だけ求める（ex: 組み込み関数のsum）．
+            リストに単位があれば（ex: [1, 2]{km->m}），__trans_list_unitと同じく，全要素をその単位で変換する．
+            数値でない要素があれば変換しない．リストでなければ(None, None)を応答する．
+        """
+        elements = self._value if self._value is not None else self.get_value()
+        if not isinstance(elements, list) or self.is_none: return None, None
+        values = map(attrgetter('_value'), elements)
+        if not set(map(type, values)) <= UnitXObject.NUMBER_TYPES: return values, set()
+
+        units = map(attrgetter('unit'), elements)
+        empty_key = (None, None, None, None)
+        key_of = dict((a_unit, (a_unit.ex_numer, a_unit.numer, a_unit.ex_denom, a_unit.denom) if a_unit is not None else empty_key)
+                      for a_unit in set(units)) # Elements often share instances of Unit.
+        unit_of = dict((key, a_unit) for a_unit, key in key_of.iteritems())
+        distinct_keys = set(unit_of)
+        if len(distinct_keys) > 1: keys = map(key_of.__getitem__, units)
+        for key in distinct_keys:
+            if key == empty_key: continue
+            a_unit = unit_of[key]
+            if len(distinct_keys) == 1:
+                values = UnitXObject(value=None, varname=None, unit=a_unit).__trans_a_unit(values)
+                break
+            indexes = [i for i, a_key in enumerate(keys) if a_key == key]
+            trans_values = UnitXObject(value=None, varname=None, unit=a_unit).__trans_a_unit([values[i] for i in indexes])
+            for i, trans_value in zip(indexes, trans_values): values[i] = trans_value
+
+        if self.unit and not self.unit.is_empty():
+            return self.__trans_a_unit(values), set([(self.unit.numer, self.unit.denom)])
+        return values, set((numer, denom) for _, numer, _, denom in distinct_keys if numer or denom)
+
+
     def get_unit_value(self):
         return "%s%s" % (self.get_value(), self.unit.formal_str())
 
 
     def __trans_all_unit(self, value):
         if isinstance(value, list):
-            list_values = []
-            for v in value:
-                v.set_value(self.__trans_a_unit(v.get_value()))
-                list_values.append(v)
-            return list_values
+            return self.__trans_list_unit(value)
         else:
             return self.__trans_a_unit(value)
 
 
-    def __trans_a_unit(self, value):
+    def __trans_list_unit(self, unitx_objs):
+        """Returns a list of UnitXObject converted by a unit of this list.
+
+        All values are converted in one pass by a converter of the unit table
+        or by a factor which is computed once, instead of each element.
+        Elements of the list are not changed, and new elements have the current unit.
         """
+        if not self.unit or self.unit.is_empty(): return unitx_objs
+        values = [v.get_value() for v in unitx_objs]
+        trans_values = self.__trans_a_unit(values)
+        return [UnitXObject(value=trans_value, varname=None, unit=Unit(numer=self.unit.numer, denom=self.unit.denom), pos=v.pos, is_none=v.is_none) for v, trans_value in zip(unitx_objs, trans_values)]
+
+
+    def __trans_a_unit(self, value):
+        """Returns a value (or a list of values) converted by a unit.
         """
         if isinstance(value, bool): return value
         if not self.unit or self.unit.is_empty(): return value
         self._check_unit()
 
-        if not UnitXObject.is_prepared_unit_table: 
-            UnitXObject.is_prepared_unit_table = True
-            exec(UnitXObject.manager.get_exec_str_preparing(), globals())
-            
         trans_value = self._trans_by_original_unit(value)
-        if trans_value: return trans_value
-        if isinstance(value, unicode): return value
+        if trans_value is not None: return trans_value
+
+        places = UnitXObject.manager.get_money_places(self.unit.numer)
+        if places is not None and not self.unit.denom:
+            return self.__trans_money(value, places)
+
+        factor = self.__get_factor()
+        if factor is None: return value
+        if isinstance(value, list):
+            return self.__scale_list(value, factor)
+        return self.__scale(value, factor)
 
+
+    def __get_factor(self):
+        """Returns a factor converting from <ex_numer>/<ex_denom> to <numer>/<denom>.
+
+        Returns:
+            A Fraction, or None when the unit has no conversion.
+        """
+        factor = None
         if self.unit.numer and self.unit.ex_numer:
-            value = value * (UnitXObject.manager.get_criterion(self.unit.ex_numer, self.unit) / UnitXObject.manager.get_criterion(self.unit.numer, self.unit))
+            factor = UnitXObject.manager.get_criterion(self.unit.ex_numer, self.unit) / UnitXObject.manager.get_criterion(self.unit.numer, self.unit)
         if self.unit.denom and self.unit.ex_denom:
-            value = value * (UnitXObject.manager.get_criterion(self.unit.denom, self.unit) / UnitXObject.manager.get_criterion(self.unit.ex_denom, self.unit))
+            denom_factor = UnitXObject.manager.get_criterion(self.unit.denom, self.unit) / UnitXObject.manager.get_criterion(self.unit.ex_denom, self.unit)
+            factor = denom_factor if factor is None else factor * denom_factor
+        return factor
 
-        trans_value = float(value)
-        if trans_value.is_integer(): trans_value = int(trans_value)
 
+    def __scale(self, value, factor):
+        """Returns a value multiplied by a factor as an int or a float."""
+        if value is None or isinstance(value, bool) or isinstance(value, unicode):
+            return value
+        trans_value = float(value * factor)
+        if trans_value.is_integer(): trans_value = int(trans_value)
         return trans_value
 
 
-    def _trans_by_original_unit(self, value):
+    def __scale_list(self, values, factor):
+        """ 値のリストを係数で変換して応答する．
+            floatのリストは，__scale()と同じくfloatにした係数を掛ける．
+            intのリストは，係数が整数か整数の逆数で値が2**53未満ならば，一回の乗除算で正確に求まる．
+            どちらも要素ごとの分数の計算なしで，__scale()と同じ値を応答する．
         """
+        types = set(map(type, values))
+        if values and isinstance(factor, (int, long, Fraction)):
+            if types == set([float]):
+                scaled = imap(mul, values, repeat(float(factor)))
+                return [int(v) if v.is_integer() else v for v in scaled]
+            n, d = factor.numerator, factor.denominator
+            limit = max(max(values), -min(values)) if types <= set([int, long]) else None
+            if limit is not None and d == 1 and limit * n < UnitXObject.EXACT_FLOAT_LIMIT:
+                return map(int, imap(mul, values, repeat(n)))
+            if limit is not None and n == 1 and max(limit, d) < UnitXObject.EXACT_FLOAT_LIMIT:
+                scaled = imap(truediv, imap(float, values), repeat(float(d)))
+                return [int(v) if v.is_integer() else v for v in scaled]
+        return [self.__scale(v, factor) for v in values]
+
+
+    def __trans_money(self, value, places):
+        """ 通貨の値（またはリスト）を，通貨ごとの小数桁で丸めたDecimalに変換して応答する．
+            値は整数の分子と分母に分解し，キャッシュされた整数の係数で変換してから丸める．
+            ROUND_HALF_UPと同じく，0.5は0から遠い方へ丸める．
         """
-        unit = self.unit # For eval!
-        unit_id = UnitXObject.manager.get_unit_id(self.unit.numer, self.unit)
-        res = eval(UnitXObject.manager.unit_evals[unit_id])
-        if not isinstance(res, dict):
-            return res
+        if self.unit.ex_numer and self.unit.ex_numer != self.unit.numer:
+            n, d = UnitXObject.manager.get_money_factor(self.unit.ex_numer, self.unit.numer, self.unit)
         else:
-            return None
-            
+            n, d = 10 ** places, 1
+        exponent = 'E%d' % -places
+
+        def to_money(v):
+            if v is None or isinstance(v, bool) or isinstance(v, unicode): return v
+            if isinstance(v, (int, long)):
+                num, den = v * n, d
+            else:
+                a_str = repr(v) if isinstance(v, float) else str(v)
+                int_part, _, frac_part = a_str.partition('.')
+                if 'e' in a_str or 'E' in a_str:
+                    a_fraction = Fraction(Decimal(a_str))
+                    num, den = a_fraction.numerator * n, a_fraction.denominator * d
+                elif isinstance(v, Decimal) and n == 10 ** places and d == 1 and len(frac_part) == places:
+                    return v # Already rounded
+                else:
+                    num, den = int(int_part + frac_part) * n, 10 ** len(frac_part) * d
+            minor = (2 * abs(num) + den) // (2 * den)
+            return Decimal('%s%d%s' % ('-' if num < 0 else '', minor, exponent))
+
+        if isinstance(value, list):
+            return [to_money(v) for v in value]
+        return to_money(value)
+
+
+    def _trans_by_original_unit(self, value):
+        """Returns a value converted by a converter bound to a group of the unit.
+
+        Returns:
+            A converted value, or None when the group is a group of criterions.
+        """
+        converter = UnitXObject.manager.get_converter(self.unit.numer, self.unit)
+        if not converter: return None
+        try:
+            return converter(value, self.unit)
+        except ValueError as e:
+            msg = e.args[0]
+            self.mediator.get_parser().notifyErrorListeners(msg, SourcePosition.to_token(self.unit.pos), Exception(msg))
+            return value
 
 
     def _check_unit(self):
@@ -115,12 +241,20 @@ class UnitXObject(Collegue):
         if self.unit.numer and self.unit.ex_numer:
             if UnitXObject.manager.get_unit_id(self.unit.numer, self.unit) != UnitXObject.manager.get_unit_id(self.unit.ex_numer, self.unit):
                 msg = Constants.TYPE_ERR % (self.unit.ex_numer, self.unit.numer)
-                self.mediator.get_parser().notifyErrorListeners(msg, self.unit.token, Exception(msg))
+                self.mediator.get_parser().notifyErrorListeners(msg, SourcePosition.to_token(self.unit.pos), Exception(msg))
 
         if self.unit.denom and self.unit.ex_denom:
             if UnitXObject.manager.get_unit_id(self.unit.denom, self.unit) != UnitXObject.manager.get_unit_id(self.unit.ex_denom, self.unit):
                 msg = Constants.TYPE_ERR % (self.unit.ex_denom, self.unit.denom)
-                self.mediator.get_parser().notifyErrorListeners(msg, self.unit.token, Exception(msg))
+                self.mediator.get_parser().notifyErrorListeners(msg, SourcePosition.to_token(self.unit.pos), Exception(msg))
+
+
+    def copy(self):
+        """ 値，単位，位置をコピーした新しいUnitXObjectを応答する．
+            値は単位で変換する前の値のままコピーする．
+        """
+        unit = None if self.unit is None else Unit(self.unit.ex_numer, self.unit.numer, self.unit.ex_denom, self.unit.denom, self.unit.pos)
+        return UnitXObject(value=self._value, varname=self.varname, unit=unit, pos=self.pos, is_none=self.is_none)
 
 
     def set_value(self, value):
@@ -166,6 +300,8 @@ class UnitXObject(Collegue):
             return 'int'
         elif isinstance(value, float):
             return 'float'
+        elif isinstance(value, Decimal):
+            return 'decimal'
 
 
     def check_unitx_objects(self, unitx_objs, opp_token):
@@ -173,10 +309,8 @@ class UnitXObject(Collegue):
         """
         left_obj,right_obj = unitx_objs
         lvalue, rvalue = left_obj.get_value(), right_obj.get_value()
-        if isinstance(lvalue, int) and isinstance(rvalue, int): return
-        if isinstance(lvalue, int) and isinstance(rvalue, float): return
-        if isinstance(lvalue, float) and isinstance(rvalue, int): return
-        if isinstance(lvalue, float) and isinstance(rvalue, float): return
+        numbers = (int, float, Decimal)
+        if isinstance(lvalue, numbers) and isinstance(rvalue, numbers): return
 
         if type(left_obj.get_value()) is not type(right_obj.get_value()) or \
             left_obj.is_none or right_obj.is_none:
@@ -192,11 +326,22 @@ class UnitXObject(Collegue):
             self.mediator.get_parser().notifyErrorListeners(msg, opp_token, Exception(msg))
 
 
+    def __get_numbers(self, unitx_obj):
+        """ 左辺と右辺の値を応答する．
+            片方がDecimal（マネーモードの通貨）の場合，もう片方のfloatもDecimalにそろえる．
+        """
+        lvalue, rvalue = self.get_value(), unitx_obj.get_value()
+        if isinstance(lvalue, Decimal) and isinstance(rvalue, float): rvalue = Decimal(repr(rvalue))
+        elif isinstance(lvalue, float) and isinstance(rvalue, Decimal): lvalue = Decimal(repr(lvalue))
+        return lvalue, rvalue
+
+
     def add(self, unitx_obj, opp_token):
         """ 左辺と右辺を足した後，結果を応答する．
         """
         self.check_unitx_objects([self, unitx_obj], opp_token)
-        a_value = (self.get_value() + unitx_obj.get_value())
+        lvalue, rvalue = self.__get_numbers(unitx_obj)
+        a_value = (lvalue + rvalue)
         a_unit = self.unit.add(unitx_obj.unit, opp_token)
 
         return UnitXObject(value = a_value, varname=None, unit=a_unit)
@@ -206,7 +351,8 @@ class UnitXObject(Collegue):
         """ 左辺から右辺を引いた後，結果を応答する．
         """
         self.check_unitx_objects([self, unitx_obj], opp_token)
-        a_value = (self.get_value() - unitx_obj.get_value())
+        lvalue, rvalue = self.__get_numbers(unitx_obj)
+        a_value = (lvalue - rvalue)
         a_unit = self.unit.subtract(unitx_obj.unit, opp_token)
 
         return UnitXObject(value = a_value, varname=None, unit=a_unit)
@@ -216,7 +362,8 @@ class UnitXObject(Collegue):
         """ 左辺と右辺を掛けた後，結果を応答する．
         """
         self.check_unitx_objects([self, unitx_obj], opp_token)
-        a_value = (self.get_value() * unitx_obj.get_value())
+        lvalue, rvalue = self.__get_numbers(unitx_obj)
+        a_value = (lvalue * rvalue)
         a_unit = self.unit.multiply(unitx_obj.unit, opp_token)
 
         return UnitXObject(value = a_value, varname=None, unit=a_unit)
@@ -226,7 +373,8 @@ class UnitXObject(Collegue):
         """ 左辺から右辺を割った後，結果を応答する．
         """
         self.check_unitx_objects([self, unitx_obj], opp_token)
-        a_value = (self.get_value() / unitx_obj.get_value())
+        lvalue, rvalue = self.__get_numbers(unitx_obj)
+        a_value = (lvalue / rvalue)
         a_unit = self.unit.divide(unitx_obj.unit, opp_token)
 
         return UnitXObject(value = a_value, varname=None, unit=a_unit)
@@ -236,7 +384,8 @@ class UnitXObject(Collegue):
         """ 左辺から右辺をモジュロ演算した後，結果を応答する．
         """
         self.check_unitx_objects([self, unitx_obj], opp_token)
-        a_value = (self.get_value() % unitx_obj.get_value())
+        lvalue, rvalue = self.__get_numbers(unitx_obj)
+        a_value = (lvalue % rvalue)
         a_unit = self.unit.modulo(unitx_obj.unit, opp_token)
 
         return UnitXObject(value = a_value, varname=None, unit=a_unit)
@@ -259,11 +408,18 @@ class UnitXObject(Collegue):
             スコープに値を入れる唯一の関数．
             ただし，tokenは代入しない．
         """
+        self.bind(unitx_obj)
+        UnitXObject.scopes.regist_unitx_obj(self.varname, self)
+        return self
+
+    def bind(self, unitx_obj):
+        """ 変数xに値yを束縛して，結果を応答する．
+            assignと異なり，スコープには登録しない（関数のFrameが引数を配置するため）．
+        """
         self.set_value(unitx_obj.get_value())
         self.unit = unitx_obj.unit
         self.unit.remove_ex()
         self.is_none = unitx_obj.is_none
-        UnitXObject.scopes.regist_unitx_obj(self.varname, self)
         return self
 
     def add_assign(self, unitx_obj, opp_token):
@@ -329,6 +485,10 @@ def main():
     print tmp_obj
     print crr_scope['x'] == tmp_obj
 
+    # Values of a list at once
+    a_list = UnitXObject(value=[crr_scope['x'], UnitXObject(value=30, varname=None, unit=Unit(numer=u'cm'))], varname=None, unit=Unit())
+    print a_list.get_list_values()
+
     # Clear part
     s.get_scopes().del_scope()
     s.get_scopes().del_scope()